@@ -1,3498 +1,4 @@
-# Recipes
-RECIPES = [
-    {
-        "name": "Classic Beef Burger",
-        "ingredients": [
-            "ground beef",
-            "hamburger buns",
-            "lettuce",
-            "tomato",
-            "onion",
-            "cheese",
-            "ketchup",
-            "mustard",
-        ],
-        "cuisine": "American",
-        "diet_tags": [
-            "non-vegan",
-            "high-protein",
-            "gluten-containing",
-            "dairy",
-            "high-calorie",
-        ],
-        "cook_time": 20,
-        "nutrition": {"calories": 550, "protein": 30, "carbs": 35, "fat": 30},
-        "cost_rating": 2,
-        "meal_prep_friendly": True,
-        "health_score": 5,
-        "equipment_needed": ["grill", "mixing bowl", "spatula"],
-        "freezer_friendly": False,
-        "servings": 4,
-    },
-    {
-        "name": "Ratatouille",
-        "ingredients": [
-            "eggplant",
-            "zucchini",
-            "bell peppers",
-            "tomatoes",
-            "onion",
-            "garlic",
-            "olive oil",
-            "herbs de provence",
-        ],
-        "cuisine": "French",
-        "diet_tags": [
-            "vegan",
-            "vegetarian",
-            "gluten-free",
-            "low-calorie",
-            "high-fiber",
-        ],
-        "cook_time": 45,
-        "nutrition": {"calories": 180, "protein": 4, "carbs": 20, "fat": 10},
-        "cost_rating": 2,
-        "meal_prep_friendly": True,
-        "health_score": 8,
-        "equipment_needed": ["oven", "baking dish", "knife"],
-        "freezer_friendly": True,
-        "servings": 6,
-    },
-    {
-        "name": "Spaghetti Carbonara",
-        "ingredients": [
-            "spaghetti",
-            "eggs",
-            "pancetta",
-            "parmesan cheese",
-            "black pepper",
-            "garlic",
-        ],
-        "cuisine": "Italian",
-        "diet_tags": [
-            "non-vegan",
-            "high-protein",
-            "gluten-containing",
-            "dairy",
-            "high-calorie",
-        ],
-        "cook_time": 25,
-        "nutrition": {"calories": 650, "protein": 25, "carbs": 75, "fat": 25},
-        "cost_rating": 3,
-        "meal_prep_friendly": False,
-        "health_score": 6,
-        "equipment_needed": ["pot", "pan", "whisk"],
-        "freezer_friendly": False,
-        "servings": 4,
-    },
-    {
-        "name": "Hummus",
-        "ingredients": [
-            "chickpeas",
-            "tahini",
-            "lemon juice",
-            "garlic",
-            "olive oil",
-            "cumin",
-        ],
-        "cuisine": "Middle eastern",
-        "diet_tags": [
-            "vegan",
-            "vegetarian",
-            "gluten-free",
-            "high-protein",
-            "high-fiber",
-        ],
-        "cook_time": 10,
-        "nutrition": {"calories": 160, "protein": 5, "carbs": 15, "fat": 9},
-        "cost_rating": 1,
-        "meal_prep_friendly": True,
-        "health_score": 8,
-        "equipment_needed": ["food processor", "spatula"],
-        "freezer_friendly": True,
-        "servings": 8,
-    },
-    {
-        "name": "Chicken Pot Pie",
-        "ingredients": [
-            "chicken breast",
-            "carrots",
-            "peas",
-            "celery",
-            "onion",
-            "butter",
-            "flour",
-            "milk",
-            "pie crust",
-        ],
-        "cuisine": "American",
-        "diet_tags": [
-            "non-vegan",
-            "high-protein",
-            "gluten-containing",
-            "dairy",
-            "high-calorie",
-        ],
-        "cook_time": 60,
-        "nutrition": {"calories": 520, "protein": 25, "carbs": 45, "fat": 28},
-        "cost_rating": 2,
-        "meal_prep_friendly": True,
-        "health_score": 6,
-        "equipment_needed": ["oven", "pie dish", "saucepan"],
-        "freezer_friendly": True,
-        "servings": 6,
-    },
-    {
-        "name": "Croque Monsieur",
-        "ingredients": [
-            "bread",
-            "ham",
-            "gruyere cheese",
-            "butter",
-            "milk",
-            "flour",
-            "nutmeg",
-        ],
-        "cuisine": "French",
-        "diet_tags": [
-            "non-vegan",
-            "high-protein",
-            "gluten-containing",
-            "dairy",
-            "high-calorie",
-        ],
-        "cook_time": 20,
-        "nutrition": {"calories": 450, "protein": 20, "carbs": 30, "fat": 25},
-        "cost_rating": 3,
-        "meal_prep_friendly": False,
-        "health_score": 5,
-        "equipment_needed": ["oven", "saucepan", "whisk"],
-        "freezer_friendly": False,
-        "servings": 2,
-    },
-    {
-        "name": "Margherita Pizza",
-        "ingredients": [
-            "pizza dough",
-            "tomato sauce",
-            "fresh mozzarella",
-            "basil",
-            "olive oil",
-        ],
-        "cuisine": "Italian",
-        "diet_tags": [
-            "vegetarian",
-            "gluten-containing",
-            "dairy",
-            "high-calorie",
-            "high-carb",
-        ],
-        "cook_time": 15,
-        "nutrition": {"calories": 800, "protein": 30, "carbs": 100, "fat": 30},
-        "cost_rating": 2,
-        "meal_prep_friendly": False,
-        "health_score": 6,
-        "equipment_needed": ["oven", "pizza stone", "rolling pin"],
-        "freezer_friendly": True,
-        "servings": 4,
-    },
-    {
-        "name": "Falafel",
-        "ingredients": [
-            "chickpeas",
-            "onion",
-            "garlic",
-            "parsley",
-            "cumin",
-            "coriander",
-            "flour",
-            "baking powder",
-        ],
-        "cuisine": "Middle eastern",
-        "diet_tags": [
-            "vegetarian",
-            "vegan-option",
-            "gluten-free-option",
-            "high-protein",
-            "high-fiber",
-        ],
-        "cook_time": 30,
-        "nutrition": {"calories": 350, "protein": 15, "carbs": 45, "fat": 12},
-        "cost_rating": 1,
-        "meal_prep_friendly": True,
-        "health_score": 8,
-        "equipment_needed": ["food processor", "skillet"],
-        "freezer_friendly": True,
-        "servings": 6,
-    },
-    {
-        "name": "New York Cheesecake",
-        "ingredients": [
-            "cream cheese",
-            "sugar",
-            "eggs",
-            "sour cream",
-            "vanilla extract",
-            "graham crackers",
-            "butter",
-        ],
-        "cuisine": "American",
-        "diet_tags": [
-            "non-vegan",
-            "vegetarian",
-            "gluten-containing",
-            "dairy",
-            "high-sugar",
-        ],
-        "cook_time": 90,
-        "nutrition": {"calories": 450, "protein": 8, "carbs": 40, "fat": 30},
-        "cost_rating": 3,
-        "meal_prep_friendly": True,
-        "health_score": 3,
-        "equipment_needed": ["springform pan", "mixer", "oven"],
-        "freezer_friendly": True,
-        "servings": 8,
-    },
-    {
-        "name": "Bouillabaisse",
-        "ingredients": [
-            "fish fillets",
-            "shrimp",
-            "mussels",
-            "fennel",
-            "tomatoes",
-            "saffron",
-            "garlic",
-            "white wine",
-        ],
-        "cuisine": "French",
-        "diet_tags": [
-            "non-vegan",
-            "pescatarian",
-            "gluten-free",
-            "high-protein",
-            "low-carb",
-        ],
-        "cook_time": 45,
-        "nutrition": {"calories": 350, "protein": 40, "carbs": 15, "fat": 12},
-        "cost_rating": 4,
-        "meal_prep_friendly": False,
-        "health_score": 8,
-        "equipment_needed": ["large pot", "ladle"],
-        "freezer_friendly": False,
-        "servings": 6,
-    },
-    {
-        "name": "Tabbouleh",
-        "ingredients": [
-            "bulgur wheat",
-            "parsley",
-            "mint",
-            "tomatoes",
-            "cucumber",
-            "lemon juice",
-            "olive oil",
-        ],
-        "cuisine": "Middle eastern",
-        "diet_tags": [
-            "vegan",
-            "vegetarian",
-            "gluten-free-option",
-            "low-fat",
-            "high-fiber",
-        ],
-        "cook_time": 25,
-        "nutrition": {"calories": 180, "protein": 5, "carbs": 25, "fat": 7},
-        "cost_rating": 1,
-        "meal_prep_friendly": True,
-        "health_score": 9,
-        "equipment_needed": ["mixing bowl", "knife"],
-        "freezer_friendly": False,
-        "servings": 6,
-    },
-    {
-        "name": "Beef Bourguignon",
-        "ingredients": [
-            "beef chuck",
-            "red wine",
-            "mushrooms",
-            "pearl onions",
-            "carrots",
-            "bacon",
-            "beef stock",
-        ],
-        "cuisine": "French",
-        "diet_tags": [
-            "non-vegan",
-            "high-protein",
-            "gluten-free",
-            "high-calorie",
-            "low-carb",
-        ],
-        "cook_time": 180,
-        "nutrition": {"calories": 450, "protein": 35, "carbs": 15, "fat": 25},
-        "cost_rating": 4,
-        "meal_prep_friendly": True,
-        "health_score": 7,
-        "equipment_needed": ["dutch oven", "knife"],
-        "freezer_friendly": True,
-        "servings": 6,
-    },
-    {
-        "name": "Chicken Parmesan",
-        "ingredients": [
-            "chicken breast",
-            "breadcrumbs",
-            "parmesan",
-            "mozzarella",
-            "marinara sauce",
-            "egg",
-            "flour",
-        ],
-        "cuisine": "Italian",
-        "diet_tags": [
-            "non-vegan",
-            "high-protein",
-            "gluten-containing",
-            "dairy",
-            "high-calorie",
-        ],
-        "cook_time": 40,
-        "nutrition": {"calories": 550, "protein": 45, "carbs": 30, "fat": 28},
-        "cost_rating": 3,
-        "meal_prep_friendly": True,
-        "health_score": 6,
-        "equipment_needed": ["oven", "skillet", "meat mallet"],
-        "freezer_friendly": True,
-        "servings": 4,
-    },
-    {
-        "name": "Avocado Toast",
-        "ingredients": [
-            "bread",
-            "avocado",
-            "lemon juice",
-            "red pepper flakes",
-            "salt",
-            "pepper",
-            "eggs",
-        ],
-        "cuisine": "American",
-        "diet_tags": [
-            "vegetarian",
-            "gluten-free-option",
-            "high-fiber",
-            "high-protein-option",
-            "quick-meal",
-        ],
-        "cook_time": 10,
-        "nutrition": {"calories": 320, "protein": 12, "carbs": 30, "fat": 18},
-        "cost_rating": 2,
-        "meal_prep_friendly": False,
-        "health_score": 8,
-        "equipment_needed": ["toaster", "mixing bowl"],
-        "freezer_friendly": False,
-        "servings": 2,
-    },
-    {
-        "name": "Baklava",
-        "ingredients": [
-            "phyllo dough",
-            "walnuts",
-            "honey",
-            "butter",
-            "cinnamon",
-            "sugar",
-        ],
-        "cuisine": "Middle eastern",
-        "diet_tags": [
-            "vegetarian",
-            "gluten-containing",
-            "high-sugar",
-            "nut-containing",
-            "high-calorie",
-        ],
-        "cook_time": 60,
-        "nutrition": {"calories": 330, "protein": 5, "carbs": 35, "fat": 20},
-        "cost_rating": 3,
-        "meal_prep_friendly": True,
-        "health_score": 4,
-        "equipment_needed": ["baking dish", "brush"],
-        "freezer_friendly": True,
-        "servings": 12,
-    },
-    {
-        "name": "French Onion Soup",
-        "ingredients": [
-            "onions",
-            "beef stock",
-            "butter",
-            "baguette",
-            "gruyere cheese",
-            "thyme",
-        ],
-        "cuisine": "French",
-        "diet_tags": [
-            "vegetarian-option",
-            "gluten-containing",
-            "dairy",
-            "high-sodium",
-            "comfort-food",
-        ],
-        "cook_time": 65,
-        "nutrition": {"calories": 350, "protein": 15, "carbs": 35, "fat": 18},
-        "cost_rating": 2,
-        "meal_prep_friendly": True,
-        "health_score": 6,
-        "equipment_needed": ["soup pot", "oven-safe bowls"],
-        "freezer_friendly": True,
-        "servings": 6,
-    },
-    {
-        "name": "Lobster Roll",
-        "ingredients": [
-            "lobster meat",
-            "mayonnaise",
-            "lemon juice",
-            "celery",
-            "butter",
-            "hot dog buns",
-        ],
-        "cuisine": "American",
-        "diet_tags": [
-            "non-vegan",
-            "pescatarian",
-            "gluten-containing",
-            "high-protein",
-            "high-calorie",
-        ],
-        "cook_time": 20,
-        "nutrition": {"calories": 480, "protein": 25, "carbs": 35, "fat": 28},
-        "cost_rating": 5,
-        "meal_prep_friendly": False,
-        "health_score": 5,
-        "equipment_needed": ["mixing bowl", "skillet"],
-        "freezer_friendly": False,
-        "servings": 4,
-    },
-    {
-        "name": "Pasta Primavera",
-        "ingredients": [
-            "pasta",
-            "zucchini",
-            "bell peppers",
-            "broccoli",
-            "carrots",
-            "garlic",
-            "olive oil",
-            "parmesan",
-        ],
-        "cuisine": "Italian",
-        "diet_tags": [
-            "vegetarian",
-            "gluten-free-option",
-            "high-fiber",
-            "quick-meal",
-            "dairy-option",
-        ],
-        "cook_time": 25,
-        "nutrition": {"calories": 400, "protein": 15, "carbs": 60, "fat": 12},
-        "cost_rating": 2,
-        "meal_prep_friendly": True,
-        "health_score": 8,
-        "equipment_needed": ["pot", "skillet"],
-        "freezer_friendly": False,
-        "servings": 4,
-    },
-    {
-        "name": "Shakshuka",
-        "ingredients": [
-            "eggs",
-            "tomatoes",
-            "bell peppers",
-            "onion",
-            "garlic",
-            "paprika",
-            "cumin",
-            "feta cheese",
-        ],
-        "cuisine": "Middle eastern",
-        "diet_tags": [
-            "vegetarian",
-            "gluten-free",
-            "high-protein",
-            "low-carb",
-            "dairy-option",
-        ],
-        "cook_time": 30,
-        "nutrition": {"calories": 280, "protein": 15, "carbs": 15, "fat": 18},
-        "cost_rating": 1,
-        "meal_prep_friendly": False,
-        "health_score": 8,
-        "equipment_needed": ["skillet", "lid"],
-        "freezer_friendly": False,
-        "servings": 4,
-    },
-    {
-        "name": "Croissant",
-        "ingredients": ["flour", "butter", "milk", "sugar", "yeast", "salt", "egg"],
-        "cuisine": "French",
-        "diet_tags": ["vegetarian", "gluten-containing", "dairy", "high-fat", "baked"],
-        "cook_time": 120,
-        "nutrition": {"calories": 230, "protein": 5, "carbs": 25, "fat": 12},
-        "cost_rating": 2,
-        "meal_prep_friendly": True,
-        "health_score": 4,
-        "equipment_needed": ["oven", "rolling pin"],
-        "freezer_friendly": True,
-        "servings": 8,
-    },
-    {
-        "name": "Buffalo Wings",
-        "ingredients": [
-            "chicken wings",
-            "hot sauce",
-            "butter",
-            "vinegar",
-            "celery",
-            "blue cheese dressing",
-        ],
-        "cuisine": "American",
-        "diet_tags": [
-            "non-vegan",
-            "high-protein",
-            "gluten-free",
-            "high-fat",
-            "low-carb",
-        ],
-        "cook_time": 45,
-        "nutrition": {"calories": 420, "protein": 30, "carbs": 5, "fat": 32},
-        "cost_rating": 2,
-        "meal_prep_friendly": True,
-        "health_score": 5,
-        "equipment_needed": ["oven", "baking sheet", "mixing bowl"],
-        "freezer_friendly": True,
-        "servings": 4,
-    },
-    {
-        "name": "Risotto alla Milanese",
-        "ingredients": [
-            "arborio rice",
-            "saffron",
-            "white wine",
-            "chicken stock",
-            "parmesan",
-            "onion",
-            "butter",
-        ],
-        "cuisine": "Italian",
-        "diet_tags": [
-            "vegetarian",
-            "gluten-free",
-            "dairy",
-            "high-carb",
-            "comfort-food",
-        ],
-        "cook_time": 35,
-        "nutrition": {"calories": 380, "protein": 10, "carbs": 55, "fat": 12},
-        "cost_rating": 4,
-        "meal_prep_friendly": False,
-        "health_score": 6,
-        "equipment_needed": ["saucepan", "wooden spoon"],
-        "freezer_friendly": False,
-        "servings": 4,
-    },
-    {
-        "name": "Fattoush Salad",
-        "ingredients": [
-            "romaine lettuce",
-            "cucumber",
-            "tomatoes",
-            "radish",
-            "pita bread",
-            "sumac",
-            "lemon dressing",
-        ],
-        "cuisine": "Middle eastern",
-        "diet_tags": [
-            "vegetarian",
-            "vegan-option",
-            "gluten-free-option",
-            "low-calorie",
-            "high-fiber",
-        ],
-        "cook_time": 15,
-        "nutrition": {"calories": 180, "protein": 5, "carbs": 20, "fat": 9},
-        "cost_rating": 1,
-        "meal_prep_friendly": True,
-        "health_score": 9,
-        "equipment_needed": ["mixing bowl", "knife"],
-        "freezer_friendly": False,
-        "servings": 6,
-    },
-    {
-        "name": "Quiche Lorraine",
-        "ingredients": [
-            "pie crust",
-            "eggs",
-            "heavy cream",
-            "bacon",
-            "gruyere cheese",
-            "onion",
-        ],
-        "cuisine": "French",
-        "diet_tags": [
-            "non-vegan",
-            "high-protein",
-            "gluten-containing",
-            "dairy",
-            "high-calorie",
-        ],
-        "cook_time": 50,
-        "nutrition": {"calories": 450, "protein": 18, "carbs": 25, "fat": 32},
-        "cost_rating": 3,
-        "meal_prep_friendly": True,
-        "health_score": 5,
-        "equipment_needed": ["pie dish", "oven", "mixing bowl"],
-        "freezer_friendly": True,
-        "servings": 6,
-    },
-    {
-        "name": "Philly Cheesesteak",
-        "ingredients": [
-            "ribeye steak",
-            "amoroso rolls",
-            "provolone cheese",
-            "onions",
-            "bell peppers",
-            "mushrooms",
-        ],
-        "cuisine": "American",
-        "diet_tags": [
-            "non-vegan",
-            "high-protein",
-            "gluten-containing",
-            "dairy",
-            "high-calorie",
-        ],
-        "cook_time": 25,
-        "nutrition": {"calories": 650, "protein": 40, "carbs": 45, "fat": 35},
-        "cost_rating": 3,
-        "meal_prep_friendly": False,
-        "health_score": 5,
-        "equipment_needed": ["grill", "spatula"],
-        "freezer_friendly": False,
-        "servings": 4,
-    },
-    {
-        "name": "Osso Buco",
-        "ingredients": [
-            "veal shanks",
-            "white wine",
-            "carrots",
-            "celery",
-            "onion",
-            "tomato paste",
-            "beef stock",
-        ],
-        "cuisine": "Italian",
-        "diet_tags": [
-            "non-vegan",
-            "high-protein",
-            "gluten-free",
-            "low-carb",
-            "high-iron",
-        ],
-        "cook_time": 150,
-        "nutrition": {"calories": 420, "protein": 45, "carbs": 10, "fat": 22},
-        "cost_rating": 5,
-        "meal_prep_friendly": True,
-        "health_score": 7,
-        "equipment_needed": ["dutch oven", "knife"],
-        "freezer_friendly": True,
-        "servings": 4,
-    },
-    {
-        "name": "Moussaka",
-        "ingredients": [
-            "eggplant",
-            "ground lamb",
-            "tomatoes",
-            "onion",
-            "potatoes",
-            "béchamel sauce",
-            "parmesan",
-        ],
-        "cuisine": "Middle eastern",
-        "diet_tags": [
-            "non-vegan",
-            "high-protein",
-            "gluten-containing",
-            "dairy",
-            "high-calorie",
-        ],
-        "cook_time": 90,
-        "nutrition": {"calories": 480, "protein": 25, "carbs": 35, "fat": 28},
-        "cost_rating": 3,
-        "meal_prep_friendly": True,
-        "health_score": 6,
-        "equipment_needed": ["baking dish", "skillet"],
-        "freezer_friendly": True,
-        "servings": 8,
-    },
-    {
-        "name": "Crème Brûlée",
-        "ingredients": [
-            "heavy cream",
-            "egg yolks",
-            "sugar",
-            "vanilla bean",
-            "fresh berries",
-        ],
-        "cuisine": "French",
-        "diet_tags": ["vegetarian", "gluten-free", "dairy", "high-sugar", "high-fat"],
-        "cook_time": 60,
-        "nutrition": {"calories": 320, "protein": 5, "carbs": 25, "fat": 22},
-        "cost_rating": 4,
-        "meal_prep_friendly": True,
-        "health_score": 3,
-        "equipment_needed": ["ramekins", "torch", "mixing bowl"],
-        "freezer_friendly": False,
-        "servings": 6,
-    },
-    {
-        "name": "Cobb Salad",
-        "ingredients": [
-            "lettuce",
-            "chicken breast",
-            "bacon",
-            "avocado",
-            "tomatoes",
-            "blue cheese",
-            "hard-boiled eggs",
-        ],
-        "cuisine": "American",
-        "diet_tags": [
-            "non-vegan",
-            "high-protein",
-            "gluten-free",
-            "low-carb",
-            "keto-friendly",
-        ],
-        "cook_time": 25,
-        "nutrition": {"calories": 450, "protein": 35, "carbs": 12, "fat": 30},
-        "cost_rating": 3,
-        "meal_prep_friendly": True,
-        "health_score": 7,
-        "equipment_needed": ["knife", "mixing bowl"],
-        "freezer_friendly": False,
-        "servings": 4,
-    },
-    {
-        "name": "Panna Cotta",
-        "ingredients": ["heavy cream", "sugar", "gelatin", "vanilla", "berry coulis"],
-        "cuisine": "Italian",
-        "diet_tags": [
-            "vegetarian",
-            "gluten-free",
-            "dairy",
-            "high-sugar",
-            "low-protein",
-        ],
-        "cook_time": 30,
-        "nutrition": {"calories": 280, "protein": 3, "carbs": 20, "fat": 22},
-        "cost_rating": 3,
-        "meal_prep_friendly": True,
-        "health_score": 4,
-        "equipment_needed": ["ramekins", "saucepan"],
-        "freezer_friendly": False,
-        "servings": 6,
-    },
-    {
-        "name": "Mansaf",
-        "ingredients": [
-            "lamb",
-            "jameed (dried yogurt)",
-            "rice",
-            "almonds",
-            "pita bread",
-        ],
-        "cuisine": "Middle eastern",
-        "diet_tags": [
-            "non-vegan",
-            "high-protein",
-            "gluten-containing",
-            "dairy",
-            "high-calorie",
-        ],
-        "cook_time": 120,
-        "nutrition": {"calories": 600, "protein": 40, "carbs": 50, "fat": 28},
-        "cost_rating": 4,
-        "meal_prep_friendly": True,
-        "health_score": 6,
-        "equipment_needed": ["large pot", "serving platter"],
-        "freezer_friendly": True,
-        "servings": 8,
-    },
-    {
-        "name": "Reuben Sandwich",
-        "ingredients": [
-            "rye bread",
-            "corned beef",
-            "sauerkraut",
-            "swiss cheese",
-            "russian dressing",
-            "butter",
-        ],
-        "cuisine": "American",
-        "diet_tags": [
-            "non-vegan",
-            "high-protein",
-            "gluten-containing",
-            "dairy",
-            "high-sodium",
-        ],
-        "cook_time": 15,
-        "nutrition": {"calories": 650, "protein": 35, "carbs": 45, "fat": 35},
-        "cost_rating": 3,
-        "meal_prep_friendly": False,
-        "health_score": 5,
-        "equipment_needed": ["skillet", "spatula"],
-        "freezer_friendly": False,
-        "servings": 2,
-    },
-    {
-        "name": "Niçoise Salad",
-        "ingredients": [
-            "tuna steak",
-            "green beans",
-            "potatoes",
-            "olives",
-            "eggs",
-            "tomatoes",
-            "lettuce",
-            "vinaigrette",
-        ],
-        "cuisine": "French",
-        "diet_tags": [
-            "pescatarian",
-            "gluten-free",
-            "high-protein",
-            "low-carb",
-            "high-omega-3",
-        ],
-        "cook_time": 30,
-        "nutrition": {"calories": 380, "protein": 30, "carbs": 20, "fat": 22},
-        "cost_rating": 3,
-        "meal_prep_friendly": True,
-        "health_score": 8,
-        "equipment_needed": ["pot", "skillet", "mixing bowl"],
-        "freezer_friendly": False,
-        "servings": 4,
-    },
-    {
-        "name": "Arancini",
-        "ingredients": [
-            "risotto",
-            "mozzarella",
-            "breadcrumbs",
-            "egg",
-            "flour",
-            "marinara sauce",
-        ],
-        "cuisine": "Italian",
-        "diet_tags": [
-            "vegetarian",
-            "gluten-containing",
-            "dairy",
-            "fried",
-            "high-calorie",
-        ],
-        "cook_time": 40,
-        "nutrition": {"calories": 320, "protein": 12, "carbs": 45, "fat": 10},
-        "cost_rating": 2,
-        "meal_prep_friendly": True,
-        "health_score": 5,
-        "equipment_needed": ["deep fryer", "mixing bowl"],
-        "freezer_friendly": True,
-        "servings": 6,
-    },
-    {
-        "name": "Knafeh",
-        "ingredients": [
-            "kataifi dough",
-            "akawi cheese",
-            "sugar syrup",
-            "pistachios",
-            "rose water",
-        ],
-        "cuisine": "Middle eastern",
-        "diet_tags": [
-            "vegetarian",
-            "gluten-containing",
-            "dairy",
-            "high-sugar",
-            "nut-containing",
-        ],
-        "cook_time": 45,
-        "nutrition": {"calories": 420, "protein": 8, "carbs": 60, "fat": 18},
-        "cost_rating": 3,
-        "meal_prep_friendly": True,
-        "health_score": 4,
-        "equipment_needed": ["baking dish", "saucepan"],
-        "freezer_friendly": True,
-        "servings": 8,
-    },
-    {
-        "name": "Jambalaya",
-        "ingredients": [
-            "chicken",
-            "andouille sausage",
-            "shrimp",
-            "rice",
-            "bell peppers",
-            "onion",
-            "celery",
-            "cajun spices",
-        ],
-        "cuisine": "American",
-        "diet_tags": [
-            "non-vegan",
-            "high-protein",
-            "gluten-free",
-            "one-pot-meal",
-            "high-calorie",
-        ],
-        "cook_time": 50,
-        "nutrition": {"calories": 480, "protein": 35, "carbs": 45, "fat": 18},
-        "cost_rating": 3,
-        "meal_prep_friendly": True,
-        "health_score": 7,
-        "equipment_needed": ["dutch oven", "wooden spoon"],
-        "freezer_friendly": True,
-        "servings": 8,
-    },
-    {
-        "name": "Duck à l'Orange",
-        "ingredients": [
-            "duck breast",
-            "orange juice",
-            "grand marnier",
-            "chicken stock",
-            "butter",
-            "orange zest",
-        ],
-        "cuisine": "French",
-        "diet_tags": [
-            "non-vegan",
-            "high-protein",
-            "gluten-free",
-            "low-carb",
-            "gourmet",
-        ],
-        "cook_time": 60,
-        "nutrition": {"calories": 380, "protein": 30, "carbs": 10, "fat": 25},
-        "cost_rating": 5,
-        "meal_prep_friendly": False,
-        "health_score": 7,
-        "equipment_needed": ["skillet", "saucepan"],
-        "freezer_friendly": False,
-        "servings": 4,
-    },
-    {
-        "name": "Minestrone Soup",
-        "ingredients": [
-            "vegetable stock",
-            "cannellini beans",
-            "pasta",
-            "zucchini",
-            "carrots",
-            "tomatoes",
-            "onion",
-            "parmesan",
-        ],
-        "cuisine": "Italian",
-        "diet_tags": [
-            "vegetarian",
-            "gluten-free-option",
-            "high-fiber",
-            "low-fat",
-            "one-pot-meal",
-        ],
-        "cook_time": 45,
-        "nutrition": {"calories": 220, "protein": 10, "carbs": 35, "fat": 5},
-        "cost_rating": 1,
-        "meal_prep_friendly": True,
-        "health_score": 9,
-        "equipment_needed": ["soup pot", "ladle"],
-        "freezer_friendly": True,
-        "servings": 8,
-    },
-    {
-        "name": "Mujadara",
-        "ingredients": ["lentils", "rice", "onions", "cumin", "olive oil", "yogurt"],
-        "cuisine": "Middle eastern",
-        "diet_tags": [
-            "vegetarian",
-            "vegan-option",
-            "gluten-free",
-            "high-protein",
-            "high-fiber",
-        ],
-        "cook_time": 40,
-        "nutrition": {"calories": 320, "protein": 15, "carbs": 55, "fat": 7},
-        "cost_rating": 1,
-        "meal_prep_friendly": True,
-        "health_score": 9,
-        "equipment_needed": ["pot", "skillet"],
-        "freezer_friendly": True,
-        "servings": 6,
-    },
-    {
-        "name": "Pulled Pork Sandwich",
-        "ingredients": [
-            "pork shoulder",
-            "bbq sauce",
-            "coleslaw",
-            "hamburger buns",
-            "pickles",
-        ],
-        "cuisine": "American",
-        "diet_tags": [
-            "non-vegan",
-            "high-protein",
-            "gluten-containing",
-            "high-calorie",
-            "slow-cooked",
-        ],
-        "cook_time": 480,
-        "nutrition": {"calories": 550, "protein": 30, "carbs": 45, "fat": 28},
-        "cost_rating": 2,
-        "meal_prep_friendly": True,
-        "health_score": 5,
-        "equipment_needed": ["slow cooker", "basting brush"],
-        "freezer_friendly": True,
-        "servings": 8,
-    },
-    {
-        "name": "Salade Lyonnaise",
-        "ingredients": [
-            "frisée lettuce",
-            "bacon",
-            "poached eggs",
-            "croutons",
-            "shallots",
-            "dijon vinaigrette",
-        ],
-        "cuisine": "French",
-        "diet_tags": [
-            "non-vegan",
-            "high-protein",
-            "gluten-containing",
-            "low-carb",
-            "quick-meal",
-        ],
-        "cook_time": 20,
-        "nutrition": {"calories": 350, "protein": 20, "carbs": 15, "fat": 25},
-        "cost_rating": 3,
-        "meal_prep_friendly": False,
-        "health_score": 7,
-        "equipment_needed": ["skillet", "pot"],
-        "freezer_friendly": False,
-        "servings": 4,
-    },
-    {
-        "name": "Panzanella",
-        "ingredients": [
-            "stale bread",
-            "tomatoes",
-            "cucumber",
-            "red onion",
-            "basil",
-            "olive oil",
-            "vinegar",
-        ],
-        "cuisine": "Italian",
-        "diet_tags": [
-            "vegetarian",
-            "vegan-option",
-            "gluten-free-option",
-            "high-fiber",
-            "no-cook",
-        ],
-        "cook_time": 15,
-        "nutrition": {"calories": 280, "protein": 6, "carbs": 30, "fat": 16},
-        "cost_rating": 2,
-        "meal_prep_friendly": True,
-        "health_score": 8,
-        "equipment_needed": ["mixing bowl", "knife"],
-        "freezer_friendly": False,
-        "servings": 6,
-    },
-    {
-        "name": "Maqluba",
-        "ingredients": [
-            "chicken",
-            "eggplant",
-            "rice",
-            "cauliflower",
-            "turmeric",
-            "allspice",
-        ],
-        "cuisine": "Middle eastern",
-        "diet_tags": [
-            "non-vegan",
-            "high-protein",
-            "gluten-free",
-            "one-pot-meal",
-            "high-iron",
-        ],
-        "cook_time": 90,
-        "nutrition": {"calories": 420, "protein": 25, "carbs": 45, "fat": 15},
-        "cost_rating": 2,
-        "meal_prep_friendly": True,
-        "health_score": 7,
-        "equipment_needed": ["pot with lid", "plate"],
-        "freezer_friendly": True,
-        "servings": 8,
-    },
-    {
-        "name": "Clam Chowder",
-        "ingredients": [
-            "clams",
-            "potatoes",
-            "bacon",
-            "onion",
-            "celery",
-            "heavy cream",
-            "thyme",
-        ],
-        "cuisine": "American",
-        "diet_tags": [
-            "non-vegan",
-            "pescatarian",
-            "gluten-free-option",
-            "high-protein",
-            "comfort-food",
-        ],
-        "cook_time": 45,
-        "nutrition": {"calories": 380, "protein": 20, "carbs": 25, "fat": 25},
-        "cost_rating": 3,
-        "meal_prep_friendly": True,
-        "health_score": 6,
-        "equipment_needed": ["soup pot", "ladle"],
-        "freezer_friendly": True,
-        "servings": 6,
-    },
-    {
-        "name": "Tarte Tatin",
-        "ingredients": ["apples", "puff pastry", "butter", "sugar", "vanilla"],
-        "cuisine": "French",
-        "diet_tags": [
-            "vegetarian",
-            "gluten-containing",
-            "dairy",
-            "high-sugar",
-            "baked",
-        ],
-        "cook_time": 60,
-        "nutrition": {"calories": 350, "protein": 3, "carbs": 50, "fat": 16},
-        "cost_rating": 3,
-        "meal_prep_friendly": True,
-        "health_score": 4,
-        "equipment_needed": ["oven-safe skillet", "oven"],
-        "freezer_friendly": True,
-        "servings": 8,
-    },
-    {
-        "name": "Bruschetta",
-        "ingredients": [
-            "baguette",
-            "tomatoes",
-            "garlic",
-            "basil",
-            "olive oil",
-            "balsamic vinegar",
-        ],
-        "cuisine": "Italian",
-        "diet_tags": [
-            "vegetarian",
-            "vegan-option",
-            "gluten-containing",
-            "quick-meal",
-            "low-fat",
-        ],
-        "cook_time": 15,
-        "nutrition": {"calories": 180, "protein": 5, "carbs": 25, "fat": 7},
-        "cost_rating": 1,
-        "meal_prep_friendly": False,
-        "health_score": 7,
-        "equipment_needed": ["oven", "mixing bowl"],
-        "freezer_friendly": False,
-        "servings": 6,
-    },
-    {
-        "name": "Labneh",
-        "ingredients": [
-            "greek yogurt",
-            "olive oil",
-            "za'atar",
-            "pita bread",
-            "cucumber",
-        ],
-        "cuisine": "Middle eastern",
-        "diet_tags": [
-            "vegetarian",
-            "gluten-free-option",
-            "high-protein",
-            "low-carb",
-            "probiotic",
-        ],
-        "cook_time": 10,
-        "nutrition": {"calories": 120, "protein": 10, "carbs": 5, "fat": 7},
-        "cost_rating": 1,
-        "meal_prep_friendly": True,
-        "health_score": 8,
-        "equipment_needed": ["cheesecloth", "strainer"],
-        "freezer_friendly": False,
-        "servings": 4,
-    },
-    {
-        "name": "Cajun Shrimp and Grits",
-        "ingredients": [
-            "shrimp",
-            "stone-ground grits",
-            "chicken stock",
-            "cheddar cheese",
-            "andouille sausage",
-            "cajun spices",
-        ],
-        "cuisine": "American",
-        "diet_tags": [
-            "non-vegan",
-            "high-protein",
-            "gluten-free",
-            "dairy",
-            "comfort-food",
-        ],
-        "cook_time": 40,
-        "nutrition": {"calories": 480, "protein": 35, "carbs": 35, "fat": 22},
-        "cost_rating": 3,
-        "meal_prep_friendly": True,
-        "health_score": 6,
-        "equipment_needed": ["saucepan", "skillet"],
-        "freezer_friendly": True,
-        "servings": 4,
-    },
-    {
-        "name": "Soupe à l'Oignon",
-        "ingredients": [
-            "onions",
-            "beef stock",
-            "white wine",
-            "baguette",
-            "gruyere cheese",
-        ],
-        "cuisine": "French",
-        "diet_tags": [
-            "vegetarian-option",
-            "gluten-containing",
-            "dairy",
-            "high-sodium",
-            "comfort-food",
-        ],
-        "cook_time": 60,
-        "nutrition": {"calories": 320, "protein": 15, "carbs": 30, "fat": 16},
-        "cost_rating": 2,
-        "meal_prep_friendly": True,
-        "health_score": 6,
-        "equipment_needed": ["soup pot", "oven-safe bowls"],
-        "freezer_friendly": True,
-        "servings": 6,
-    },
-    {
-        "name": "Cacio e Pepe",
-        "ingredients": [
-            "spaghetti",
-            "pecorino romano",
-            "black pepper",
-            "butter",
-            "pasta water",
-        ],
-        "cuisine": "Italian",
-        "diet_tags": [
-            "vegetarian",
-            "gluten-containing",
-            "dairy",
-            "quick-meal",
-            "high-calorie",
-        ],
-        "cook_time": 20,
-        "nutrition": {"calories": 580, "protein": 20, "carbs": 75, "fat": 22},
-        "cost_rating": 2,
-        "meal_prep_friendly": False,
-        "health_score": 5,
-        "equipment_needed": ["pot", "skillet"],
-        "freezer_friendly": False,
-        "servings": 4,
-    },
-    {
-        "name": "Shawarma",
-        "ingredients": [
-            "chicken thigh",
-            "pita bread",
-            "garlic sauce",
-            "pickles",
-            "tomatoes",
-            "onion",
-            "shawarma spices",
-        ],
-        "cuisine": "Middle eastern",
-        "diet_tags": [
-            "non-vegan",
-            "high-protein",
-            "gluten-containing",
-            "high-calorie",
-            "street-food",
-        ],
-        "cook_time": 30,
-        "nutrition": {"calories": 550, "protein": 35, "carbs": 45, "fat": 25},
-        "cost_rating": 2,
-        "meal_prep_friendly": True,
-        "health_score": 6,
-        "equipment_needed": ["grill", "knife"],
-        "freezer_friendly": True,
-        "servings": 6,
-    },
-    {
-        "name": "Monte Cristo Sandwich",
-        "ingredients": [
-            "white bread",
-            "ham",
-            "turkey",
-            "swiss cheese",
-            "egg",
-            "powdered sugar",
-            "raspberry jam",
-        ],
-        "cuisine": "American",
-        "diet_tags": [
-            "non-vegan",
-            "high-protein",
-            "gluten-containing",
-            "dairy",
-            "high-sugar",
-        ],
-        "cook_time": 20,
-        "nutrition": {"calories": 650, "protein": 35, "carbs": 55, "fat": 32},
-        "cost_rating": 3,
-        "meal_prep_friendly": False,
-        "health_score": 4,
-        "equipment_needed": ["skillet", "spatula"],
-        "freezer_friendly": False,
-        "servings": 2,
-    },
-    {
-        "name": "Confit de Canard",
-        "ingredients": ["duck legs", "duck fat", "garlic", "thyme", "salt", "pepper"],
-        "cuisine": "French",
-        "diet_tags": [
-            "non-vegan",
-            "high-protein",
-            "gluten-free",
-            "high-fat",
-            "slow-cooked",
-        ],
-        "cook_time": 180,
-        "nutrition": {"calories": 450, "protein": 30, "carbs": 0, "fat": 36},
-        "cost_rating": 4,
-        "meal_prep_friendly": True,
-        "health_score": 6,
-        "equipment_needed": ["oven-safe dish", "oven"],
-        "freezer_friendly": True,
-        "servings": 4,
-    },
-    {
-        "name": "Saltimbocca",
-        "ingredients": [
-            "veal cutlets",
-            "prosciutto",
-            "sage",
-            "white wine",
-            "butter",
-            "flour",
-        ],
-        "cuisine": "Italian",
-        "diet_tags": [
-            "non-vegan",
-            "high-protein",
-            "gluten-containing",
-            "dairy",
-            "low-carb",
-        ],
-        "cook_time": 25,
-        "nutrition": {"calories": 320, "protein": 30, "carbs": 5, "fat": 20},
-        "cost_rating": 4,
-        "meal_prep_friendly": False,
-        "health_score": 7,
-        "equipment_needed": ["skillet", "meat mallet"],
-        "freezer_friendly": False,
-        "servings": 4,
-    },
-    {
-        "name": "Kebab",
-        "ingredients": [
-            "lamb",
-            "onion",
-            "parsley",
-            "sumac",
-            "pita bread",
-            "garlic sauce",
-        ],
-        "cuisine": "Middle eastern",
-        "diet_tags": [
-            "non-vegan",
-            "high-protein",
-            "gluten-containing",
-            "high-iron",
-            "grilled",
-        ],
-        "cook_time": 30,
-        "nutrition": {"calories": 480, "protein": 35, "carbs": 30, "fat": 25},
-        "cost_rating": 2,
-        "meal_prep_friendly": True,
-        "health_score": 7,
-        "equipment_needed": ["grill", "skewers"],
-        "freezer_friendly": True,
-        "servings": 4,
-    },
-    {
-        "name": "Chicken Fried Steak",
-        "ingredients": [
-            "cube steak",
-            "flour",
-            "eggs",
-            "milk",
-            "pepper gravy",
-            "mashed potatoes",
-        ],
-        "cuisine": "American",
-        "diet_tags": [
-            "non-vegan",
-            "high-protein",
-            "gluten-containing",
-            "dairy",
-            "fried",
-        ],
-        "cook_time": 40,
-        "nutrition": {"calories": 750, "protein": 40, "carbs": 55, "fat": 40},
-        "cost_rating": 2,
-        "meal_prep_friendly": False,
-        "health_score": 4,
-        "equipment_needed": ["skillet", "meat mallet"],
-        "freezer_friendly": False,
-        "servings": 4,
-    },
-    {
-        "name": "Tarte Flambée",
-        "ingredients": [
-            "pizza dough",
-            "crème fraîche",
-            "onions",
-            "bacon",
-            "gruyere cheese",
-        ],
-        "cuisine": "French",
-        "diet_tags": [
-            "non-vegan",
-            "high-protein",
-            "gluten-containing",
-            "dairy",
-            "high-calorie",
-        ],
-        "cook_time": 20,
-        "nutrition": {"calories": 380, "protein": 15, "carbs": 35, "fat": 20},
-        "cost_rating": 3,
-        "meal_prep_friendly": False,
-        "health_score": 5,
-        "equipment_needed": ["oven", "baking sheet"],
-        "freezer_friendly": False,
-        "servings": 4,
-    },
-    {
-        "name": "Ribolitta",
-        "ingredients": [
-            "cannellini beans",
-            "kale",
-            "bread",
-            "tomatoes",
-            "carrots",
-            "celery",
-            "onion",
-            "parmesan",
-        ],
-        "cuisine": "Italian",
-        "diet_tags": [
-            "vegetarian",
-            "gluten-free-option",
-            "high-fiber",
-            "low-fat",
-            "one-pot-meal",
-        ],
-        "cook_time": 60,
-        "nutrition": {"calories": 280, "protein": 12, "carbs": 45, "fat": 6},
-        "cost_rating": 1,
-        "meal_prep_friendly": True,
-        "health_score": 9,
-        "equipment_needed": ["soup pot", "ladle"],
-        "freezer_friendly": True,
-        "servings": 8,
-    },
-    {
-        "name": "Ful Medames",
-        "ingredients": [
-            "fava beans",
-            "garlic",
-            "lemon juice",
-            "olive oil",
-            "cumin",
-            "parsley",
-            "eggs",
-        ],
-        "cuisine": "Middle eastern",
-        "diet_tags": [
-            "vegetarian",
-            "vegan-option",
-            "gluten-free",
-            "high-protein",
-            "high-fiber",
-        ],
-        "cook_time": 25,
-        "nutrition": {"calories": 250, "protein": 15, "carbs": 30, "fat": 8},
-        "cost_rating": 1,
-        "meal_prep_friendly": True,
-        "health_score": 9,
-        "equipment_needed": ["pot", "mixing bowl"],
-        "freezer_friendly": True,
-        "servings": 6,
-    },
-    {
-        "name": "Bananas Foster",
-        "ingredients": [
-            "bananas",
-            "butter",
-            "brown sugar",
-            "rum",
-            "vanilla ice cream",
-            "cinnamon",
-        ],
-        "cuisine": "American",
-        "diet_tags": [
-            "vegetarian",
-            "gluten-free",
-            "dairy",
-            "high-sugar",
-            "alcohol-containing",
-        ],
-        "cook_time": 15,
-        "nutrition": {"calories": 380, "protein": 3, "carbs": 45, "fat": 15},
-        "cost_rating": 3,
-        "meal_prep_friendly": False,
-        "health_score": 3,
-        "equipment_needed": ["skillet", "lighter"],
-        "freezer_friendly": False,
-        "servings": 4,
-    },
-    {
-        "name": "Coq au Vin",
-        "ingredients": [
-            "chicken",
-            "red wine",
-            "mushrooms",
-            "pearl onions",
-            "bacon",
-            "thyme",
-            "garlic",
-        ],
-        "cuisine": "French",
-        "diet_tags": [
-            "non-vegan",
-            "high-protein",
-            "gluten-free",
-            "alcohol-containing",
-            "slow-cooked",
-        ],
-        "cook_time": 120,
-        "nutrition": {"calories": 420, "protein": 35, "carbs": 10, "fat": 22},
-        "cost_rating": 4,
-        "meal_prep_friendly": True,
-        "health_score": 7,
-        "equipment_needed": ["dutch oven", "knife"],
-        "freezer_friendly": True,
-        "servings": 6,
-    },
-    {
-        "name": "Pasta e Fagioli",
-        "ingredients": [
-            "pasta",
-            "cannellini beans",
-            "tomatoes",
-            "garlic",
-            "onion",
-            "carrots",
-            "celery",
-            "parmesan",
-        ],
-        "cuisine": "Italian",
-        "diet_tags": [
-            "vegetarian",
-            "gluten-free-option",
-            "high-protein",
-            "high-fiber",
-            "one-pot-meal",
-        ],
-        "cook_time": 45,
-        "nutrition": {"calories": 350, "protein": 18, "carbs": 55, "fat": 8},
-        "cost_rating": 1,
-        "meal_prep_friendly": True,
-        "health_score": 8,
-        "equipment_needed": ["soup pot", "ladle"],
-        "freezer_friendly": True,
-        "servings": 8,
-    },
-    {
-        "name": "Warak Enab",
-        "ingredients": [
-            "grape leaves",
-            "rice",
-            "tomatoes",
-            "onion",
-            "mint",
-            "lemon juice",
-            "olive oil",
-        ],
-        "cuisine": "Middle eastern",
-        "diet_tags": [
-            "vegetarian",
-            "vegan-option",
-            "gluten-free",
-            "low-fat",
-            "high-fiber",
-        ],
-        "cook_time": 60,
-        "nutrition": {"calories": 180, "protein": 5, "carbs": 30, "fat": 6},
-        "cost_rating": 2,
-        "meal_prep_friendly": True,
-        "health_score": 8,
-        "equipment_needed": ["pot", "plate"],
-        "freezer_friendly": True,
-        "servings": 6,
-    },
-    {
-        "name": "Buttermilk Pancakes",
-        "ingredients": [
-            "flour",
-            "buttermilk",
-            "eggs",
-            "butter",
-            "sugar",
-            "baking powder",
-            "maple syrup",
-        ],
-        "cuisine": "American",
-        "diet_tags": [
-            "vegetarian",
-            "gluten-containing",
-            "dairy",
-            "high-carb",
-            "breakfast",
-        ],
-        "cook_time": 20,
-        "nutrition": {"calories": 350, "protein": 8, "carbs": 55, "fat": 12},
-        "cost_rating": 1,
-        "meal_prep_friendly": False,
-        "health_score": 5,
-        "equipment_needed": ["griddle", "mixing bowl"],
-        "freezer_friendly": True,
-        "servings": 4,
-    },
-    {
-        "name": "Cobb Salad",
-        "ingredients": [
-            "romaine lettuce",
-            "chicken breast",
-            "bacon",
-            "avocado",
-            "blue cheese",
-            "eggs",
-            "tomatoes",
-        ],
-        "cuisine": "American",
-        "diet_tags": [
-            "non-vegan",
-            "high-protein",
-            "gluten-free",
-            "low-carb",
-            "keto-friendly",
-        ],
-        "cook_time": 25,
-        "nutrition": {"calories": 450, "protein": 35, "carbs": 12, "fat": 30},
-        "cost_rating": 3,
-        "meal_prep_friendly": True,
-        "health_score": 7,
-        "equipment_needed": ["knife", "mixing bowl"],
-        "freezer_friendly": False,
-        "servings": 4,
-    },
-    {
-        "name": "Chili Con Carne",
-        "ingredients": [
-            "ground beef",
-            "kidney beans",
-            "tomatoes",
-            "onion",
-            "chili powder",
-            "cumin",
-            "bell peppers",
-        ],
-        "cuisine": "American",
-        "diet_tags": [
-            "non-vegan",
-            "high-protein",
-            "gluten-free",
-            "high-fiber",
-            "slow-cooked",
-        ],
-        "cook_time": 90,
-        "nutrition": {"calories": 380, "protein": 28, "carbs": 30, "fat": 18},
-        "cost_rating": 2,
-        "meal_prep_friendly": True,
-        "health_score": 7,
-        "equipment_needed": ["dutch oven", "wooden spoon"],
-        "freezer_friendly": True,
-        "servings": 8,
-    },
-    {
-        "name": "Key Lime Pie",
-        "ingredients": [
-            "graham cracker crust",
-            "key lime juice",
-            "sweetened condensed milk",
-            "egg yolks",
-            "whipped cream",
-        ],
-        "cuisine": "American",
-        "diet_tags": [
-            "vegetarian",
-            "gluten-containing",
-            "dairy",
-            "high-sugar",
-            "dessert",
-        ],
-        "cook_time": 45,
-        "nutrition": {"calories": 420, "protein": 7, "carbs": 55, "fat": 20},
-        "cost_rating": 3,
-        "meal_prep_friendly": True,
-        "health_score": 3,
-        "equipment_needed": ["pie dish", "mixer"],
-        "freezer_friendly": True,
-        "servings": 8,
-    },
-    {
-        "name": "Cornbread",
-        "ingredients": [
-            "cornmeal",
-            "flour",
-            "buttermilk",
-            "eggs",
-            "honey",
-            "baking powder",
-            "butter",
-        ],
-        "cuisine": "American",
-        "diet_tags": [
-            "vegetarian",
-            "gluten-containing",
-            "dairy",
-            "high-carb",
-            "quick-bread",
-        ],
-        "cook_time": 25,
-        "nutrition": {"calories": 280, "protein": 6, "carbs": 40, "fat": 12},
-        "cost_rating": 1,
-        "meal_prep_friendly": True,
-        "health_score": 5,
-        "equipment_needed": ["baking pan", "mixing bowl"],
-        "freezer_friendly": True,
-        "servings": 8,
-    },
-    {
-        "name": "Clam Bake",
-        "ingredients": [
-            "clams",
-            "lobster",
-            "corn",
-            "potatoes",
-            "sausage",
-            "butter",
-            "old bay seasoning",
-        ],
-        "cuisine": "American",
-        "diet_tags": [
-            "non-vegan",
-            "pescatarian",
-            "gluten-free",
-            "high-protein",
-            "festive",
-        ],
-        "cook_time": 60,
-        "nutrition": {"calories": 520, "protein": 45, "carbs": 35, "fat": 25},
-        "cost_rating": 5,
-        "meal_prep_friendly": False,
-        "health_score": 7,
-        "equipment_needed": ["large pot", "steamer basket"],
-        "freezer_friendly": False,
-        "servings": 6,
-    },
-    {
-        "name": "Fried Green Tomatoes",
-        "ingredients": [
-            "green tomatoes",
-            "cornmeal",
-            "flour",
-            "eggs",
-            "buttermilk",
-            "hot sauce",
-            "oil",
-        ],
-        "cuisine": "American",
-        "diet_tags": ["vegetarian", "gluten-containing", "dairy", "fried", "appetizer"],
-        "cook_time": 20,
-        "nutrition": {"calories": 280, "protein": 6, "carbs": 30, "fat": 15},
-        "cost_rating": 2,
-        "meal_prep_friendly": False,
-        "health_score": 4,
-        "equipment_needed": ["skillet", "tongs"],
-        "freezer_friendly": False,
-        "servings": 4,
-    },
-    {
-        "name": "Sloppy Joes",
-        "ingredients": [
-            "ground beef",
-            "hamburger buns",
-            "onion",
-            "bell pepper",
-            "tomato paste",
-            "worcestershire sauce",
-            "brown sugar",
-        ],
-        "cuisine": "American",
-        "diet_tags": [
-            "non-vegan",
-            "high-protein",
-            "gluten-containing",
-            "high-calorie",
-            "comfort-food",
-        ],
-        "cook_time": 30,
-        "nutrition": {"calories": 450, "protein": 25, "carbs": 40, "fat": 20},
-        "cost_rating": 1,
-        "meal_prep_friendly": True,
-        "health_score": 5,
-        "equipment_needed": ["skillet", "spatula"],
-        "freezer_friendly": True,
-        "servings": 6,
-    },
-    {
-        "name": "Pecan Pie",
-        "ingredients": [
-            "pie crust",
-            "pecans",
-            "corn syrup",
-            "eggs",
-            "brown sugar",
-            "butter",
-            "vanilla",
-        ],
-        "cuisine": "American",
-        "diet_tags": [
-            "vegetarian",
-            "gluten-containing",
-            "nut-containing",
-            "high-sugar",
-            "dessert",
-        ],
-        "cook_time": 60,
-        "nutrition": {"calories": 500, "protein": 6, "carbs": 65, "fat": 26},
-        "cost_rating": 3,
-        "meal_prep_friendly": True,
-        "health_score": 3,
-        "equipment_needed": ["pie dish", "oven"],
-        "freezer_friendly": True,
-        "servings": 8,
-    },
-    {
-        "name": "Gumbo",
-        "ingredients": [
-            "chicken",
-            "andouille sausage",
-            "shrimp",
-            "okra",
-            "bell peppers",
-            "onion",
-            "celery",
-            "filé powder",
-        ],
-        "cuisine": "American",
-        "diet_tags": [
-            "non-vegan",
-            "high-protein",
-            "gluten-free",
-            "one-pot-meal",
-            "spicy",
-        ],
-        "cook_time": 120,
-        "nutrition": {"calories": 380, "protein": 32, "carbs": 20, "fat": 20},
-        "cost_rating": 3,
-        "meal_prep_friendly": True,
-        "health_score": 7,
-        "equipment_needed": ["dutch oven", "wooden spoon"],
-        "freezer_friendly": True,
-        "servings": 8,
-    },
-    {
-        "name": "Quenelles",
-        "ingredients": [
-            "pike fish",
-            "cream",
-            "eggs",
-            "butter",
-            "flour",
-            "lobster sauce",
-        ],
-        "cuisine": "French",
-        "diet_tags": [
-            "non-vegan",
-            "pescatarian",
-            "gluten-containing",
-            "dairy",
-            "gourmet",
-        ],
-        "cook_time": 45,
-        "nutrition": {"calories": 320, "protein": 25, "carbs": 15, "fat": 18},
-        "cost_rating": 4,
-        "meal_prep_friendly": False,
-        "health_score": 6,
-        "equipment_needed": ["food processor", "poaching pan"],
-        "freezer_friendly": False,
-        "servings": 4,
-    },
-    {
-        "name": "Salade Niçoise",
-        "ingredients": [
-            "tuna",
-            "green beans",
-            "potatoes",
-            "olives",
-            "eggs",
-            "tomatoes",
-            "anchovies",
-            "vinaigrette",
-        ],
-        "cuisine": "French",
-        "diet_tags": [
-            "pescatarian",
-            "gluten-free",
-            "high-protein",
-            "low-carb",
-            "high-omega-3",
-        ],
-        "cook_time": 30,
-        "nutrition": {"calories": 380, "protein": 30, "carbs": 20, "fat": 22},
-        "cost_rating": 3,
-        "meal_prep_friendly": True,
-        "health_score": 8,
-        "equipment_needed": ["pot", "skillet", "mixing bowl"],
-        "freezer_friendly": False,
-        "servings": 4,
-    },
-    {
-        "name": "Boeuf en Daube",
-        "ingredients": [
-            "beef chuck",
-            "red wine",
-            "carrots",
-            "onions",
-            "garlic",
-            "olives",
-            "herbes de provence",
-        ],
-        "cuisine": "French",
-        "diet_tags": [
-            "non-vegan",
-            "high-protein",
-            "gluten-free",
-            "slow-cooked",
-            "alcohol-containing",
-        ],
-        "cook_time": 180,
-        "nutrition": {"calories": 420, "protein": 38, "carbs": 15, "fat": 22},
-        "cost_rating": 4,
-        "meal_prep_friendly": True,
-        "health_score": 7,
-        "equipment_needed": ["dutch oven", "knife"],
-        "freezer_friendly": True,
-        "servings": 6,
-    },
-    {
-        "name": "Gougères",
-        "ingredients": ["water", "butter", "flour", "eggs", "gruyere cheese", "nutmeg"],
-        "cuisine": "French",
-        "diet_tags": [
-            "vegetarian",
-            "gluten-containing",
-            "dairy",
-            "high-fat",
-            "appetizer",
-        ],
-        "cook_time": 30,
-        "nutrition": {"calories": 80, "protein": 4, "carbs": 5, "fat": 5},
-        "cost_rating": 2,
-        "meal_prep_friendly": True,
-        "health_score": 4,
-        "equipment_needed": ["saucepan", "piping bag"],
-        "freezer_friendly": True,
-        "servings": 12,
-    },
-    {
-        "name": "Sole Meunière",
-        "ingredients": ["sole fish", "butter", "lemon", "parsley", "flour", "capers"],
-        "cuisine": "French",
-        "diet_tags": [
-            "pescatarian",
-            "gluten-containing",
-            "dairy",
-            "high-protein",
-            "low-carb",
-        ],
-        "cook_time": 20,
-        "nutrition": {"calories": 280, "protein": 30, "carbs": 10, "fat": 15},
-        "cost_rating": 4,
-        "meal_prep_friendly": False,
-        "health_score": 8,
-        "equipment_needed": ["skillet", "spatula"],
-        "freezer_friendly": False,
-        "servings": 2,
-    },
-    {
-        "name": "Pissaladière",
-        "ingredients": [
-            "pizza dough",
-            "onions",
-            "anchovies",
-            "olives",
-            "thyme",
-            "olive oil",
-        ],
-        "cuisine": "French",
-        "diet_tags": [
-            "pescatarian",
-            "gluten-containing",
-            "high-protein",
-            "low-dairy",
-            "savory-tart",
-        ],
-        "cook_time": 45,
-        "nutrition": {"calories": 320, "protein": 12, "carbs": 40, "fat": 15},
-        "cost_rating": 3,
-        "meal_prep_friendly": True,
-        "health_score": 7,
-        "equipment_needed": ["baking sheet", "skillet"],
-        "freezer_friendly": True,
-        "servings": 6,
-    },
-    {
-        "name": "Cassoulet",
-        "ingredients": [
-            "white beans",
-            "duck confit",
-            "sausage",
-            "pork shoulder",
-            "breadcrumbs",
-            "garlic",
-            "tomatoes",
-        ],
-        "cuisine": "French",
-        "diet_tags": [
-            "non-vegan",
-            "high-protein",
-            "gluten-free",
-            "slow-cooked",
-            "comfort-food",
-        ],
-        "cook_time": 240,
-        "nutrition": {"calories": 550, "protein": 35, "carbs": 40, "fat": 28},
-        "cost_rating": 4,
-        "meal_prep_friendly": True,
-        "health_score": 6,
-        "equipment_needed": ["dutch oven", "wooden spoon"],
-        "freezer_friendly": True,
-        "servings": 8,
-    },
-    {
-        "name": "Tarte aux Pommes",
-        "ingredients": [
-            "puff pastry",
-            "apples",
-            "sugar",
-            "butter",
-            "apricot jam",
-            "cinnamon",
-        ],
-        "cuisine": "French",
-        "diet_tags": [
-            "vegetarian",
-            "gluten-containing",
-            "dairy",
-            "high-sugar",
-            "dessert",
-        ],
-        "cook_time": 50,
-        "nutrition": {"calories": 350, "protein": 3, "carbs": 50, "fat": 16},
-        "cost_rating": 3,
-        "meal_prep_friendly": True,
-        "health_score": 4,
-        "equipment_needed": ["tart pan", "oven"],
-        "freezer_friendly": True,
-        "servings": 8,
-    },
-    {
-        "name": "Soupe au Pistou",
-        "ingredients": [
-            "white beans",
-            "zucchini",
-            "tomatoes",
-            "green beans",
-            "pasta",
-            "basil",
-            "garlic",
-            "olive oil",
-        ],
-        "cuisine": "French",
-        "diet_tags": [
-            "vegetarian",
-            "gluten-free-option",
-            "high-fiber",
-            "low-fat",
-            "summer-soup",
-        ],
-        "cook_time": 45,
-        "nutrition": {"calories": 250, "protein": 10, "carbs": 35, "fat": 8},
-        "cost_rating": 2,
-        "meal_prep_friendly": True,
-        "health_score": 8,
-        "equipment_needed": ["soup pot", "ladle"],
-        "freezer_friendly": True,
-        "servings": 8,
-    },
-    {
-        "name": "Canelés",
-        "ingredients": [
-            "milk",
-            "sugar",
-            "flour",
-            "egg yolks",
-            "rum",
-            "vanilla",
-            "beeswax",
-        ],
-        "cuisine": "French",
-        "diet_tags": [
-            "vegetarian",
-            "gluten-containing",
-            "dairy",
-            "high-sugar",
-            "pastry",
-        ],
-        "cook_time": 90,
-        "nutrition": {"calories": 180, "protein": 3, "carbs": 30, "fat": 6},
-        "cost_rating": 4,
-        "meal_prep_friendly": True,
-        "health_score": 3,
-        "equipment_needed": ["canelé molds", "oven"],
-        "freezer_friendly": True,
-        "servings": 12,
-    },
-    {
-        "name": "Osso Buco",
-        "ingredients": [
-            "veal shanks",
-            "white wine",
-            "carrots",
-            "celery",
-            "onion",
-            "tomato paste",
-            "gremolata",
-        ],
-        "cuisine": "Italian",
-        "diet_tags": [
-            "non-vegan",
-            "high-protein",
-            "gluten-free",
-            "slow-cooked",
-            "gourmet",
-        ],
-        "cook_time": 180,
-        "nutrition": {"calories": 420, "protein": 45, "carbs": 10, "fat": 22},
-        "cost_rating": 5,
-        "meal_prep_friendly": True,
-        "health_score": 7,
-        "equipment_needed": ["dutch oven", "knife"],
-        "freezer_friendly": True,
-        "servings": 4,
-    },
-    {
-        "name": "Pappa al Pomodoro",
-        "ingredients": [
-            "stale bread",
-            "tomatoes",
-            "garlic",
-            "basil",
-            "olive oil",
-            "vegetable stock",
-        ],
-        "cuisine": "Italian",
-        "diet_tags": [
-            "vegetarian",
-            "vegan-option",
-            "gluten-free-option",
-            "high-fiber",
-            "comfort-food",
-        ],
-        "cook_time": 40,
-        "nutrition": {"calories": 280, "protein": 6, "carbs": 35, "fat": 12},
-        "cost_rating": 1,
-        "meal_prep_friendly": True,
-        "health_score": 7,
-        "equipment_needed": ["soup pot", "wooden spoon"],
-        "freezer_friendly": True,
-        "servings": 6,
-    },
-    {
-        "name": "Vitello Tonnato",
-        "ingredients": [
-            "veal roast",
-            "tuna",
-            "mayonnaise",
-            "capers",
-            "anchovies",
-            "lemon juice",
-        ],
-        "cuisine": "Italian",
-        "diet_tags": [
-            "non-vegan",
-            "pescatarian",
-            "high-protein",
-            "low-carb",
-            "chilled-dish",
-        ],
-        "cook_time": 90,
-        "nutrition": {"calories": 320, "protein": 35, "carbs": 2, "fat": 20},
-        "cost_rating": 4,
-        "meal_prep_friendly": True,
-        "health_score": 7,
-        "equipment_needed": ["roasting pan", "food processor"],
-        "freezer_friendly": False,
-        "servings": 6,
-    },
-    {
-        "name": "Gnocchi alla Sorrentina",
-        "ingredients": [
-            "gnocchi",
-            "tomato sauce",
-            "mozzarella",
-            "basil",
-            "parmesan",
-            "butter",
-        ],
-        "cuisine": "Italian",
-        "diet_tags": [
-            "vegetarian",
-            "gluten-free-option",
-            "dairy",
-            "high-carb",
-            "comfort-food",
-        ],
-        "cook_time": 30,
-        "nutrition": {"calories": 450, "protein": 15, "carbs": 60, "fat": 18},
-        "cost_rating": 3,
-        "meal_prep_friendly": True,
-        "health_score": 6,
-        "equipment_needed": ["baking dish", "pot"],
-        "freezer_friendly": True,
-        "servings": 4,
-    },
-    {
-        "name": "Bucatini all'Amatriciana",
-        "ingredients": [
-            "bucatini",
-            "guanciale",
-            "tomatoes",
-            "pecorino",
-            "red pepper flakes",
-            "onion",
-        ],
-        "cuisine": "Italian",
-        "diet_tags": [
-            "non-vegan",
-            "high-protein",
-            "gluten-containing",
-            "dairy",
-            "spicy",
-        ],
-        "cook_time": 25,
-        "nutrition": {"calories": 580, "protein": 20, "carbs": 75, "fat": 22},
-        "cost_rating": 3,
-        "meal_prep_friendly": False,
-        "health_score": 6,
-        "equipment_needed": ["pot", "skillet"],
-        "freezer_friendly": False,
-        "servings": 4,
-    },
-    {
-        "name": "Caponata",
-        "ingredients": [
-            "eggplant",
-            "celery",
-            "tomatoes",
-            "olives",
-            "capers",
-            "vinegar",
-            "pine nuts",
-        ],
-        "cuisine": "Italian",
-        "diet_tags": [
-            "vegetarian",
-            "vegan",
-            "gluten-free",
-            "low-calorie",
-            "high-fiber",
-        ],
-        "cook_time": 45,
-        "nutrition": {"calories": 180, "protein": 4, "carbs": 20, "fat": 10},
-        "cost_rating": 2,
-        "meal_prep_friendly": True,
-        "health_score": 8,
-        "equipment_needed": ["skillet", "wooden spoon"],
-        "freezer_friendly": True,
-        "servings": 6,
-    },
-    {
-        "name": "Zuppa Inglese",
-        "ingredients": [
-            "sponge cake",
-            "custard",
-            "alchermes liqueur",
-            "chocolate",
-            "whipped cream",
-        ],
-        "cuisine": "Italian",
-        "diet_tags": [
-            "vegetarian",
-            "gluten-containing",
-            "dairy",
-            "high-sugar",
-            "dessert",
-        ],
-        "cook_time": 30,
-        "nutrition": {"calories": 380, "protein": 6, "carbs": 45, "fat": 18},
-        "cost_rating": 3,
-        "meal_prep_friendly": True,
-        "health_score": 3,
-        "equipment_needed": ["trifle dish", "mixer"],
-        "freezer_friendly": False,
-        "servings": 8,
-    },
-    {
-        "name": "Fritto Misto",
-        "ingredients": [
-            "shrimp",
-            "calamari",
-            "zucchini",
-            "lemon",
-            "flour",
-            "sparkling water",
-            "oil",
-        ],
-        "cuisine": "Italian",
-        "diet_tags": [
-            "pescatarian",
-            "gluten-containing",
-            "fried",
-            "high-protein",
-            "appetizer",
-        ],
-        "cook_time": 20,
-        "nutrition": {"calories": 350, "protein": 25, "carbs": 20, "fat": 20},
-        "cost_rating": 4,
-        "meal_prep_friendly": False,
-        "health_score": 5,
-        "equipment_needed": ["deep fryer", "spider strainer"],
-        "freezer_friendly": False,
-        "servings": 4,
-    },
-    {
-        "name": "Risotto ai Funghi",
-        "ingredients": [
-            "arborio rice",
-            "mushrooms",
-            "white wine",
-            "parmesan",
-            "butter",
-            "onion",
-            "vegetable stock",
-        ],
-        "cuisine": "Italian",
-        "diet_tags": [
-            "vegetarian",
-            "gluten-free",
-            "dairy",
-            "high-carb",
-            "comfort-food",
-        ],
-        "cook_time": 35,
-        "nutrition": {"calories": 380, "protein": 10, "carbs": 55, "fat": 12},
-        "cost_rating": 3,
-        "meal_prep_friendly": False,
-        "health_score": 7,
-        "equipment_needed": ["saucepan", "wooden spoon"],
-        "freezer_friendly": False,
-        "servings": 4,
-    },
-    {
-        "name": "Panforte",
-        "ingredients": [
-            "hazelnuts",
-            "almonds",
-            "dried fruits",
-            "honey",
-            "flour",
-            "spices",
-            "powdered sugar",
-        ],
-        "cuisine": "Italian",
-        "diet_tags": [
-            "vegetarian",
-            "gluten-containing",
-            "nut-containing",
-            "high-sugar",
-            "holiday-food",
-        ],
-        "cook_time": 60,
-        "nutrition": {"calories": 280, "protein": 5, "carbs": 45, "fat": 10},
-        "cost_rating": 4,
-        "meal_prep_friendly": True,
-        "health_score": 4,
-        "equipment_needed": ["springform pan", "oven"],
-        "freezer_friendly": True,
-        "servings": 12,
-    },
-    {
-        "name": "Kousa Mahshi",
-        "ingredients": [
-            "zucchini",
-            "ground lamb",
-            "rice",
-            "tomatoes",
-            "mint",
-            "lemon juice",
-            "garlic",
-        ],
-        "cuisine": "Middle eastern",
-        "diet_tags": [
-            "non-vegan",
-            "high-protein",
-            "gluten-free",
-            "stuffed-vegetables",
-            "one-pot-meal",
-        ],
-        "cook_time": 90,
-        "nutrition": {"calories": 320, "protein": 20, "carbs": 25, "fat": 16},
-        "cost_rating": 2,
-        "meal_prep_friendly": True,
-        "health_score": 8,
-        "equipment_needed": ["pot", "knife"],
-        "freezer_friendly": True,
-        "servings": 6,
-    },
-    {
-        "name": "Fatteh",
-        "ingredients": [
-            "chickpeas",
-            "yogurt",
-            "pita bread",
-            "pine nuts",
-            "garlic",
-            "tahini",
-            "butter",
-        ],
-        "cuisine": "Middle eastern",
-        "diet_tags": [
-            "vegetarian",
-            "gluten-containing",
-            "dairy",
-            "high-protein",
-            "comfort-food",
-        ],
-        "cook_time": 30,
-        "nutrition": {"calories": 380, "protein": 15, "carbs": 35, "fat": 20},
-        "cost_rating": 2,
-        "meal_prep_friendly": True,
-        "health_score": 7,
-        "equipment_needed": ["skillet", "mixing bowl"],
-        "freezer_friendly": True,
-        "servings": 6,
-    },
-    {
-        "name": "Mulukhiyah",
-        "ingredients": [
-            "jute leaves",
-            "chicken",
-            "garlic",
-            "coriander",
-            "lemon juice",
-            "rice",
-        ],
-        "cuisine": "Middle eastern",
-        "diet_tags": ["non-vegan", "high-protein", "gluten-free", "high-iron", "stew"],
-        "cook_time": 60,
-        "nutrition": {"calories": 280, "protein": 25, "carbs": 20, "fat": 12},
-        "cost_rating": 2,
-        "meal_prep_friendly": True,
-        "health_score": 8,
-        "equipment_needed": ["pot", "ladle"],
-        "freezer_friendly": True,
-        "servings": 6,
-    },
-    {
-        "name": "Sfiha",
-        "ingredients": [
-            "dough",
-            "ground lamb",
-            "tomatoes",
-            "onion",
-            "pine nuts",
-            "yogurt sauce",
-        ],
-        "cuisine": "Middle eastern",
-        "diet_tags": [
-            "non-vegan",
-            "high-protein",
-            "gluten-containing",
-            "dairy-option",
-            "savory-pastry",
-        ],
-        "cook_time": 40,
-        "nutrition": {"calories": 280, "protein": 15, "carbs": 25, "fat": 14},
-        "cost_rating": 2,
-        "meal_prep_friendly": True,
-        "health_score": 6,
-        "equipment_needed": ["oven", "baking sheet"],
-        "freezer_friendly": True,
-        "servings": 6,
-    },
-    {
-        "name": "Qatayef",
-        "ingredients": [
-            "flour",
-            "yeast",
-            "sugar",
-            "water",
-            "ricotta",
-            "pistachios",
-            "rose water",
-        ],
-        "cuisine": "Middle eastern",
-        "diet_tags": [
-            "vegetarian",
-            "gluten-containing",
-            "dairy",
-            "high-sugar",
-            "ramadan-special",
-        ],
-        "cook_time": 45,
-        "nutrition": {"calories": 250, "protein": 6, "carbs": 35, "fat": 10},
-        "cost_rating": 2,
-        "meal_prep_friendly": True,
-        "health_score": 4,
-        "equipment_needed": ["griddle", "mixing bowl"],
-        "freezer_friendly": True,
-        "servings": 12,
-    },
-    {
-        "name": "Mandi",
-        "ingredients": [
-            "lamb",
-            "basmati rice",
-            "mandi spice mix",
-            "almonds",
-            "raisins",
-            "ghee",
-        ],
-        "cuisine": "Middle eastern",
-        "diet_tags": [
-            "non-vegan",
-            "high-protein",
-            "gluten-free",
-            "festive",
-            "aromatic",
-        ],
-        "cook_time": 180,
-        "nutrition": {"calories": 550, "protein": 35, "carbs": 45, "fat": 25},
-        "cost_rating": 4,
-        "meal_prep_friendly": True,
-        "health_score": 6,
-        "equipment_needed": ["pressure cooker", "serving platter"],
-        "freezer_friendly": True,
-        "servings": 8,
-    },
-    {
-        "name": "Fasolia",
-        "ingredients": [
-            "white beans",
-            "lamb",
-            "tomato paste",
-            "onion",
-            "garlic",
-            "olive oil",
-            "lemon",
-        ],
-        "cuisine": "Middle eastern",
-        "diet_tags": ["non-vegan", "high-protein", "gluten-free", "high-fiber", "stew"],
-        "cook_time": 120,
-        "nutrition": {"calories": 320, "protein": 22, "carbs": 30, "fat": 12},
-        "cost_rating": 2,
-        "meal_prep_friendly": True,
-        "health_score": 8,
-        "equipment_needed": ["pot", "wooden spoon"],
-        "freezer_friendly": True,
-        "servings": 6,
-    },
-    {
-        "name": "Basbousa",
-        "ingredients": [
-            "semolina",
-            "yogurt",
-            "coconut",
-            "sugar syrup",
-            "butter",
-            "baking powder",
-        ],
-        "cuisine": "Middle eastern",
-        "diet_tags": [
-            "vegetarian",
-            "gluten-containing",
-            "dairy",
-            "high-sugar",
-            "dessert",
-        ],
-        "cook_time": 45,
-        "nutrition": {"calories": 320, "protein": 5, "carbs": 50, "fat": 12},
-        "cost_rating": 2,
-        "meal_prep_friendly": True,
-        "health_score": 4,
-        "equipment_needed": ["baking dish", "saucepan"],
-        "freezer_friendly": True,
-        "servings": 12,
-    },
-    {
-        "name": "Kibbeh Nayeh",
-        "ingredients": [
-            "raw lamb",
-            "bulgur",
-            "onion",
-            "mint",
-            "olive oil",
-            "pita bread",
-        ],
-        "cuisine": "Middle eastern",
-        "diet_tags": [
-            "non-vegan",
-            "high-protein",
-            "gluten-containing",
-            "raw",
-            "appetizer",
-        ],
-        "cook_time": 30,
-        "nutrition": {"calories": 280, "protein": 25, "carbs": 15, "fat": 15},
-        "cost_rating": 3,
-        "meal_prep_friendly": False,
-        "health_score": 6,
-        "equipment_needed": ["food processor", "knife"],
-        "freezer_friendly": False,
-        "servings": 6,
-    },
-    {
-        "name": "Jareesh",
-        "ingredients": ["cracked wheat", "chicken", "onion", "ghee", "loomi", "cumin"],
-        "cuisine": "Middle eastern",
-        "diet_tags": [
-            "non-vegan",
-            "high-protein",
-            "gluten-containing",
-            "comfort-food",
-            "porridge",
-        ],
-        "cook_time": 120,
-        "nutrition": {"calories": 350, "protein": 25, "carbs": 40, "fat": 12},
-        "cost_rating": 2,
-        "meal_prep_friendly": True,
-        "health_score": 7,
-        "equipment_needed": ["pot", "wooden spoon"],
-        "freezer_friendly": True,
-        "servings": 6,
-    },
-    {
-        "name": "Chicken and Waffles",
-        "ingredients": [
-            "chicken thighs",
-            "buttermilk",
-            "hot sauce",
-            "flour",
-            "waffle mix",
-            "maple syrup",
-            "butter",
-        ],
-        "cuisine": "American",
-        "diet_tags": [
-            "non-vegan",
-            "gluten-containing",
-            "dairy",
-            "fried",
-            "comfort-food",
-        ],
-        "cook_time": 40,
-        "nutrition": {"calories": 850, "protein": 45, "carbs": 75, "fat": 40},
-        "cost_rating": 3,
-        "meal_prep_friendly": False,
-        "health_score": 4,
-        "equipment_needed": ["deep fryer", "waffle iron", "mixing bowls"],
-        "freezer_friendly": False,
-        "servings": 4,
-    },
-    {
-        "name": "Lobster Roll",
-        "ingredients": [
-            "lobster meat",
-            "mayonnaise",
-            "lemon juice",
-            "celery",
-            "butter",
-            "hot dog buns",
-            "chives",
-        ],
-        "cuisine": "American",
-        "diet_tags": [
-            "pescatarian",
-            "gluten-containing",
-            "high-protein",
-            "quick-meal",
-            "summer-food",
-        ],
-        "cook_time": 15,
-        "nutrition": {"calories": 480, "protein": 25, "carbs": 35, "fat": 28},
-        "cost_rating": 5,
-        "meal_prep_friendly": False,
-        "health_score": 6,
-        "equipment_needed": ["mixing bowl", "skillet"],
-        "freezer_friendly": False,
-        "servings": 4,
-    },
-    {
-        "name": "Philly Cheesesteak",
-        "ingredients": [
-            "ribeye steak",
-            "amoroso rolls",
-            "american cheese",
-            "onions",
-            "bell peppers",
-            "mushrooms",
-        ],
-        "cuisine": "American",
-        "diet_tags": [
-            "non-vegan",
-            "high-protein",
-            "gluten-containing",
-            "dairy",
-            "high-calorie",
-        ],
-        "cook_time": 25,
-        "nutrition": {"calories": 650, "protein": 40, "carbs": 45, "fat": 35},
-        "cost_rating": 3,
-        "meal_prep_friendly": False,
-        "health_score": 5,
-        "equipment_needed": ["grill", "spatula"],
-        "freezer_friendly": False,
-        "servings": 4,
-    },
-    {
-        "name": "Cincinnati Chili",
-        "ingredients": [
-            "ground beef",
-            "tomato paste",
-            "cocoa powder",
-            "cinnamon",
-            "spaghetti",
-            "cheddar cheese",
-            "onions",
-        ],
-        "cuisine": "American",
-        "diet_tags": [
-            "non-vegan",
-            "high-protein",
-            "gluten-containing",
-            "dairy",
-            "comfort-food",
-        ],
-        "cook_time": 90,
-        "nutrition": {"calories": 520, "protein": 30, "carbs": 45, "fat": 25},
-        "cost_rating": 2,
-        "meal_prep_friendly": True,
-        "health_score": 5,
-        "equipment_needed": ["dutch oven", "pot"],
-        "freezer_friendly": True,
-        "servings": 6,
-    },
-    {
-        "name": "Shrimp and Grits",
-        "ingredients": [
-            "shrimp",
-            "stone-ground grits",
-            "chicken stock",
-            "cheddar cheese",
-            "bacon",
-            "green onions",
-        ],
-        "cuisine": "American",
-        "diet_tags": [
-            "pescatarian",
-            "gluten-free",
-            "dairy",
-            "high-protein",
-            "southern",
-        ],
-        "cook_time": 40,
-        "nutrition": {"calories": 480, "protein": 35, "carbs": 35, "fat": 22},
-        "cost_rating": 3,
-        "meal_prep_friendly": True,
-        "health_score": 6,
-        "equipment_needed": ["saucepan", "skillet"],
-        "freezer_friendly": True,
-        "servings": 4,
-    },
-    {
-        "name": "Steak Frites",
-        "ingredients": [
-            "ribeye steak",
-            "potatoes",
-            "butter",
-            "thyme",
-            "garlic",
-            "salt",
-            "pepper",
-        ],
-        "cuisine": "French",
-        "diet_tags": [
-            "non-vegan",
-            "high-protein",
-            "gluten-free",
-            "dairy",
-            "bistro-style",
-        ],
-        "cook_time": 30,
-        "nutrition": {"calories": 780, "protein": 55, "carbs": 45, "fat": 45},
-        "cost_rating": 4,
-        "meal_prep_friendly": False,
-        "health_score": 6,
-        "equipment_needed": ["cast iron skillet", "baking sheet", "deep fryer"],
-        "freezer_friendly": False,
-        "servings": 2,
-    },
-    {
-        "name": "Salade Landaise",
-        "ingredients": [
-            "duck breast",
-            "foie gras",
-            "mesclun greens",
-            "walnuts",
-            "goat cheese",
-            "vinaigrette",
-        ],
-        "cuisine": "French",
-        "diet_tags": ["non-vegan", "high-protein", "gluten-free", "dairy", "gourmet"],
-        "cook_time": 25,
-        "nutrition": {"calories": 520, "protein": 30, "carbs": 12, "fat": 40},
-        "cost_rating": 5,
-        "meal_prep_friendly": False,
-        "health_score": 6,
-        "equipment_needed": ["skillet", "salad bowl"],
-        "freezer_friendly": False,
-        "servings": 2,
-    },
-    {
-        "name": "Gigot d'Agneau",
-        "ingredients": [
-            "leg of lamb",
-            "rosemary",
-            "garlic",
-            "white wine",
-            "potatoes",
-            "olive oil",
-        ],
-        "cuisine": "French",
-        "diet_tags": [
-            "non-vegan",
-            "high-protein",
-            "gluten-free",
-            "roasted",
-            "special-occasion",
-        ],
-        "cook_time": 180,
-        "nutrition": {"calories": 420, "protein": 38, "carbs": 20, "fat": 22},
-        "cost_rating": 5,
-        "meal_prep_friendly": True,
-        "health_score": 7,
-        "equipment_needed": ["roasting pan", "meat thermometer"],
-        "freezer_friendly": True,
-        "servings": 6,
-    },
-    {
-        "name": "Tarte aux Poireaux",
-        "ingredients": [
-            "leeks",
-            "puff pastry",
-            "crème fraîche",
-            "eggs",
-            "nutmeg",
-            "gruyère cheese",
-        ],
-        "cuisine": "French",
-        "diet_tags": [
-            "vegetarian",
-            "gluten-containing",
-            "dairy",
-            "savory-tart",
-            "high-calorie",
-        ],
-        "cook_time": 50,
-        "nutrition": {"calories": 380, "protein": 12, "carbs": 30, "fat": 25},
-        "cost_rating": 3,
-        "meal_prep_friendly": True,
-        "health_score": 6,
-        "equipment_needed": ["tart pan", "oven"],
-        "freezer_friendly": True,
-        "servings": 6,
-    },
-    {
-        "name": "Soupe à l'Oignon",
-        "ingredients": [
-            "onions",
-            "beef stock",
-            "white wine",
-            "baguette",
-            "gruyère cheese",
-        ],
-        "cuisine": "French",
-        "diet_tags": [
-            "vegetarian-option",
-            "gluten-containing",
-            "dairy",
-            "high-sodium",
-            "comfort-food",
-        ],
-        "cook_time": 60,
-        "nutrition": {"calories": 320, "protein": 15, "carbs": 30, "fat": 16},
-        "cost_rating": 2,
-        "meal_prep_friendly": True,
-        "health_score": 6,
-        "equipment_needed": ["soup pot", "oven-safe bowls"],
-        "freezer_friendly": True,
-        "servings": 6,
-    },
-    {
-        "name": "Saltimbocca alla Romana",
-        "ingredients": ["veal cutlets", "prosciutto", "sage", "white wine", "butter"],
-        "cuisine": "Italian",
-        "diet_tags": [
-            "non-vegan",
-            "high-protein",
-            "gluten-free",
-            "dairy",
-            "quick-meal",
-        ],
-        "cook_time": 20,
-        "nutrition": {"calories": 320, "protein": 30, "carbs": 2, "fat": 20},
-        "cost_rating": 4,
-        "meal_prep_friendly": False,
-        "health_score": 7,
-        "equipment_needed": ["skillet", "meat mallet"],
-        "freezer_friendly": False,
-        "servings": 4,
-    },
-    {
-        "name": "Pappa al Pomodoro",
-        "ingredients": [
-            "stale bread",
-            "tomatoes",
-            "garlic",
-            "basil",
-            "olive oil",
-            "vegetable stock",
-        ],
-        "cuisine": "Italian",
-        "diet_tags": [
-            "vegetarian",
-            "vegan-option",
-            "gluten-free-option",
-            "high-fiber",
-            "comfort-food",
-        ],
-        "cook_time": 40,
-        "nutrition": {"calories": 280, "protein": 6, "carbs": 35, "fat": 12},
-        "cost_rating": 1,
-        "meal_prep_friendly": True,
-        "health_score": 7,
-        "equipment_needed": ["soup pot", "wooden spoon"],
-        "freezer_friendly": True,
-        "servings": 6,
-    },
-    {
-        "name": "Arancini",
-        "ingredients": [
-            "risotto",
-            "mozzarella",
-            "breadcrumbs",
-            "egg",
-            "marinara sauce",
-        ],
-        "cuisine": "Italian",
-        "diet_tags": ["vegetarian", "gluten-containing", "dairy", "fried", "appetizer"],
-        "cook_time": 30,
-        "nutrition": {"calories": 280, "protein": 10, "carbs": 30, "fat": 12},
-        "cost_rating": 2,
-        "meal_prep_friendly": True,
-        "health_score": 5,
-        "equipment_needed": ["deep fryer", "mixing bowl"],
-        "freezer_friendly": True,
-        "servings": 6,
-    },
-    {
-        "name": "Ribolita",
-        "ingredients": [
-            "cannellini beans",
-            "kale",
-            "bread",
-            "tomatoes",
-            "carrots",
-            "celery",
-            "onion",
-            "parmesan",
-        ],
-        "cuisine": "Italian",
-        "diet_tags": [
-            "vegetarian",
-            "gluten-free-option",
-            "high-fiber",
-            "low-fat",
-            "one-pot-meal",
-        ],
-        "cook_time": 60,
-        "nutrition": {"calories": 280, "protein": 12, "carbs": 45, "fat": 6},
-        "cost_rating": 1,
-        "meal_prep_friendly": True,
-        "health_score": 9,
-        "equipment_needed": ["soup pot", "ladle"],
-        "freezer_friendly": True,
-        "servings": 8,
-    },
-    {
-        "name": "Tiramisu",
-        "ingredients": [
-            "ladyfingers",
-            "mascarpone",
-            "eggs",
-            "espresso",
-            "cocoa powder",
-            "marsala wine",
-        ],
-        "cuisine": "Italian",
-        "diet_tags": [
-            "vegetarian",
-            "gluten-containing",
-            "dairy",
-            "high-sugar",
-            "dessert",
-        ],
-        "cook_time": 30,
-        "nutrition": {"calories": 420, "protein": 8, "carbs": 40, "fat": 25},
-        "cost_rating": 3,
-        "meal_prep_friendly": True,
-        "health_score": 4,
-        "equipment_needed": ["mixing bowls", "whisk", "baking dish"],
-        "freezer_friendly": False,
-        "servings": 8,
-    },
-    {
-        "name": "Kousa Mahshi",
-        "ingredients": [
-            "zucchini",
-            "ground lamb",
-            "rice",
-            "tomatoes",
-            "mint",
-            "lemon juice",
-            "garlic",
-        ],
-        "cuisine": "Middle eastern",
-        "diet_tags": [
-            "non-vegan",
-            "high-protein",
-            "gluten-free",
-            "stuffed-vegetables",
-            "one-pot-meal",
-        ],
-        "cook_time": 90,
-        "nutrition": {"calories": 320, "protein": 20, "carbs": 25, "fat": 16},
-        "cost_rating": 2,
-        "meal_prep_friendly": True,
-        "health_score": 8,
-        "equipment_needed": ["pot", "knife"],
-        "freezer_friendly": True,
-        "servings": 6,
-    },
-    {
-        "name": "Fatteh",
-        "ingredients": [
-            "chickpeas",
-            "yogurt",
-            "pita bread",
-            "pine nuts",
-            "garlic",
-            "tahini",
-            "butter",
-        ],
-        "cuisine": "Middle eastern",
-        "diet_tags": [
-            "vegetarian",
-            "gluten-containing",
-            "dairy",
-            "high-protein",
-            "comfort-food",
-        ],
-        "cook_time": 30,
-        "nutrition": {"calories": 380, "protein": 15, "carbs": 35, "fat": 20},
-        "cost_rating": 2,
-        "meal_prep_friendly": True,
-        "health_score": 7,
-        "equipment_needed": ["skillet", "mixing bowl"],
-        "freezer_friendly": True,
-        "servings": 6,
-    },
-    {
-        "name": "Mulukhiyah",
-        "ingredients": [
-            "jute leaves",
-            "chicken",
-            "garlic",
-            "coriander",
-            "lemon juice",
-            "rice",
-        ],
-        "cuisine": "Middle eastern",
-        "diet_tags": ["non-vegan", "high-protein", "gluten-free", "high-iron", "stew"],
-        "cook_time": 60,
-        "nutrition": {"calories": 280, "protein": 25, "carbs": 20, "fat": 12},
-        "cost_rating": 2,
-        "meal_prep_friendly": True,
-        "health_score": 8,
-        "equipment_needed": ["pot", "ladle"],
-        "freezer_friendly": True,
-        "servings": 6,
-    },
-    {
-        "name": "Sfiha",
-        "ingredients": [
-            "dough",
-            "ground lamb",
-            "tomatoes",
-            "onion",
-            "pine nuts",
-            "yogurt sauce",
-        ],
-        "cuisine": "Middle eastern",
-        "diet_tags": [
-            "non-vegan",
-            "high-protein",
-            "gluten-containing",
-            "dairy-option",
-            "savory-pastry",
-        ],
-        "cook_time": 40,
-        "nutrition": {"calories": 280, "protein": 15, "carbs": 25, "fat": 14},
-        "cost_rating": 2,
-        "meal_prep_friendly": True,
-        "health_score": 6,
-        "equipment_needed": ["oven", "baking sheet"],
-        "freezer_friendly": True,
-        "servings": 6,
-    },
-    {
-        "name": "Qatayef",
-        "ingredients": [
-            "flour",
-            "yeast",
-            "sugar",
-            "water",
-            "ricotta",
-            "pistachios",
-            "rose water",
-        ],
-        "cuisine": "Middle eastern",
-        "diet_tags": [
-            "vegetarian",
-            "gluten-containing",
-            "dairy",
-            "high-sugar",
-            "ramadan-special",
-        ],
-        "cook_time": 45,
-        "nutrition": {"calories": 250, "protein": 6, "carbs": 35, "fat": 10},
-        "cost_rating": 2,
-        "meal_prep_friendly": True,
-        "health_score": 4,
-        "equipment_needed": ["griddle", "mixing bowl"],
-        "freezer_friendly": True,
-        "servings": 12,
-    },
-    {
-        "name": "Buffalo Chicken Dip",
-        "ingredients": [
-            "chicken breast",
-            "cream cheese",
-            "hot sauce",
-            "cheddar cheese",
-            "blue cheese dressing",
-            "tortilla chips",
-        ],
-        "cuisine": "American",
-        "diet_tags": [
-            "non-vegan",
-            "high-protein",
-            "gluten-free",
-            "dairy",
-            "high-calorie",
-        ],
-        "cook_time": 30,
-        "nutrition": {"calories": 320, "protein": 18, "carbs": 10, "fat": 24},
-        "cost_rating": 2,
-        "meal_prep_friendly": True,
-        "health_score": 4,
-        "equipment_needed": ["baking dish", "mixing bowl"],
-        "freezer_friendly": True,
-        "servings": 8,
-    },
-    {
-        "name": "Corn Dog",
-        "ingredients": ["hot dogs", "cornmeal batter", "flour", "egg", "milk", "oil"],
-        "cuisine": "American",
-        "diet_tags": ["non-vegan", "gluten-containing", "dairy", "fried", "fair-food"],
-        "cook_time": 15,
-        "nutrition": {"calories": 330, "protein": 10, "carbs": 35, "fat": 18},
-        "cost_rating": 1,
-        "meal_prep_friendly": False,
-        "health_score": 3,
-        "equipment_needed": ["deep fryer", "skewers"],
-        "freezer_friendly": True,
-        "servings": 6,
-    },
-    {
-        "name": "Petit Salé aux Lentilles",
-        "ingredients": [
-            "salt pork",
-            "lentils",
-            "carrots",
-            "onions",
-            "thyme",
-            "bay leaf",
-        ],
-        "cuisine": "French",
-        "diet_tags": [
-            "non-vegan",
-            "high-protein",
-            "gluten-free",
-            "high-fiber",
-            "comfort-food",
-        ],
-        "cook_time": 120,
-        "nutrition": {"calories": 420, "protein": 30, "carbs": 35, "fat": 18},
-        "cost_rating": 2,
-        "meal_prep_friendly": True,
-        "health_score": 7,
-        "equipment_needed": ["dutch oven", "wooden spoon"],
-        "freezer_friendly": True,
-        "servings": 6,
-    },
-    {
-        "name": "Tarte Tropézienne",
-        "ingredients": [
-            "brioche dough",
-            "pastry cream",
-            "whipped cream",
-            "sugar",
-            "vanilla",
-        ],
-        "cuisine": "French",
-        "diet_tags": [
-            "vegetarian",
-            "gluten-containing",
-            "dairy",
-            "high-sugar",
-            "dessert",
-        ],
-        "cook_time": 60,
-        "nutrition": {"calories": 380, "protein": 7, "carbs": 45, "fat": 20},
-        "cost_rating": 3,
-        "meal_prep_friendly": True,
-        "health_score": 4,
-        "equipment_needed": ["baking sheet", "mixer"],
-        "freezer_friendly": True,
-        "servings": 8,
-    },
-    {
-        "name": "Pizzoccheri",
-        "ingredients": [
-            "buckwheat pasta",
-            "potatoes",
-            "cabbage",
-            "fontina cheese",
-            "garlic",
-            "butter",
-        ],
-        "cuisine": "Italian",
-        "diet_tags": ["vegetarian", "gluten-free", "dairy", "high-carb", "alpine-dish"],
-        "cook_time": 45,
-        "nutrition": {"calories": 520, "protein": 20, "carbs": 60, "fat": 22},
-        "cost_rating": 2,
-        "meal_prep_friendly": True,
-        "health_score": 6,
-        "equipment_needed": ["pot", "skillet"],
-        "freezer_friendly": True,
-        "servings": 6,
-    },
-    {
-        "name": "Sbrisolona",
-        "ingredients": [
-            "cornmeal",
-            "almonds",
-            "butter",
-            "sugar",
-            "egg yolks",
-            "vanilla",
-        ],
-        "cuisine": "Italian",
-        "diet_tags": [
-            "vegetarian",
-            "gluten-free",
-            "nut-containing",
-            "high-sugar",
-            "cookie",
-        ],
-        "cook_time": 40,
-        "nutrition": {"calories": 280, "protein": 5, "carbs": 30, "fat": 16},
-        "cost_rating": 2,
-        "meal_prep_friendly": True,
-        "health_score": 4,
-        "equipment_needed": ["baking pan", "mixing bowl"],
-        "freezer_friendly": True,
-        "servings": 12,
-    },
-    {
-        "name": "Shanklish",
-        "ingredients": [
-            "aged cheese",
-            "thyme",
-            "olive oil",
-            "tomatoes",
-            "onion",
-            "pita bread",
-        ],
-        "cuisine": "Middle eastern",
-        "diet_tags": [
-            "vegetarian",
-            "gluten-containing",
-            "dairy",
-            "high-protein",
-            "appetizer",
-        ],
-        "cook_time": 10,
-        "nutrition": {"calories": 220, "protein": 12, "carbs": 15, "fat": 14},
-        "cost_rating": 2,
-        "meal_prep_friendly": True,
-        "health_score": 6,
-        "equipment_needed": ["mixing bowl", "knife"],
-        "freezer_friendly": True,
-        "servings": 6,
-    },
-    {
-        "name": "Qidreh",
-        "ingredients": [
-            "lamb shank",
-            "chickpeas",
-            "rice",
-            "cardamom",
-            "onions",
-            "garlic",
-        ],
-        "cuisine": "Middle eastern",
-        "diet_tags": [
-            "non-vegan",
-            "high-protein",
-            "gluten-free",
-            "slow-cooked",
-            "festive",
-        ],
-        "cook_time": 180,
-        "nutrition": {"calories": 550, "protein": 40, "carbs": 45, "fat": 25},
-        "cost_rating": 3,
-        "meal_prep_friendly": True,
-        "health_score": 7,
-        "equipment_needed": ["clay pot", "oven"],
-        "freezer_friendly": True,
-        "servings": 8,
-    },
-    {
-        "name": "Ultimate Protein Bowl",
-        "ingredients": [
-            "grilled chicken breast",
-            "egg whites",
-            "Greek yogurt",
-            "quinoa",
-            "broccoli",
-        ],
-        "cuisine": "American",
-        "nutrition": {"calories": 400, "protein": 50, "carbs": 30, "fat": 10},
-        "cook_time": 20,
-        "diet_tags": ["high-protein", "low-fat", "gluten-free"],
-        "cost_rating": 3,
-        "health_score": 9,
-        "meal_prep_friendly": True,
-        "equipment_needed": ["mixing bowl"],
-        "freezer_friendly": False,
-        "servings": 1,
-    },
-]
-
+# Recipes live in data/recipes.jsonl and are read through data.loader
 
 # Available Cuisines
 CUISINES = [
@@ -3504,3 +10,67 @@ CUISINES = [
 
 # Available Diet Tags
 DIETARY_TAGS = ["non-vegan", "vegan", "vegetarian", "gluten-free", "high-protein"]
+
+# Ingredient hierarchy, parent -> children. Avoiding or including a node covers
+# every ingredient containing the node's name or any descendant's name as whole
+# words, so "cheese" covers "feta cheese" and "dairy" covers both.
+INGREDIENT_TAXONOMY = {
+    "dairy": [
+        "cheese",
+        "milk",
+        "buttermilk",
+        "cream",
+        "creme fraiche",
+        "butter",
+        "ghee",
+        "yogurt",
+        "custard",
+    ],
+    "cheese": ["mozzarella", "parmesan", "pecorino", "ricotta", "mascarpone"],
+    "egg": ["mayonnaise", "custard"],
+    "meat": ["poultry", "beef", "veal", "pork", "lamb"],
+    "poultry": ["chicken", "turkey", "duck", "foie gras"],
+    "beef": ["corned beef", "cube steak", "ribeye steak"],
+    "pork": ["bacon", "ham", "pancetta", "guanciale", "prosciutto", "sausage"],
+    "sausage": ["hot dog"],
+    "seafood": ["fish", "shellfish"],
+    "fish": ["anchovy", "tuna"],
+    "shellfish": ["shrimp", "clam", "mussel", "lobster", "calamari"],
+    "nut": ["almond", "hazelnut", "pecan", "pistachio", "walnut"],
+    "gluten": [
+        "flour",
+        "bread",
+        "baguette",
+        "breadcrumb",
+        "crouton",
+        "bun",
+        "roll",
+        "dough",
+        "puff pastry",
+        "pie crust",
+        "pasta",
+        "spaghetti",
+        "bucatini",
+        "gnocchi",
+        "semolina",
+        "bulgur",
+        "couscous",
+        "wheat",
+        "graham cracker",
+        "ladyfinger",
+        "sponge cake",
+        "waffle mix",
+    ],
+}
+
+
+def __getattr__(name):
+    # RECIPES used to be a literal here; load it on first access instead so
+    # importing CUISINES/DIETARY_TAGS stays cheap.
+    if name == "RECIPES":
+        from data.loader import load_recipes
+
+        recipes = globals()["RECIPES"] = load_recipes()
+        return recipes
+
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
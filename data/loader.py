@@ -0,0 +1,26 @@
+import json
+from pathlib import Path
+
+from engine.recipe import Recipe
+
+
+CATALOG_PATH = Path(__file__).with_name("recipes.jsonl")
+
+
+def iter_recipes(path=CATALOG_PATH):
+    """Yield Recipe records from a JSONL catalog, one line at a time."""
+    with open(path, encoding="utf-8") as catalog:
+        for line_number, line in enumerate(catalog, 1):
+            line = line.strip()
+            if not line:
+                continue
+
+            try:
+                recipe = Recipe.from_dict(json.loads(line))
+            except (ValueError, KeyError, TypeError) as exc:
+                raise ValueError(f"{path}:{line_number}: invalid recipe ({exc!r})")
+            yield recipe
+
+
+def load_recipes(path=CATALOG_PATH):
+    return list(iter_recipes(path))
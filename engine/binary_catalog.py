@@ -0,0 +1,363 @@
+import json
+import mmap
+import struct
+import sys
+from array import array
+from itertools import chain
+
+from engine.catalog import FLAG_FIELDS, NUMERIC_FIELDS, RANGE_FIELDS, RecipeCatalog
+from engine.cache import ResultCache
+from engine.index import BITMAP_CACHE_SIZE, InvertedIndex, SortedIndex
+from engine.scoring import FEATURE_FIELDS, ScoreTable
+from engine.taxonomy import DEFAULT_TAXONOMY
+from engine.vocabulary import Vocabulary
+
+
+MAGIC = b"RECIPES\x05"
+BINARY_SUFFIX = ".rcat"
+
+LIST_FIELDS = ("ingredients", "diet_tags", "equipment")
+
+# Inverted indexes keyed by normalized string, by section name
+KEYED_INDEXES = {
+    "diet_tags": "diet_tag_index",
+    "cuisine": "cuisine_index",
+    "equipment": "equipment_index",
+}
+
+# Every section starts on an 8-byte boundary so the typed views are aligned
+ALIGNMENT = 8
+
+_HEADER = struct.Struct("<8sI")
+
+
+def _score_section(kind, key):
+    category, health_focus = key
+    return f"{kind}.{category}.{health_focus or ''}"
+
+
+def _index_sections(sections, name, postings):
+    offsets, ids = array("q", [0]), array("i")
+    for recipe_ids in postings:
+        ids.extend(recipe_ids)
+        offsets.append(len(ids))
+    sections[f"index.{name}.offsets"] = offsets
+    sections[f"index.{name}.ids"] = ids
+
+
+def write_binary_catalog(recipes, path):
+    """Write `recipes` in the memory-mappable layout MappedCatalog reads.
+
+    The file is a small JSON header describing each section followed by the
+    sections themselves: fixed-width numeric columns, a string table with its
+    offsets, per-recipe offset/value arrays for the list fields, the
+    precomputed ScoreTable columns, the ingredient vocabulary, the posting
+    lists of every inverted index and the sort order of every range index.
+    Recipes are clustered by cook_time and cuisine so zone maps over the
+    mapped columns can skip whole blocks.
+    """
+    catalog = RecipeCatalog(recipes, cluster=True)
+    strings = {}
+
+    def string_id(value):
+        return strings.setdefault(value, len(strings))
+
+    sections = {
+        "name": array("i", map(string_id, catalog.names)),
+        "cuisine": array("i", map(string_id, catalog.cuisines)),
+        "has_health_score": catalog.has_health_score,
+        "order": catalog.order,
+    }
+    for field in (*NUMERIC_FIELDS, *FLAG_FIELDS, *FEATURE_FIELDS):
+        sections[field] = getattr(catalog, field)
+
+    for field in LIST_FIELDS:
+        offsets, values = array("q", [0]), array("i")
+        for items in getattr(catalog, field):
+            values.extend(map(string_id, items))
+            offsets.append(len(values))
+        sections[f"{field}.offsets"] = offsets
+        sections[f"{field}.values"] = values
+
+    for key, column in catalog.score_table.columns.items():
+        sections[_score_section("score", key)] = column
+        sections[_score_section("ranking", key)] = catalog.score_table.ranking_for(key)
+
+    # Ingredients are indexed by vocabulary id, so their posting lists are
+    # stored in id order and need no keys
+    vocabulary = catalog.ingredient_vocabulary
+    sections["vocabulary.terms"] = array("i", map(string_id, vocabulary.terms))
+    sections["ingredients.terms"] = array(
+        "i", chain.from_iterable(catalog.ingredient_ids)
+    )
+    postings = map(catalog.ingredient_index.get, range(len(vocabulary)))
+    _index_sections(sections, "ingredients", postings)
+
+    for name, attribute in KEYED_INDEXES.items():
+        index = getattr(catalog, attribute)
+        sections[f"index.{name}.keys"] = array("i", map(string_id, index))
+        _index_sections(sections, name, map(index.get, index))
+
+    # The same stable order SortedIndex builds, so ties come out alike
+    for field in RANGE_FIELDS:
+        column = getattr(catalog, field)
+        sections[f"sorted.{field}"] = array(
+            "i", sorted(range(len(column)), key=column.__getitem__)
+        )
+
+    blob = bytearray()
+    string_offsets = array("q", [0])
+    for value in strings:
+        blob += value.encode("utf-8")
+        string_offsets.append(len(blob))
+    sections["strings.offsets"] = string_offsets
+    sections["strings.data"] = array("B", blob)
+
+    layout, position = {}, 0
+    for name, values in sections.items():
+        position += -position % ALIGNMENT
+        size = len(values) * values.itemsize
+        layout[name] = [position, size, values.typecode]
+        position += size
+
+    header = json.dumps(
+        {"count": len(catalog), "byteorder": sys.byteorder, "sections": layout}
+    ).encode()
+    data_start = _HEADER.size + len(header)
+    data_start += -data_start % ALIGNMENT
+
+    with open(path, "wb") as out:
+        out.write(_HEADER.pack(MAGIC, len(header)))
+        out.write(header)
+        out.write(b"\0" * (data_start - out.tell()))
+        for name, values in sections.items():
+            out.write(b"\0" * (data_start + layout[name][0] - out.tell()))
+            values.tofile(out)
+
+
+class _StringTable:
+    def __init__(self, data, offsets):
+        self.data = data
+        self.offsets = offsets
+
+    def __len__(self):
+        return len(self.offsets) - 1
+
+    def __getitem__(self, string_id):
+        start, end = self.offsets[string_id], self.offsets[string_id + 1]
+        return str(self.data[start:end], "utf-8")
+
+
+class _StringColumn:
+    """Read-only `column[recipe_id] -> str` over a string id column."""
+
+    def __init__(self, ids, strings):
+        self.ids = ids
+        self.strings = strings
+
+    def __len__(self):
+        return len(self.ids)
+
+    def __getitem__(self, recipe_id):
+        return self.strings[self.ids[recipe_id]]
+
+
+class _ListColumn:
+    """Read-only `column[recipe_id] -> tuple` over offset/value arrays, with
+    each value looked up in `strings` when given."""
+
+    def __init__(self, offsets, values, strings=None):
+        self.offsets = offsets
+        self.values = values
+        self.strings = strings
+
+    def __len__(self):
+        return len(self.offsets) - 1
+
+    def __getitem__(self, recipe_id):
+        ids = self.values[self.offsets[recipe_id] : self.offsets[recipe_id + 1]]
+        if self.strings is None:
+            return tuple(ids)
+        return tuple(self.strings[string_id] for string_id in ids)
+
+
+class _SortedValues:
+    """Read-only `values[i] -> column[ids[i]]`, so a range index can bisect a
+    mapped sort order without copying the column."""
+
+    def __init__(self, column, ids):
+        self.column = column
+        self.ids = ids
+
+    def __len__(self):
+        return len(self.ids)
+
+    def __getitem__(self, i):
+        return self.column[self.ids[i]]
+
+
+class _MappedIndex(InvertedIndex):
+    """Read-only InvertedIndex over offset/id arrays.
+
+    The posting list at position `i` is `ids[offsets[i] : offsets[i + 1]]`.
+    `keys` maps each key to its position; without it the keys are the
+    positions themselves.
+    """
+
+    def __init__(self, offsets, ids, keys=None, cache_size=BITMAP_CACHE_SIZE):
+        self.offsets = offsets
+        self.ids = ids
+        self.keys = keys
+        self.version = 0
+        self._bitmaps = ResultCache(cache_size)
+
+    def __iter__(self):
+        if self.keys is None:
+            return iter(range(len(self.offsets) - 1))
+        return iter(self.keys)
+
+    def items(self):
+        for key in self:
+            yield key, self.get(key)
+
+    def add(self, recipe_id, keys):
+        raise TypeError("MappedCatalog is read-only")
+
+    def get(self, key):
+        if self.keys is None:
+            position = key if 0 <= key < len(self.offsets) - 1 else None
+        else:
+            position = self.keys.get(key)
+        if position is None:
+            return ()
+        return self.ids[self.offsets[position] : self.offsets[position + 1]]
+
+
+class _MappedVocabulary(Vocabulary):
+    """Read-only Vocabulary over a column of its terms."""
+
+    def __init__(self, terms):
+        super().__init__()
+        self.terms = terms
+
+    def add(self, name):
+        raise TypeError("MappedCatalog is read-only")
+
+
+class MappedCatalog(RecipeCatalog):
+    """Read-only RecipeCatalog backed by a memory-mapped binary file.
+
+    Opening only parses the header: numeric and score columns are memoryviews
+    straight into the page cache, which every process mapping the same file
+    shares, and strings are decoded when a recipe is displayed. The ingredient
+    vocabulary, posting lists, score rankings and cook_time order are mapped
+    the same way. Each process still builds its own taxonomy bitmaps (a bit
+    per recipe for every taxonomy node), zone map and caches, on first use.
+    """
+
+    def __init__(self, path, taxonomy=DEFAULT_TAXONOMY):
+        with open(path, "rb") as source:
+            self._mmap = mmap.mmap(source.fileno(), 0, access=mmap.ACCESS_READ)
+
+        magic, header_size = _HEADER.unpack_from(self._mmap)
+        if magic != MAGIC:
+            raise ValueError(f"{path} is not a binary recipe catalog")
+
+        header = json.loads(self._mmap[_HEADER.size : _HEADER.size + header_size])
+        if header["byteorder"] != sys.byteorder:
+            raise ValueError(
+                f"{path} was written on a {header['byteorder']}-endian host"
+            )
+
+        data_start = _HEADER.size + header_size
+        data_start += -data_start % ALIGNMENT
+        view = memoryview(self._mmap)
+
+        sections = {}
+        for name, (offset, size, typecode) in header["sections"].items():
+            start = data_start + offset
+            sections[name] = view[start : start + size].cast(typecode)
+
+        self._count = header["count"]
+        self.version = 0
+
+        for field in (
+            *NUMERIC_FIELDS,
+            *FLAG_FIELDS,
+            *FEATURE_FIELDS,
+            "has_health_score",
+            "order",
+        ):
+            setattr(self, field, sections[field])
+
+        strings = _StringTable(sections["strings.data"], sections["strings.offsets"])
+        self.names = _StringColumn(sections["name"], strings)
+        self.cuisines = _StringColumn(sections["cuisine"], strings)
+        for field in LIST_FIELDS:
+            setattr(
+                self,
+                field,
+                _ListColumn(
+                    sections[f"{field}.offsets"], sections[f"{field}.values"], strings
+                ),
+            )
+
+        self.score_table = ScoreTable(self)
+        self.score_table.columns = {
+            key: sections[_score_section("score", key)] for key in ScoreTable.KEYS
+        }
+        self.score_table.rankings = {
+            key: sections[_score_section("ranking", key)] for key in ScoreTable.KEYS
+        }
+
+        self.ingredient_vocabulary = _MappedVocabulary(
+            _StringColumn(sections["vocabulary.terms"], strings)
+        )
+        self.ingredient_ids = _ListColumn(
+            sections["ingredients.offsets"], sections["ingredients.terms"]
+        )
+        self.ingredient_index = _MappedIndex(
+            sections["index.ingredients.offsets"], sections["index.ingredients.ids"]
+        )
+        for name, attribute in KEYED_INDEXES.items():
+            keys = map(strings.__getitem__, sections[f"index.{name}.keys"])
+            index = _MappedIndex(
+                sections[f"index.{name}.offsets"],
+                sections[f"index.{name}.ids"],
+                {key: position for position, key in enumerate(keys)},
+            )
+            setattr(self, attribute, index)
+
+        self.range_indexes = {}
+        for field in RANGE_FIELDS:
+            index = self.range_indexes[field] = SortedIndex(getattr(self, field))
+            index.ids = sections[f"sorted.{field}"]
+            index.values = _SortedValues(index.column, index.ids)
+
+        self.taxonomy = taxonomy
+        self._taxonomy_bitmaps = {}
+        self._taxonomy_version = None
+        self._statistics = None
+        self._zone_map = None
+
+    def __len__(self):
+        return self._count
+
+    @property
+    def all_bitmap(self):
+        return (1 << self._count) - 1
+
+    def add(self, recipe):
+        raise TypeError("MappedCatalog is read-only")
+
+    def extend(self, recipes):
+        raise TypeError("MappedCatalog is read-only")
+
+
+if __name__ == "__main__":
+    from data.loader import iter_recipes
+
+    if len(sys.argv) != 3:
+        sys.exit("usage: python -m engine.binary_catalog RECIPES.jsonl OUT.rcat")
+
+    write_binary_catalog(iter_recipes(sys.argv[1]), sys.argv[2])
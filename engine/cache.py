@@ -0,0 +1,74 @@
+from collections import OrderedDict
+
+
+def preferences_key(preferences, k=None):
+    """Canonical, hashable form of a preferences dict.
+
+    List values are lowercased and sorted, so the same wizard answers given in
+    another order or case map to the same key.
+    """
+    items = []
+    for name, value in preferences.items():
+        if isinstance(value, (list, tuple, set, frozenset)):
+            value = tuple(
+                sorted(
+                    {v.strip().lower() if isinstance(v, str) else v for v in value}
+                )
+            )
+        items.append((name, value))
+    return tuple(sorted(items)), k
+
+
+class ResultCache:
+    """Bounded LRU cache of recommendation results, or anything else derived
+    from versioned state.
+
+    Entries are tied to the catalog version they were computed against and
+    the whole cache is dropped as soon as that version moves on. Entries put
+    without a version never go stale and only leave by eviction.
+    """
+
+    def __init__(self, maxsize=256):
+        self.maxsize = maxsize
+        self.version = None
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def get(self, key, version=None):
+        if version != self.version:
+            self.clear()
+            self.version = version
+
+        try:
+            value = self._entries[key]
+        except KeyError:
+            self.misses += 1
+            return None
+
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def put(self, key, value, version=None):
+        if self.maxsize <= 0 or version != self.version:
+            return
+
+        self._entries[key] = value
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def clear(self):
+        self._entries.clear()
+
+    def info(self):
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "size": len(self._entries),
+            "maxsize": self.maxsize,
+        }
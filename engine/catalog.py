@@ -0,0 +1,247 @@
+from array import array
+from sys import intern
+
+from engine.index import InvertedIndex, SortedIndex, normalize_key
+from engine.recipe import Nutrition, Recipe
+from engine.scoring import FEATURE_FIELDS, ScoreTable, extract_features
+from engine.statistics import CatalogStatistics
+from engine.taxonomy import DEFAULT_TAXONOMY
+from engine.vocabulary import Vocabulary
+from engine.zonemap import ZoneMap
+
+
+# Doubles, so fractional values ("protein": 30.5) and any rating load as given
+NUMERIC_FIELDS = {
+    "cook_time": "d",
+    "calories": "d",
+    "protein": "d",
+    "carbs": "d",
+    "fat": "d",
+    "cost_rating": "d",
+    "health_score": "d",
+    "servings": "d",
+}
+
+FLAG_FIELDS = ("meal_prep_friendly", "freezer_friendly")
+
+NUTRITION_FIELDS = ("calories", "protein", "carbs", "fat")
+
+# Numeric fields a query filters on by range, each with a SortedIndex
+RANGE_FIELDS = ("cook_time",)
+
+
+class RecipeCatalog:
+    """Column-oriented recipe store.
+
+    Numeric fields and flags live in typed arrays indexed by recipe id, so a
+    scan reads contiguous memory instead of chasing nested dicts. Recipe
+    records are only rebuilt on demand, for display.
+    """
+
+    def __init__(self, recipes=(), taxonomy=DEFAULT_TAXONOMY, cluster=False):
+        self.names = []
+        self.cuisines = []
+        self.ingredients = []
+        self.ingredient_ids = []
+        self.diet_tags = []
+        self.equipment = []
+
+        for field, typecode in NUMERIC_FIELDS.items():
+            setattr(self, field, array(typecode))
+        for field in FLAG_FIELDS:
+            setattr(self, field, array("b"))
+        for field, typecode in FEATURE_FIELDS.items():
+            setattr(self, field, array(typecode))
+
+        # health_score is optional in the source data and only scores when set
+        self.has_health_score = array("b")
+
+        # Position each recipe was given in, which ties are broken by. It only
+        # differs from the id once a load has been clustered.
+        self.order = array("q")
+
+        # Bumped on every change so derived state (caches) can tell it is stale
+        self.version = 0
+
+        # Ingredients are indexed by vocabulary id, not by name
+        self.ingredient_vocabulary = Vocabulary()
+        self.ingredient_index = InvertedIndex()
+        self.diet_tag_index = InvertedIndex()
+        self.cuisine_index = InvertedIndex()
+        self.equipment_index = InvertedIndex()
+        self.range_indexes = {
+            field: SortedIndex(getattr(self, field)) for field in RANGE_FIELDS
+        }
+
+        self.score_table = ScoreTable(self)
+
+        self.taxonomy = taxonomy
+        self._taxonomy_bitmaps = {}
+        self._taxonomy_version = None
+        self._statistics = None
+        self._zone_map = None
+
+        self.extend(recipes, cluster=cluster)
+
+    def __len__(self):
+        return len(self.names)
+
+    @property
+    def all_bitmap(self):
+        return (1 << len(self.names)) - 1
+
+    def extend(self, recipes, cluster=False):
+        """Add `recipes`; with `cluster` they are stored sorted by cook_time and
+        cuisine, which lets zone maps skip whole blocks, but keep their given
+        order for tie-breaks."""
+        recipes = enumerate(recipes, len(self))
+        if cluster:
+            recipes = sorted(recipes, key=lambda item: _cluster_key(item[1]))
+
+        for order, recipe in recipes:
+            self.add(recipe, order)
+        self.score_table.refresh()
+        self.taxonomy_bitmaps()
+
+    def add(self, recipe, order=None):
+        recipe_id = len(self.names)
+
+        # Read and check everything first, so a bad recipe raises before any
+        # column has grown and the catalog stays consistent
+        numbers = numeric_values(recipe)
+        name = recipe["name"]
+        cuisine = intern(recipe["cuisine"])
+        ingredients = tuple(map(intern, recipe["ingredients"]))
+        diet_tags = tuple(map(intern, recipe["diet_tags"]))
+        equipment = tuple(map(intern, recipe.get("equipment_needed", ())))
+        features = extract_features(recipe)
+
+        self.names.append(name)
+        self.cuisines.append(cuisine)
+        self.ingredients.append(ingredients)
+        self.ingredient_ids.append(
+            tuple(map(self.ingredient_vocabulary.add, ingredients))
+        )
+        self.diet_tags.append(diet_tags)
+        self.equipment.append(equipment)
+
+        for field, value in numbers.items():
+            getattr(self, field).append(value)
+        self.has_health_score.append("health_score" in recipe)
+        self.order.append(recipe_id if order is None else order)
+
+        for field in FLAG_FIELDS:
+            getattr(self, field).append(bool(recipe.get(field, False)))
+        for field, value in features.items():
+            getattr(self, field).append(value)
+
+        self.ingredient_index.add(recipe_id, self.ingredient_ids[recipe_id])
+        self.diet_tag_index.add(recipe_id, map(normalize_key, diet_tags))
+        self.cuisine_index.add(recipe_id, (normalize_key(cuisine),))
+        self.equipment_index.add(recipe_id, map(normalize_key, equipment))
+
+        self.version += 1
+
+        return recipe_id
+
+    def taxonomy_bitmaps(self):
+        """Recipe bitmap of every taxonomy node, covering its whole subtree.
+
+        Built once per catalog version, so a node costs one lookup per query.
+        """
+        if self._taxonomy_version != self.version:
+            closure = self.taxonomy.closure
+            vocabulary = self.ingredient_vocabulary
+            # Resolve every name in one pass; the per-node calls hit the cache
+            vocabulary.match(set().union(*closure.values()))
+            self._taxonomy_bitmaps = {
+                node: self.ingredient_index.union_bitmap(vocabulary.match(names))
+                for node, names in closure.items()
+            }
+            self._taxonomy_version = self.version
+        return self._taxonomy_bitmaps
+
+    def resolve_ingredients(self, names):
+        """Vocabulary ids of every ingredient the canonical `names` cover"""
+        return self.ingredient_vocabulary.match(self.taxonomy.expand(names))
+
+    def statistics(self):
+        """CatalogStatistics for the current version, gathered on first use"""
+        if self._statistics is None or self._statistics.version != self.version:
+            self._statistics = CatalogStatistics(self)
+        return self._statistics
+
+    def zone_map(self):
+        """ZoneMap for the current version, built on first use"""
+        if self._zone_map is None or self._zone_map.version != self.version:
+            self._zone_map = ZoneMap(self)
+        return self._zone_map
+
+    def ingredient_bitmap(self, names):
+        """Bitmap of the recipes using any of the canonical ingredient `names`"""
+        node_bitmaps = self.taxonomy_bitmaps()
+        bitmap = 0
+        terms = []
+
+        for name in names:
+            if name in node_bitmaps:
+                bitmap |= node_bitmaps[name]
+            else:
+                terms.append(name)
+
+        if terms:
+            bitmap |= self.ingredient_index.union_bitmap(
+                self.ingredient_vocabulary.match(terms)
+            )
+        return bitmap
+
+    def recipe(self, recipe_id):
+        def number(field):
+            return _number(getattr(self, field)[recipe_id])
+
+        health_score = None
+        if self.has_health_score[recipe_id]:
+            health_score = number("health_score")
+
+        return Recipe(
+            name=self.names[recipe_id],
+            ingredients=self.ingredients[recipe_id],
+            cuisine=self.cuisines[recipe_id],
+            diet_tags=self.diet_tags[recipe_id],
+            cook_time=number("cook_time"),
+            nutrition=Nutrition(*map(number, NUTRITION_FIELDS)),
+            cost_rating=number("cost_rating"),
+            meal_prep_friendly=self.meal_prep_friendly[recipe_id],
+            health_score=health_score,
+            equipment_needed=self.equipment[recipe_id],
+            freezer_friendly=self.freezer_friendly[recipe_id],
+            servings=number("servings"),
+        )
+
+
+def numeric_values(recipe):
+    """The NUMERIC_FIELDS values of `recipe`, with defaults filled in.
+
+    Raises TypeError naming the field if a value is not a number.
+    """
+    nutrition = recipe["nutrition"]
+    numbers = {
+        "cook_time": recipe["cook_time"],
+        **{field: nutrition[field] for field in NUTRITION_FIELDS},
+        "cost_rating": recipe.get("cost_rating", 3),
+        "health_score": recipe.get("health_score", 0),
+        "servings": recipe.get("servings", 0),
+    }
+    for field, value in numbers.items():
+        if isinstance(value, bool) or not isinstance(value, (int, float)):
+            raise TypeError(f"{field} must be a number, not {value!r}")
+    return numbers
+
+
+def _number(value):
+    """A stored double as it was most likely given: whole values as int"""
+    return int(value) if value.is_integer() else value
+
+
+def _cluster_key(recipe):
+    return recipe["cook_time"], normalize_key(recipe["cuisine"])
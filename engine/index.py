@@ -0,0 +1,121 @@
+from bisect import bisect_right
+
+from engine.cache import ResultCache
+
+
+# Posting-list bitmaps an InvertedIndex keeps built
+BITMAP_CACHE_SIZE = 256
+
+
+def normalize_key(name):
+    return name.strip().lower()
+
+
+def bitmap_from_ids(ids):
+    """Build an int bitmap with bit `i` set for every id in `ids`."""
+    ids = list(ids)
+    if not ids:
+        return 0
+
+    buf = bytearray((max(ids) >> 3) + 1)
+    for i in ids:
+        buf[i >> 3] |= 1 << (i & 7)
+    return int.from_bytes(buf, "little")
+
+
+def iter_bits(bitmap):
+    """Yield the ids set in `bitmap`, in ascending order."""
+    bits = bin(bitmap)[:1:-1]
+    i = bits.find("1")
+    while i != -1:
+        yield i
+        i = bits.find("1", i + 1)
+
+
+class BitmapLookup:
+    """Constant-time membership tests against an int bitmap."""
+
+    def __init__(self, bitmap):
+        self._bytes = bitmap.to_bytes((bitmap.bit_length() + 7) // 8, "little")
+
+    def __contains__(self, recipe_id):
+        byte = recipe_id >> 3
+        return byte < len(self._bytes) and bool(
+            self._bytes[byte] >> (recipe_id & 7) & 1
+        )
+
+
+class InvertedIndex:
+    """Maps a normalized key to the recipe ids holding it.
+
+    Ids are kept as ascending posting lists. Bitmaps are built from them on
+    demand, and the most recently used are cached until a recipe is added.
+    """
+
+    def __init__(self, cache_size=BITMAP_CACHE_SIZE):
+        self.postings = {}
+        self.version = 0
+        self._bitmaps = ResultCache(cache_size)
+
+    def __iter__(self):
+        return iter(self.postings)
+
+    def items(self):
+        return self.postings.items()
+
+    def add(self, recipe_id, keys):
+        for key in set(keys):
+            self.postings.setdefault(key, []).append(recipe_id)
+        self.version += 1
+
+    def get(self, key):
+        return self.postings.get(key, ())
+
+    def bitmap(self, key):
+        bitmap = self._bitmaps.get(key, self.version)
+        if bitmap is None:
+            # Unknown keys are not cached, so stray terms can't fill the cache
+            ids = self.get(key)
+            if not ids:
+                return 0
+            bitmap = bitmap_from_ids(ids)
+            self._bitmaps.put(key, bitmap, self.version)
+        return bitmap
+
+    def union_bitmap(self, keys):
+        bitmap = 0
+        for key in keys:
+            bitmap |= self.bitmap(key)
+        return bitmap
+
+
+class SortedIndex:
+    """Recipe ids ordered by one numeric column, for range lookups.
+
+    The order is rebuilt lazily the first time the index is queried after the
+    column has grown, so catalog loads stay linear.
+    """
+
+    def __init__(self, column):
+        self.column = column
+        self.values = []
+        self.ids = []
+        self._bitmaps = {}
+
+    def _refresh(self):
+        if len(self.ids) == len(self.column):
+            return
+
+        column = self.column
+        self.ids = sorted(range(len(column)), key=column.__getitem__)
+        self.values = [column[i] for i in self.ids]
+        self._bitmaps = {}
+
+    def bitmap_at_most(self, value):
+        self._refresh()
+        end = bisect_right(self.values, value)
+
+        bitmap = self._bitmaps.get(end)
+        if bitmap is None:
+            bitmap = self._bitmaps[end] = bitmap_from_ids(self.ids[:end])
+        return bitmap
@@ -1,207 +1,346 @@
-class EnhancedRecipeRecommender:
-    def __init__(self, recipes):
-        self.recipes = recipes
-
-    def recommend(self, preferences):
-        recommended = []
+from heapq import heappop, heappush, heapreplace, nlargest
 
-        for recipe in self.recipes:
-            score = 0
-            skip = False
+from engine.cache import ResultCache, preferences_key
+from engine.catalog import RecipeCatalog
+from engine.index import BitmapLookup, bitmap_from_ids, iter_bits, normalize_key
+from engine.plan import compile_plan
+from engine.scoring import cuisine_ids, score_ids
 
-            if not self._passes_base_rules(recipe, preferences):
-                continue
 
-            category = preferences.get("category", "high_protein")
+# A per-recipe check in Python costs about as much as a bitmap operation over
+# this many recipes, so scanning the candidates beats the indexes only once
+# they are this much rarer than the whole catalog
+SCAN_COST = 4096
 
-            score += self.calc_score(category, recipe, preferences)
 
-            if skip:
+class EnhancedRecipeRecommender:
+    def __init__(self, recipes, cache_size=256):
+        # A ready-made catalog (e.g. a MappedCatalog) is used as is. Recipes
+        # are clustered so zone maps can skip blocks; ties keep their order.
+        if isinstance(recipes, RecipeCatalog):
+            self.catalog = recipes
+        else:
+            self.catalog = RecipeCatalog(recipes, cluster=True)
+        self.cache = ResultCache(cache_size)
+        self.plans = ResultCache(cache_size)
+
+    def compile(self, preferences):
+        """QueryPlan for `preferences`, cached per canonical preferences.
+
+        Plans depend only on the preferences, so catalog changes keep them.
+        """
+        key = preferences_key(preferences)
+        plan = self.plans.get(key)
+        if plan is None:
+            plan = compile_plan(preferences)
+            self.plans.put(key, plan)
+        return plan
+
+    def recommend(self, preferences, k=None):
+        """Return `(recipe, score)` pairs, best first.
+
+        With `k` only the top `k` are selected, using a bounded heap rather than
+        sorting every match. Ties keep catalog order either way. Results are
+        cached per canonical preferences until the catalog changes.
+        """
+        key = preferences_key(preferences, k)
+        recommended = self.cache.get(key, self.catalog.version)
+        if recommended is None:
+            recommended = self._rank(self.compile(preferences), k)
+            self.cache.put(key, recommended, self.catalog.version)
+
+        return [
+            (self.catalog.recipe(recipe_id), score) for recipe_id, score in recommended
+        ]
+
+    def iter_recommendations(self, preferences):
+        """Yield `(recipe, score)` pairs lazily, best first.
+
+        Walks the catalog's precomputed ranking for the category, so a caller
+        that stops after the first few results only pays for those.
+        """
+        for recipe_id, score in self._iter_ranked(self.compile(preferences)):
+            yield self.catalog.recipe(recipe_id), score
+
+    def _iter_ranked(self, plan):
+        catalog = self.catalog
+        column = catalog.score_table.column_for(plan.score_key)
+        ranking = catalog.score_table.ranking_for(plan.score_key)
+        order = catalog.order
+        if ranking is None:
+            ranking = sorted(range(len(catalog)), key=order.__getitem__)
+
+        candidates = self._candidate_bitmap(plan)
+        members = None if candidates == catalog.all_bitmap else BitmapLookup(candidates)
+        bonus_ids = cuisine_ids(catalog, plan.cuisines)
+        max_bonus = 1 if bonus_ids else 0
+
+        # A recipe is only emitted once nothing further down the ranking can
+        # outscore it or tie it from earlier in catalog order, i.e. once its
+        # score is above the current static score plus the largest bonus.
+        pending = []
+        for recipe_id in ranking:
+            static = column[recipe_id] if column is not None else 0
+            bound = static + max_bonus
+
+            while pending and -pending[0][0] > bound:
+                neg_score, _, pending_id = heappop(pending)
+                yield pending_id, -neg_score
+
+            if bound <= 0:
+                break
+            if members is not None and recipe_id not in members:
                 continue
 
-            score += self._score_additional_factors(recipe, preferences)
-
+            score = static + (recipe_id in bonus_ids)
             if score > 0:
-                recommended.append((recipe, score))
-
-        recommended.sort(key=lambda x: x[1], reverse=True)
-        return recommended
-
-    def _passes_base_rules(self, recipe, preferences):
-        if (
-            "max_cook_time" in preferences
-            and recipe["cook_time"] > preferences["max_cook_time"]
-        ):
+                heappush(pending, (-score, order[recipe_id], recipe_id))
+
+        while pending:
+            neg_score, _, pending_id = heappop(pending)
+            yield pending_id, -neg_score
+
+    def recommend_many(self, preferences_list, k=None):
+        """Run `recommend` for many preference sets at once.
+
+        Identical profiles are ranked once, and each distinct filter constraint
+        and cuisine bonus set is built once for the whole batch. Profiles that
+        rank by walking the same score column share a single walk. The shared
+        result cache is left alone so a large batch does not evict interactive
+        entries.
+        """
+        keys = [preferences_key(preferences, k) for preferences in preferences_list]
+        plans = {
+            key: compile_plan(preferences)
+            for key, preferences in zip(keys, preferences_list)
+        }
+
+        constraint_bitmaps = {}
+        bonus_sets = {}
+        by_column = {}
+        ranked = {}
+        for key, plan in plans.items():
+            candidates = self._candidate_bitmap(plan, constraint_bitmaps)
+            bonus_ids = bonus_sets.get(plan.cuisines)
+            if bonus_ids is None:
+                bonus_ids = bonus_sets[plan.cuisines] = cuisine_ids(
+                    self.catalog, plan.cuisines
+                )
+
+            if self._walks(k, candidates):
+                by_column.setdefault(plan.score_key, []).append(
+                    (key, candidates, bonus_ids)
+                )
+            else:
+                ranked[key] = self._rank(plan, k, candidates, bonus_ids)
+
+        for score_key, queries in by_column.items():
+            tops = self._top_k(score_key, k, [query[1:] for query in queries])
+            for position, (key, candidates, bonus_ids) in enumerate(queries):
+                if tops is None:
+                    ranked[key] = self._rank(plans[key], k, candidates, bonus_ids)
+                else:
+                    ranked[key] = tops[position]
+
+        recipe = self.catalog.recipe
+        return [
+            [(recipe(recipe_id), score) for recipe_id, score in ranked[key]]
+            for key in keys
+        ]
+
+    def _walks(self, k, candidates):
+        """Whether a top-`k` walk of the ranking beats scoring `candidates`.
+
+        Walking pays off when candidates are common enough to fill the top k
+        early; sparse candidates are cheaper to score outright.
+        """
+        if k is None or k <= 0:
             return False
+        return candidates.bit_count() ** 2 > k * len(self.catalog)
+
+    def _rank(self, plan, k, candidates=None, bonus_ids=None):
+        # Like nlargest, a non-positive k selects nothing
+        if k is not None and k <= 0:
+            return []
+
+        catalog = self.catalog
+        if candidates is None:
+            candidates = self._candidate_bitmap(plan)
+        if bonus_ids is None:
+            bonus_ids = cuisine_ids(catalog, plan.cuisines)
+
+        if self._walks(k, candidates):
+            tops = self._top_k(plan.score_key, k, [(candidates, bonus_ids)])
+            if tops is not None:
+                return tops[0]
+
+        candidates = list(iter_bits(candidates))
+        scores = score_ids(
+            catalog.score_table.column_for(plan.score_key), bonus_ids, candidates
+        )
 
-        if "dietary_restrictions" in preferences and any(
-            tag in recipe["diet_tags"] for tag in preferences["dietary_restrictions"]
-        ):
-            return False
-
-        if "ingredient_avoidances" in preferences:
-            avoid_ingredients = set(
-                i.lower() for i in preferences["ingredient_avoidances"]
-            )
-            recipe_ingredients = set(i.lower() for i in recipe["ingredients"])
-            if avoid_ingredients.intersection(recipe_ingredients):
-                return False
-
-        if "ingredient_preferences" in preferences:
-            available_ingredients = set(
-                i.lower() for i in preferences["ingredient_preferences"]
-            )
-            recipe_ingredients = set(i.lower() for i in recipe["ingredients"])
-
-            if not available_ingredients.intersection(recipe_ingredients):
-                return False
-
-        if "available_equipment" in preferences and hasattr(recipe, "equipment_needed"):
-            missing_equipment = set(recipe["equipment_needed"]) - set(
-                preferences["available_equipment"]
+        recommended = (
+            (recipe_id, score)
+            for recipe_id, score in zip(candidates, scores)
+            if score > 0
+        )
+        order = catalog.order
+        if k is None:
+            return sorted(recommended, key=lambda x: (-x[1], order[x[0]]))
+        return nlargest(k, recommended, key=lambda x: (x[1], -order[x[0]]))
+
+    def _top_k(self, score_key, k, queries):
+        """Top `k` for each `(candidates, bonus_ids)` query, by max-score pruning.
+
+        Recipes are visited in descending static score, and each one's upper
+        bound is that score plus the largest cuisine bonus. Once a query's k-th
+        best score so far beats the bound of the next recipe in line, nothing
+        further down can enter its top k, so it drops out. All queries share
+        one walk, which stops when none is left.
+        """
+        catalog = self.catalog
+        column = catalog.score_table.column_for(score_key)
+        ranking = catalog.score_table.ranking_for(score_key)
+        if ranking is None:
+            return None
+
+        order = catalog.order
+        # Each top is a min-heap of (score, -order, id): the root is the
+        # current k-th best
+        tops = [[] for _ in queries]
+        active = [
+            (
+                None if candidates == catalog.all_bitmap else BitmapLookup(candidates),
+                bonus_ids,
+                1 if bonus_ids else 0,
+                top,
             )
-            if missing_equipment:
-                return False
-
-        return True
-
-    def _score_high_protein(self, recipe, preferences):
-        score = 0
-        protein = recipe["nutrition"]["protein"]
-        calories = recipe["nutrition"]["calories"]
-        protein_ratio = protein / calories
-
-        if protein >= 45:
-            score += 5
-        elif protein >= 35:
-            score += 4
-        elif protein >= 25:
-            score += 3
-
-        if protein_ratio >= 0.2:
-            score += 3
-        elif protein_ratio >= 0.1:
-            score += 2
-        elif protein_ratio >= 0.75:
-            score += 1
-
-        if protein >= 35 and protein_ratio >= 0.1:
-            score += 2
-
-        return score
-
-    def _score_quick_meal(self, recipe, preferences):
-        score = 0
-
-        if recipe["cook_time"] <= 10:
-            score += 6
-        elif recipe["cook_time"] <= 15:
-            score += 5
-        elif recipe["cook_time"] <= 20:
-            score += 4
-
-        if len(recipe["ingredients"]) <= 3:
-            score += 3.5
-        elif len(recipe["ingredients"]) <= 5:
-            score += 2.5
-
-        return score
-
-    def _score_healthy(self, recipe, preferences):
-        score = 0
-        health_focus = preferences.get("health_focus", "balanced")
-        nutrition = recipe["nutrition"]
-
-        if "health_score" in recipe:
-            score += min(3, recipe["health_score"])
-
-        if health_focus == "balanced":
-            if (
-                20 <= nutrition["protein"] <= 40
-                and 30 <= nutrition["carbs"] <= 50
-                and 10 <= nutrition["fat"] <= 20
-            ):
-                score += 4
-        elif health_focus == "low_carb" and nutrition["carbs"] <= 20:
-            score += 4
-        elif health_focus == "low_fat" and nutrition["fat"] <= 10:
-            score += 4
-
-        whole_foods = {"tomatoes", "carrots", "avocado", "broccoli", "bell peppers"}
-        matches = sum(
-            1
-            for ing in recipe["ingredients"]
-            if any(wf in ing.lower() for wf in whole_foods)
+            for (candidates, bonus_ids), top in zip(queries, tops)
+        ]
+
+        for recipe_id in ranking:
+            static = column[recipe_id]
+            still_active = []
+            for query in active:
+                members, bonus_ids, max_bonus, top = query
+                bound = static + max_bonus
+                if bound <= 0 or (len(top) == k and top[0][0] > bound):
+                    continue
+                still_active.append(query)
+                if members is not None and recipe_id not in members:
+                    continue
+
+                score = static + (recipe_id in bonus_ids)
+                if score <= 0:
+                    continue
+
+                entry = (score, -order[recipe_id], recipe_id)
+                if len(top) < k:
+                    heappush(top, entry)
+                elif entry > top[0]:
+                    heapreplace(top, entry)
+
+            active = still_active
+            if not active:
+                break
+
+        for top in tops:
+            top.sort(reverse=True)
+        return [[(recipe_id, score) for score, _, recipe_id in top] for top in tops]
+
+    def _constraint_bitmap(self, kind, value):
+        """Bitmap of the recipes that satisfy one normalized constraint"""
+        catalog = self.catalog
+
+        match kind:
+            case "max_cook_time":
+                return catalog.range_indexes["cook_time"].bitmap_at_most(value)
+
+            case "dietary_restrictions":
+                return catalog.all_bitmap & ~catalog.diet_tag_index.union_bitmap(value)
+
+            case "ingredient_avoidances":
+                return catalog.all_bitmap & ~catalog.ingredient_bitmap(value)
+
+            case "ingredient_preferences":
+                return catalog.ingredient_bitmap(value)
+
+            case "available_equipment":
+                return catalog.all_bitmap & ~catalog.equipment_index.union_bitmap(
+                    item for item in catalog.equipment_index if item not in value
+                )
+
+    def _constraint_test(self, kind, value):
+        """Per-recipe predicate for one normalized constraint, for scans"""
+        catalog = self.catalog
+
+        match kind:
+            case "max_cook_time":
+                cook_time = catalog.cook_time
+                return lambda recipe_id: cook_time[recipe_id] <= value
+
+            case "dietary_restrictions":
+                diet_tags = catalog.diet_tags
+                return lambda recipe_id: value.isdisjoint(
+                    map(normalize_key, diet_tags[recipe_id])
+                )
+
+            case "ingredient_avoidances":
+                ids = catalog.resolve_ingredients(value)
+                ingredient_ids = catalog.ingredient_ids
+                return lambda recipe_id: ids.isdisjoint(ingredient_ids[recipe_id])
+
+            case "ingredient_preferences":
+                ids = catalog.resolve_ingredients(value)
+                ingredient_ids = catalog.ingredient_ids
+                return lambda recipe_id: not ids.isdisjoint(ingredient_ids[recipe_id])
+
+            case "available_equipment":
+                equipment = catalog.equipment
+                return lambda recipe_id: value.issuperset(
+                    map(normalize_key, equipment[recipe_id])
+                )
+
+    def _scan(self, candidates, constraints):
+        tests = [self._constraint_test(*constraint) for constraint in constraints]
+        return bitmap_from_ids(
+            recipe_id
+            for recipe_id in iter_bits(candidates)
+            if all(test(recipe_id) for test in tests)
         )
-        score += min(3, matches)
-
-        return score
-
-    def _score_budget(self, recipe, preferences):
-        score = 0
-
-        if recipe.get("cost_rating", 3) == 1:
-            score += 5
-        elif recipe["cost_rating"] == 2:
-            score += 3
 
-        common_ingredients = {"rice", "beans", "eggs", "potatoes", "pasta"}
-        matches = sum(
-            1
-            for ing in recipe["ingredients"]
-            if any(ci in ing.lower() for ci in common_ingredients)
+    def _candidate_bitmap(self, plan, memo=None):
+        """Combine every constraint in `plan` into one candidate bitmap.
+
+        Blocks the zone map rules out are dropped first, then constraints run
+        most selective first, as estimated from the catalog statistics. Once
+        few enough candidates are left, the remaining ones are checked recipe
+        by recipe instead of through the indexes. `memo` maps constraints to
+        bitmaps already built, for batches.
+        """
+        catalog = self.catalog
+        statistics = catalog.statistics()
+        constraints = sorted(
+            plan.constraints, key=lambda constraint: statistics.estimate(*constraint)
         )
-        score += min(3, matches)
-
-        if len(recipe["ingredients"]) <= 5:
-            score += 2
-
-        return score
-
-    def _score_meal_prep(self, recipe, preferences):
-        score = 0
-
-        if recipe.get("meal_prep_friendly", False):
-            score += 4
-
-        if recipe["cook_time"] >= 30:
-            score += 2
-
-        if recipe.get("freezer_friendly", False):
-            score += 2
-
-        if recipe.get("servings", 0) >= 4:
-            score += 2
-
-        return score
-
-    def _score_additional_factors(self, recipe, preferences):
-        """Score other preference factors"""
-        score = 0
-
-        if (
-            "cuisine_pref" in preferences
-            and recipe["cuisine"] in preferences["cuisine_pref"]
-        ):
-            score += 1
-        return score
-
-    def calc_score(self, category, recipe, preferences):
-        match category:
-            case "high_protein":
-                return self._score_high_protein(recipe, preferences)
 
-            case "quick_meal":
-                return self._score_quick_meal(recipe, preferences)
+        zone_map = catalog.zone_map()
+        candidates = zone_map.recipe_bitmap(zone_map.block_bitmap(plan))
+        count = candidates.bit_count()
+        for position, constraint in enumerate(constraints):
+            if not candidates:
+                break
 
-            case "healthy":
-                return self._score_healthy(recipe, preferences)
+            bitmap = None if memo is None else memo.get(constraint)
+            if bitmap is None:
+                if count * SCAN_COST <= len(catalog):
+                    return self._scan(candidates, constraints[position:])
 
-            case "budget":
-                return self._score_budget(recipe, preferences)
+                bitmap = self._constraint_bitmap(*constraint)
+                if memo is not None:
+                    memo[constraint] = bitmap
 
-            case "meal_prep":
-                return self._score_meal_prep(recipe, preferences)
+            candidates &= bitmap
+            count = candidates.bit_count()
 
-            case _:
-                return 0
+        return candidates
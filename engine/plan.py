@@ -0,0 +1,59 @@
+from engine.index import normalize_key
+from engine.scoring import ScoreTable
+from engine.vocabulary import canonical_ingredient
+
+
+class QueryPlan:
+    """A preferences dict compiled into what ranking needs.
+
+    Only the filters present in the preferences become constraints, each with
+    its values normalized once, and the category and health focus are resolved
+    to a ScoreTable column key. Plans hold only hashable values, so they can be
+    cached and sent to worker processes.
+    """
+
+    def __init__(self, constraints, score_key, cuisines):
+        self.constraints = constraints
+        self.score_key = score_key
+        self.cuisines = cuisines
+
+    def __repr__(self):
+        return (
+            f"QueryPlan(constraints={self.constraints!r},"
+            f" score_key={self.score_key!r}, cuisines={self.cuisines!r})"
+        )
+
+
+def compile_plan(preferences):
+    category = preferences.get("category", "high_protein")
+    return QueryPlan(
+        constraints=tuple(_constraints(preferences)),
+        score_key=ScoreTable.key(category, preferences),
+        cuisines=frozenset(map(normalize_key, preferences.get("cuisine_pref", ()))),
+    )
+
+
+def _constraints(preferences):
+    """Normalized `(kind, value)` pairs for the filters in `preferences`"""
+    if "max_cook_time" in preferences:
+        yield "max_cook_time", preferences["max_cook_time"]
+
+    if "dietary_restrictions" in preferences:
+        yield "dietary_restrictions", frozenset(
+            map(normalize_key, preferences["dietary_restrictions"])
+        )
+
+    if "ingredient_avoidances" in preferences:
+        yield "ingredient_avoidances", frozenset(
+            map(canonical_ingredient, preferences["ingredient_avoidances"])
+        )
+
+    if "ingredient_preferences" in preferences:
+        yield "ingredient_preferences", frozenset(
+            map(canonical_ingredient, preferences["ingredient_preferences"])
+        )
+
+    if "available_equipment" in preferences:
+        yield "available_equipment", frozenset(
+            map(normalize_key, preferences["available_equipment"])
+        )
@@ -0,0 +1,128 @@
+from collections.abc import Mapping
+from sys import intern
+
+
+class _Record(Mapping):
+    """Read-only mapping over __slots__, so records can stand in for the recipe
+    dicts the GUI and the scorers were written against. A slot holding None
+    reads as absent."""
+
+    __slots__ = ()
+
+    def __getitem__(self, key):
+        if key not in self.__slots__:
+            raise KeyError(key)
+
+        value = getattr(self, key)
+        if value is None:
+            raise KeyError(key)
+        return value
+
+    def __iter__(self):
+        return (key for key in self.__slots__ if getattr(self, key) is not None)
+
+    def __len__(self):
+        return sum(1 for _ in self)
+
+    def __repr__(self):
+        fields = ", ".join(f"{key}={value!r}" for key, value in self.items())
+        return f"{type(self).__name__}({fields})"
+
+
+class Nutrition(_Record):
+    __slots__ = ("calories", "protein", "carbs", "fat")
+
+    def __init__(self, calories, protein, carbs, fat):
+        self.calories = calories
+        self.protein = protein
+        self.carbs = carbs
+        self.fat = fat
+
+    def to_dict(self):
+        return {key: getattr(self, key) for key in self.__slots__}
+
+
+class Recipe(_Record):
+    """Compact recipe record.
+
+    List fields are tuples and every repeated string (ingredients, tags,
+    cuisine, equipment) is interned, so thousands of recipes share one copy of
+    "garlic" or "vegan". A missing health_score is stored as None and reads as
+    absent, like a key missing from a dict.
+    """
+
+    __slots__ = (
+        "name",
+        "ingredients",
+        "cuisine",
+        "diet_tags",
+        "cook_time",
+        "nutrition",
+        "cost_rating",
+        "meal_prep_friendly",
+        "health_score",
+        "equipment_needed",
+        "freezer_friendly",
+        "servings",
+    )
+
+    def __init__(
+        self,
+        name,
+        ingredients,
+        cuisine,
+        diet_tags,
+        cook_time,
+        nutrition,
+        cost_rating=3,
+        meal_prep_friendly=False,
+        health_score=None,
+        equipment_needed=(),
+        freezer_friendly=False,
+        servings=0,
+    ):
+        self.name = name
+        self.ingredients = tuple(map(intern, ingredients))
+        self.cuisine = intern(cuisine)
+        self.diet_tags = tuple(map(intern, diet_tags))
+        self.cook_time = cook_time
+        self.nutrition = nutrition
+        self.cost_rating = cost_rating
+        self.meal_prep_friendly = bool(meal_prep_friendly)
+        self.health_score = health_score
+        self.equipment_needed = tuple(map(intern, equipment_needed))
+        self.freezer_friendly = bool(freezer_friendly)
+        self.servings = servings
+
+    @classmethod
+    def from_dict(cls, recipe):
+        nutrition = recipe["nutrition"]
+        return cls(
+            name=recipe["name"],
+            ingredients=recipe["ingredients"],
+            cuisine=recipe["cuisine"],
+            diet_tags=recipe["diet_tags"],
+            cook_time=recipe["cook_time"],
+            nutrition=Nutrition(
+                nutrition["calories"],
+                nutrition["protein"],
+                nutrition["carbs"],
+                nutrition["fat"],
+            ),
+            cost_rating=recipe.get("cost_rating", 3),
+            meal_prep_friendly=recipe.get("meal_prep_friendly", False),
+            health_score=recipe.get("health_score"),
+            equipment_needed=recipe.get("equipment_needed", ()),
+            freezer_friendly=recipe.get("freezer_friendly", False),
+            servings=recipe.get("servings", 0),
+        )
+
+    def to_dict(self):
+        recipe = {}
+        for key, value in self.items():
+            if isinstance(value, tuple):
+                value = list(value)
+            elif isinstance(value, Nutrition):
+                value = value.to_dict()
+            recipe[key] = value
+        return recipe
@@ -0,0 +1,378 @@
+from array import array
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+from engine.index import normalize_key
+
+
+WHOLE_FOODS = ("tomatoes", "carrots", "avocado", "broccoli", "bell peppers")
+COMMON_INGREDIENTS = ("rice", "beans", "eggs", "potatoes", "pasta")
+
+HEALTH_FOCUSES = ("balanced", "low_carb", "low_fat")
+
+# Per-recipe values the scorers need, derived once when a recipe is added
+FEATURE_FIELDS = {
+    "whole_food_matches": "i",
+    "common_ingredient_matches": "i",
+    "protein_ratio": "d",
+    "ingredient_count": "i",
+}
+
+
+def score_recipes(catalog, category, preferences, recipe_ids):
+    """Score `recipe_ids` for `category`, returning a list aligned with the ids.
+
+    The category part is read from the catalog's precomputed ScoreTable, so
+    only the cuisine bonus is worked out per query.
+    """
+    column = catalog.score_table.column(category, preferences)
+    return score_ids(column, cuisine_bonus_ids(catalog, preferences), recipe_ids)
+
+
+def score_ids(column, bonus_ids, recipe_ids):
+    """Scores of `recipe_ids` from a ScoreTable column plus the cuisine bonus"""
+    if np is not None:
+        ids = np.asarray(recipe_ids, dtype=np.intp)
+        if column is not None and len(ids):
+            scores = np.asarray(column)[ids]
+        else:
+            scores = np.zeros(len(ids), dtype=np.float64)
+        if bonus_ids and len(ids):
+            scores += np.isin(ids, np.fromiter(bonus_ids, dtype=np.intp))
+        return scores.tolist()
+
+    return [
+        (column[recipe_id] if column is not None else 0) + (recipe_id in bonus_ids)
+        for recipe_id in recipe_ids
+    ]
+
+
+def category_scores(catalog, category, preferences, recipe_ids):
+    """Compute the category score of `recipe_ids` from the catalog columns.
+
+    Runs column-wise with NumPy when it is installed, otherwise recipe by
+    recipe in pure Python. Both paths return the same values.
+    """
+    if np is not None:
+        ids = np.asarray(recipe_ids, dtype=np.intp)
+        scorer = VECTOR_SCORERS.get(category)
+        if scorer is None or not len(ids):
+            return [0.0] * len(ids)
+        return scorer(catalog, ids, preferences).astype(np.float64).tolist()
+
+    scorer = PYTHON_SCORERS.get(category)
+    if scorer is None:
+        return [0] * len(recipe_ids)
+    return [scorer(catalog, recipe_id, preferences) for recipe_id in recipe_ids]
+
+
+def cuisine_bonus_ids(catalog, preferences):
+    """Ids of recipes whose cuisine is one of the preferred cuisines"""
+    cuisines = map(normalize_key, preferences.get("cuisine_pref", ()))
+    return cuisine_ids(catalog, cuisines)
+
+
+def cuisine_ids(catalog, cuisines):
+    """Ids of recipes whose cuisine is one of the normalized `cuisines`"""
+    ids = set()
+    for cuisine in cuisines:
+        ids.update(catalog.cuisine_index.get(cuisine))
+    return ids
+
+
+def extract_features(recipe):
+    """FEATURE_FIELDS values for `recipe`, for the catalog to store as columns"""
+    ingredients = recipe["ingredients"]
+    nutrition = recipe["nutrition"]
+    return {
+        "whole_food_matches": _count_matches(ingredients, WHOLE_FOODS),
+        "common_ingredient_matches": _count_matches(ingredients, COMMON_INGREDIENTS),
+        "protein_ratio": _protein_ratio(nutrition["protein"], nutrition["calories"]),
+        "ingredient_count": len(ingredients),
+    }
+
+
+def _count_matches(ingredients, needles):
+    return sum(1 for ing in ingredients if any(n in ing.lower() for n in needles))
+
+
+def _protein_ratio(protein, calories):
+    return protein / calories if calories else 0
+
+
+# Pure-Python scorers, one recipe at a time
+
+
+def _score_high_protein(catalog, recipe_id, preferences):
+    score = 0
+    protein = catalog.protein[recipe_id]
+    protein_ratio = catalog.protein_ratio[recipe_id]
+
+    if protein >= 45:
+        score += 5
+    elif protein >= 35:
+        score += 4
+    elif protein >= 25:
+        score += 3
+
+    if protein_ratio >= 0.2:
+        score += 3
+    elif protein_ratio >= 0.1:
+        score += 2
+    elif protein_ratio >= 0.75:
+        score += 1
+
+    if protein >= 35 and protein_ratio >= 0.1:
+        score += 2
+
+    return score
+
+
+def _score_quick_meal(catalog, recipe_id, preferences):
+    score = 0
+    cook_time = catalog.cook_time[recipe_id]
+    ingredient_count = catalog.ingredient_count[recipe_id]
+
+    if cook_time <= 10:
+        score += 6
+    elif cook_time <= 15:
+        score += 5
+    elif cook_time <= 20:
+        score += 4
+
+    if ingredient_count <= 3:
+        score += 3.5
+    elif ingredient_count <= 5:
+        score += 2.5
+
+    return score
+
+
+def _score_healthy(catalog, recipe_id, preferences):
+    score = 0
+    health_focus = preferences.get("health_focus", "balanced")
+    protein = catalog.protein[recipe_id]
+    carbs = catalog.carbs[recipe_id]
+    fat = catalog.fat[recipe_id]
+
+    if catalog.has_health_score[recipe_id]:
+        score += min(3, catalog.health_score[recipe_id])
+
+    if health_focus == "balanced":
+        if 20 <= protein <= 40 and 30 <= carbs <= 50 and 10 <= fat <= 20:
+            score += 4
+    elif health_focus == "low_carb" and carbs <= 20:
+        score += 4
+    elif health_focus == "low_fat" and fat <= 10:
+        score += 4
+
+    score += min(3, catalog.whole_food_matches[recipe_id])
+
+    return score
+
+
+def _score_budget(catalog, recipe_id, preferences):
+    score = 0
+    cost_rating = catalog.cost_rating[recipe_id]
+
+    if cost_rating == 1:
+        score += 5
+    elif cost_rating == 2:
+        score += 3
+
+    score += min(3, catalog.common_ingredient_matches[recipe_id])
+
+    if catalog.ingredient_count[recipe_id] <= 5:
+        score += 2
+
+    return score
+
+
+def _score_meal_prep(catalog, recipe_id, preferences):
+    score = 0
+
+    if catalog.meal_prep_friendly[recipe_id]:
+        score += 4
+
+    if catalog.cook_time[recipe_id] >= 30:
+        score += 2
+
+    if catalog.freezer_friendly[recipe_id]:
+        score += 2
+
+    if catalog.servings[recipe_id] >= 4:
+        score += 2
+
+    return score
+
+
+PYTHON_SCORERS = {
+    "high_protein": _score_high_protein,
+    "quick_meal": _score_quick_meal,
+    "healthy": _score_healthy,
+    "budget": _score_budget,
+    "meal_prep": _score_meal_prep,
+}
+
+
+# NumPy scorers, whole columns at a time
+
+
+def _column(values, ids):
+    # Works on array.array and memoryview columns alike without copying. The
+    # view is dropped straight after the gather so an array.array column
+    # stays resizable for later catalog updates.
+    return np.asarray(values)[ids]
+
+
+def _vec_high_protein(catalog, ids, preferences):
+    protein = _column(catalog.protein, ids)
+    ratio = _column(catalog.protein_ratio, ids)
+
+    score = np.select([protein >= 45, protein >= 35, protein >= 25], [5, 4, 3], 0)
+    score = score + np.select(
+        [ratio >= 0.2, ratio >= 0.1, ratio >= 0.75], [3, 2, 1], 0
+    )
+    score = score + np.where((protein >= 35) & (ratio >= 0.1), 2, 0)
+    return score
+
+
+def _vec_quick_meal(catalog, ids, preferences):
+    cook_time = _column(catalog.cook_time, ids)
+    counts = _column(catalog.ingredient_count, ids)
+
+    score = np.select(
+        [cook_time <= 10, cook_time <= 15, cook_time <= 20], [6, 5, 4], 0
+    )
+    return score + np.select([counts <= 3, counts <= 5], [3.5, 2.5], 0)
+
+
+def _vec_healthy(catalog, ids, preferences):
+    health_focus = preferences.get("health_focus", "balanced")
+    protein = _column(catalog.protein, ids)
+    carbs = _column(catalog.carbs, ids)
+    fat = _column(catalog.fat, ids)
+
+    has_health_score = _column(catalog.has_health_score, ids) != 0
+    score = np.where(
+        has_health_score, np.minimum(3, _column(catalog.health_score, ids)), 0
+    )
+
+    if health_focus == "balanced":
+        focus = (
+            (20 <= protein) & (protein <= 40)
+            & (30 <= carbs) & (carbs <= 50)
+            & (10 <= fat) & (fat <= 20)
+        )
+    elif health_focus == "low_carb":
+        focus = carbs <= 20
+    elif health_focus == "low_fat":
+        focus = fat <= 10
+    else:
+        focus = np.zeros(len(ids), dtype=bool)
+    score = score + np.where(focus, 4, 0)
+
+    return score + np.minimum(3, _column(catalog.whole_food_matches, ids))
+
+
+def _vec_budget(catalog, ids, preferences):
+    cost_rating = _column(catalog.cost_rating, ids)
+    counts = _column(catalog.ingredient_count, ids)
+    matches = _column(catalog.common_ingredient_matches, ids)
+
+    score = np.select([cost_rating == 1, cost_rating == 2], [5, 3], 0)
+    score = score + np.minimum(3, matches)
+    return score + np.where(counts <= 5, 2, 0)
+
+
+def _vec_meal_prep(catalog, ids, preferences):
+    score = np.where(_column(catalog.meal_prep_friendly, ids) != 0, 4, 0)
+    score = score + np.where(_column(catalog.cook_time, ids) >= 30, 2, 0)
+    score = score + np.where(_column(catalog.freezer_friendly, ids) != 0, 2, 0)
+    return score + np.where(_column(catalog.servings, ids) >= 4, 2, 0)
+
+
+VECTOR_SCORERS = {
+    "high_protein": _vec_high_protein,
+    "quick_meal": _vec_quick_meal,
+    "healthy": _vec_healthy,
+    "budget": _vec_budget,
+    "meal_prep": _vec_meal_prep,
+}
+
+
+class ScoreTable:
+    """Category scores that depend only on the recipe.
+
+    There is one column per (category, health_focus) pair; health_focus only
+    matters for "healthy", and None stands for a focus that earns no bonus.
+    Columns are filled for every recipe at load and topped up in bulk the next
+    time they are read after the catalog grows.
+    """
+
+    KEYS = (
+        ("high_protein", None),
+        ("quick_meal", None),
+        ("budget", None),
+        ("meal_prep", None),
+        ("healthy", None),
+    ) + tuple(("healthy", focus) for focus in HEALTH_FOCUSES)
+
+    def __init__(self, catalog):
+        self.catalog = catalog
+        self.columns = {key: array("d") for key in self.KEYS}
+        self.rankings = {}
+
+    @staticmethod
+    def key(category, preferences):
+        if category != "healthy":
+            return category, None
+
+        health_focus = preferences.get("health_focus", "balanced")
+        return category, health_focus if health_focus in HEALTH_FOCUSES else None
+
+    def column(self, category, preferences):
+        return self.column_for(self.key(category, preferences))
+
+    def column_for(self, key):
+        column = self.columns.get(key)
+        if column is not None and len(column) < len(self.catalog):
+            self.refresh()
+        return column
+
+    def ranking(self, category, preferences):
+        return self.ranking_for(self.key(category, preferences))
+
+    def ranking_for(self, key):
+        """Recipe ids by descending score in the column, ties in catalog order"""
+        column = self.column_for(key)
+        if column is None:
+            return None
+
+        ranking = self.rankings.get(key)
+        if ranking is None or len(ranking) != len(column):
+            order = self.catalog.order
+            if np is not None:
+                ids = np.lexsort((np.asarray(order), -np.asarray(column)))
+                ranking = array("q", ids.tolist())
+            else:
+                ids = sorted(range(len(column)), key=lambda i: (-column[i], order[i]))
+                ranking = array("q", ids)
+            self.rankings[key] = ranking
+        return ranking
+
+    def refresh(self):
+        size = len(self.catalog)
+        for (category, health_focus), column in self.columns.items():
+            if len(column) < size:
+                column.extend(
+                    category_scores(
+                        self.catalog,
+                        category,
+                        {"health_focus": health_focus},
+                        range(len(column), size),
+                    )
+                )
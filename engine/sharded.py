@@ -0,0 +1,78 @@
+import os
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from heapq import merge
+from itertools import islice
+
+from engine.inferance import EnhancedRecipeRecommender
+from engine.plan import compile_plan
+
+
+# Per-worker state: each worker process holds exactly one shard
+_shard = None
+_shard_offset = 0
+
+
+def _load_shard(recipes, offset):
+    global _shard, _shard_offset
+    _shard = EnhancedRecipeRecommender(recipes, cache_size=0)
+    _shard_offset = offset
+
+
+def _rank_shard(plan, k):
+    ranked = _shard._rank(plan, k)
+    # Shards are clustered, so map ids back to positions in the shard's input
+    order = _shard.catalog.order
+    ids = array("q", (_shard_offset + order[recipe_id] for recipe_id, _ in ranked))
+    scores = array("d", (score for _, score in ranked))
+    return ids, scores
+
+
+class ShardedRecommender:
+    """Spread the catalog over worker processes, one shard resident in each.
+
+    Every worker filters and ranks its own shard and sends back only its local
+    top-k as compact id/score arrays, which are merged here. Results match
+    EnhancedRecipeRecommender.recommend, including the catalog-order tie-break.
+    """
+
+    def __init__(self, recipes, shards=None):
+        self.recipes = list(recipes)
+        shards = shards or os.cpu_count() or 1
+        size = max(1, -(-len(self.recipes) // shards))
+
+        self.executors = []
+        for offset in range(0, len(self.recipes), size) or [0]:
+            self.executors.append(
+                ProcessPoolExecutor(
+                    max_workers=1,
+                    initializer=_load_shard,
+                    initargs=(self.recipes[offset : offset + size], offset),
+                )
+            )
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def close(self):
+        for executor in self.executors:
+            executor.shutdown()
+
+    def recommend(self, preferences, k=None):
+        # Compiled once here; every shard runs the same plan
+        plan = compile_plan(preferences)
+        futures = [executor.submit(_rank_shard, plan, k) for executor in self.executors]
+
+        shard_results = []
+        for future in futures:
+            ids, scores = future.result()
+            shard_results.append(zip(ids, scores))
+
+        ranked = merge(*shard_results, key=lambda x: (-x[1], x[0]))
+        if k is not None:
+            ranked = islice(ranked, k)
+
+        return [(self.recipes[recipe_id], score) for recipe_id, score in ranked]
@@ -0,0 +1,354 @@
+import json
+import sqlite3
+import sys
+from array import array
+from heapq import nlargest
+
+from engine.catalog import FLAG_FIELDS, NUMERIC_FIELDS, numeric_values
+from engine.index import normalize_key
+from engine.recipe import Recipe
+from engine.scoring import FEATURE_FIELDS, category_scores, extract_features
+from engine.taxonomy import DEFAULT_TAXONOMY
+from engine.vocabulary import Vocabulary, canonical_ingredient
+
+
+SQLITE_SUFFIXES = (".db", ".sqlite", ".sqlite3")
+
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS recipes (
+    id INTEGER PRIMARY KEY,
+    name TEXT NOT NULL,
+    cuisine TEXT NOT NULL,
+    cuisine_key TEXT NOT NULL,
+    cook_time INTEGER NOT NULL,
+    calories INTEGER NOT NULL,
+    protein INTEGER NOT NULL,
+    carbs INTEGER NOT NULL,
+    fat INTEGER NOT NULL,
+    cost_rating INTEGER NOT NULL,
+    health_score INTEGER,
+    servings INTEGER NOT NULL,
+    meal_prep_friendly INTEGER NOT NULL,
+    freezer_friendly INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS recipes_cook_time ON recipes (cook_time);
+CREATE INDEX IF NOT EXISTS recipes_cuisine_key ON recipes (cuisine_key);
+"""
+
+# One table per list field: (recipe_id, position, name, key)
+LIST_TABLES = {
+    "ingredients": ("recipe_ingredients", canonical_ingredient),
+    "diet_tags": ("recipe_tags", normalize_key),
+    "equipment_needed": ("recipe_equipment", normalize_key),
+}
+
+LIST_SCHEMA = """
+CREATE TABLE IF NOT EXISTS {table} (
+    recipe_id INTEGER NOT NULL REFERENCES recipes (id),
+    position INTEGER NOT NULL,
+    name TEXT NOT NULL,
+    key TEXT NOT NULL,
+    PRIMARY KEY (recipe_id, position)
+);
+CREATE INDEX IF NOT EXISTS {table}_key ON {table} (key, recipe_id);
+CREATE INDEX IF NOT EXISTS {table}_recipe_key ON {table} (recipe_id, key);
+"""
+
+FETCH_SIZE = 10_000
+
+
+def _placeholders(values):
+    return ", ".join("?" for _ in values)
+
+
+class SQLiteCatalog:
+    """Recipe catalog stored in indexed SQLite tables.
+
+    Filters are pushed down into a single SELECT, so only candidate rows are
+    read back, in id order and in bounded batches.
+    """
+
+    def __init__(self, path, taxonomy=DEFAULT_TAXONOMY):
+        self.taxonomy = taxonomy
+        self.connection = sqlite3.connect(path)
+        self.connection.executescript(SCHEMA)
+        for table, _ in LIST_TABLES.values():
+            self.connection.executescript(LIST_SCHEMA.format(table=table))
+        self._vocabulary = None
+
+    def __len__(self):
+        return self.connection.execute("SELECT COUNT(*) FROM recipes").fetchone()[0]
+
+    def close(self):
+        self.connection.close()
+
+    def extend(self, recipes):
+        with self.connection:
+            for recipe in recipes:
+                self._insert(recipe)
+
+    def add(self, recipe):
+        with self.connection:
+            return self._insert(recipe)
+
+    def _insert(self, recipe):
+        nutrition = recipe["nutrition"]
+        cursor = self.connection.execute(
+            "INSERT INTO recipes (name, cuisine, cuisine_key, cook_time, calories,"
+            " protein, carbs, fat, cost_rating, health_score, servings,"
+            " meal_prep_friendly, freezer_friendly)"
+            " VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            (
+                recipe["name"],
+                recipe["cuisine"],
+                normalize_key(recipe["cuisine"]),
+                recipe["cook_time"],
+                nutrition["calories"],
+                nutrition["protein"],
+                nutrition["carbs"],
+                nutrition["fat"],
+                recipe.get("cost_rating", 3),
+                recipe.get("health_score"),
+                recipe.get("servings", 0),
+                bool(recipe.get("meal_prep_friendly", False)),
+                bool(recipe.get("freezer_friendly", False)),
+            ),
+        )
+        recipe_id = cursor.lastrowid
+        self._vocabulary = None
+
+        for field, (table, normalize) in LIST_TABLES.items():
+            self.connection.executemany(
+                f"INSERT INTO {table} (recipe_id, position, name, key)"
+                " VALUES (?, ?, ?, ?)",
+                (
+                    (recipe_id, position, name, normalize(name))
+                    for position, name in enumerate(recipe.get(field, ()))
+                ),
+            )
+
+        return recipe_id
+
+    @property
+    def ingredient_vocabulary(self):
+        """Vocabulary of the stored ingredient keys, for partial matching"""
+        if self._vocabulary is None:
+            self._vocabulary = Vocabulary()
+            for (key,) in self.connection.execute(
+                "SELECT DISTINCT key FROM recipe_ingredients ORDER BY key"
+            ):
+                self._vocabulary.add(key)
+        return self._vocabulary
+
+    def _ingredient_keys(self, names):
+        vocabulary = self.ingredient_vocabulary
+        ids = vocabulary.match(self.taxonomy.expand(names))
+        return sorted(vocabulary.terms[i] for i in ids)
+
+    def query(self, preferences):
+        """Translate the filters in `preferences` into one SELECT.
+
+        Returns the SQL and its parameters. The predicates mirror
+        EnhancedRecipeRecommender's filters.
+        """
+        where, params = [], []
+
+        if "max_cook_time" in preferences:
+            where.append("r.cook_time <= ?")
+            params.append(preferences["max_cook_time"])
+
+        if "dietary_restrictions" in preferences:
+            tags = sorted(set(map(normalize_key, preferences["dietary_restrictions"])))
+            where.append(
+                "NOT EXISTS (SELECT 1 FROM recipe_tags t WHERE t.recipe_id = r.id"
+                f" AND t.key IN ({_placeholders(tags)}))"
+            )
+            params.extend(tags)
+
+        if "ingredient_avoidances" in preferences:
+            avoid = self._ingredient_keys(preferences["ingredient_avoidances"])
+            where.append(
+                "NOT EXISTS (SELECT 1 FROM recipe_ingredients i"
+                " WHERE i.recipe_id = r.id"
+                f" AND i.key IN ({_placeholders(avoid)}))"
+            )
+            params.extend(avoid)
+
+        if "ingredient_preferences" in preferences:
+            include = self._ingredient_keys(preferences["ingredient_preferences"])
+            where.append(
+                "r.id IN (SELECT i.recipe_id FROM recipe_ingredients i"
+                f" WHERE i.key IN ({_placeholders(include)}))"
+            )
+            params.extend(include)
+
+        if "available_equipment" in preferences:
+            available = sorted(
+                set(map(normalize_key, preferences["available_equipment"]))
+            )
+            where.append(
+                "NOT EXISTS (SELECT 1 FROM recipe_equipment e WHERE e.recipe_id = r.id"
+                f" AND e.key NOT IN ({_placeholders(available)}))"
+            )
+            params.extend(available)
+
+        lists = ", ".join(
+            f"(SELECT json_group_array(name) FROM (SELECT name FROM {table}"
+            " WHERE recipe_id = r.id ORDER BY position))"
+            for table, _ in LIST_TABLES.values()
+        )
+        sql = (
+            "SELECT r.id, r.name, r.cuisine, r.cook_time, r.calories, r.protein,"
+            " r.carbs, r.fat, r.cost_rating, r.health_score, r.servings,"
+            f" r.meal_prep_friendly, r.freezer_friendly, {lists} FROM recipes r"
+        )
+        if where:
+            sql += " WHERE " + " AND ".join(where)
+        return sql + " ORDER BY r.id", params
+
+    def candidates(self, preferences):
+        """Yield the recipes passing every filter, in id order."""
+        sql, params = self.query(preferences)
+        cursor = self.connection.execute(sql, params)
+
+        while True:
+            rows = cursor.fetchmany(FETCH_SIZE)
+            if not rows:
+                return
+
+            for row in rows:
+                yield self._recipe(row)
+
+    @staticmethod
+    def _recipe(row):
+        (
+            _,
+            name,
+            cuisine,
+            cook_time,
+            calories,
+            protein,
+            carbs,
+            fat,
+            cost_rating,
+            health_score,
+            servings,
+            meal_prep_friendly,
+            freezer_friendly,
+            ingredients,
+            diet_tags,
+            equipment,
+        ) = row
+
+        recipe = {
+            "name": name,
+            "ingredients": json.loads(ingredients),
+            "cuisine": cuisine,
+            "diet_tags": json.loads(diet_tags),
+            "cook_time": cook_time,
+            "nutrition": {
+                "calories": calories,
+                "protein": protein,
+                "carbs": carbs,
+                "fat": fat,
+            },
+            "cost_rating": cost_rating,
+            "meal_prep_friendly": bool(meal_prep_friendly),
+            "equipment_needed": json.loads(equipment),
+            "freezer_friendly": bool(freezer_friendly),
+            "servings": servings,
+        }
+        if health_score is not None:
+            recipe["health_score"] = health_score
+        return recipe
+
+
+class _BatchColumns:
+    """The columns category_scores reads, for one batch of candidate rows.
+
+    Unlike a RecipeCatalog it builds no vocabulary, indexes, score table or
+    taxonomy bitmaps, which a batch that is scored once never needs.
+    """
+
+    def __init__(self, recipes):
+        for field, typecode in (*NUMERIC_FIELDS.items(), *FEATURE_FIELDS.items()):
+            setattr(self, field, array(typecode))
+        for field in (*FLAG_FIELDS, "has_health_score"):
+            setattr(self, field, array("b"))
+
+        for recipe in recipes:
+            for field, value in numeric_values(recipe).items():
+                getattr(self, field).append(value)
+            for field, value in extract_features(recipe).items():
+                getattr(self, field).append(value)
+            for field in FLAG_FIELDS:
+                getattr(self, field).append(bool(recipe.get(field, False)))
+            self.has_health_score.append("health_score" in recipe)
+
+
+class SQLiteRecommender:
+    """EnhancedRecipeRecommender's interface over a SQLiteCatalog.
+
+    Candidate rows come back from SQLite in batches; each batch is scored
+    column-wise and only the running top-k is kept, so memory stays bounded
+    by the batch size and k.
+    """
+
+    def __init__(self, path):
+        self.catalog = SQLiteCatalog(path)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def close(self):
+        self.catalog.close()
+
+    def recommend(self, preferences, k=None):
+        recommended = []
+        batch = []
+
+        for recipe in self.catalog.candidates(preferences):
+            batch.append(recipe)
+            if len(batch) >= FETCH_SIZE:
+                recommended = self._merge_batch(recommended, batch, preferences, k)
+                batch = []
+        recommended = self._merge_batch(recommended, batch, preferences, k)
+
+        if k is None:
+            recommended.sort(key=lambda x: x[1], reverse=True)
+        return recommended
+
+    def _merge_batch(self, recommended, batch, preferences, k):
+        if not batch:
+            return recommended
+
+        category = preferences.get("category", "high_protein")
+        cuisines = set(map(normalize_key, preferences.get("cuisine_pref", ())))
+        scores = category_scores(
+            _BatchColumns(batch), category, preferences, range(len(batch))
+        )
+        for recipe, score in zip(batch, scores):
+            score += normalize_key(recipe["cuisine"]) in cuisines
+            if score > 0:
+                recommended.append((Recipe.from_dict(recipe), score))
+
+        if k is not None:
+            recommended = nlargest(k, recommended, key=lambda x: x[1])
+        return recommended
+
+
+if __name__ == "__main__":
+    from data.loader import iter_recipes
+
+    if len(sys.argv) != 3:
+        sys.exit("usage: python -m engine.sqlite_catalog RECIPES.jsonl OUT.db")
+
+    catalog = SQLiteCatalog(sys.argv[2])
+    try:
+        catalog.extend(iter_recipes(sys.argv[1]))
+    finally:
+        catalog.close()
@@ -0,0 +1,65 @@
+from bisect import bisect_right
+from collections import Counter
+from itertools import accumulate
+
+
+class CatalogStatistics:
+    """Value frequencies the query planner estimates selectivity from.
+
+    Gathered from the catalog's columns and indexes for one catalog version:
+    a cook_time histogram with cumulative counts, and how many recipes carry
+    each diet tag, ingredient and piece of equipment.
+    """
+
+    def __init__(self, catalog):
+        self.catalog = catalog
+        self.version = catalog.version
+        self.count = len(catalog)
+
+        histogram = Counter(catalog.cook_time)
+        self.cook_time_values = sorted(histogram)
+        self.cook_time_cumulative = list(
+            accumulate(histogram[value] for value in self.cook_time_values)
+        )
+
+        self.tag_frequency = _frequencies(catalog.diet_tag_index)
+        self.ingredient_frequency = _frequencies(catalog.ingredient_index)
+        self.equipment_frequency = _frequencies(catalog.equipment_index)
+
+    def cook_time_at_most(self, minutes):
+        position = bisect_right(self.cook_time_values, minutes)
+        return self.cook_time_cumulative[position - 1] if position else 0
+
+    def estimate(self, kind, value):
+        """Estimated number of recipes passing one normalized constraint"""
+        match kind:
+            case "max_cook_time":
+                return self.cook_time_at_most(value)
+
+            case "dietary_restrictions":
+                excluded = sum(self.tag_frequency.get(tag, 0) for tag in value)
+                return max(0, self.count - excluded)
+
+            case "ingredient_avoidances":
+                return max(0, self.count - self._ingredient_uses(value))
+
+            case "ingredient_preferences":
+                return min(self.count, self._ingredient_uses(value))
+
+            case "available_equipment":
+                excluded = sum(
+                    frequency
+                    for item, frequency in self.equipment_frequency.items()
+                    if item not in value
+                )
+                return max(0, self.count - excluded)
+
+        return self.count
+
+    def _ingredient_uses(self, names):
+        ids = self.catalog.resolve_ingredients(names)
+        return sum(self.ingredient_frequency.get(term_id, 0) for term_id in ids)
+
+
+def _frequencies(index):
+    return {key: len(ids) for key, ids in index.items()}
@@ -0,0 +1,49 @@
+from data.constants import INGREDIENT_TAXONOMY
+from engine.vocabulary import canonical_ingredient
+
+
+class Taxonomy:
+    """Ingredient hierarchy with every node's transitive closure precomputed.
+
+    `children` maps a parent name to its child names; a child may have more
+    than one parent. `closure[node]` holds the node and all its descendants,
+    in canonical form.
+    """
+
+    def __init__(self, children):
+        graph = {}
+        for parent, names in children.items():
+            graph.setdefault(canonical_ingredient(parent), set()).update(
+                map(canonical_ingredient, names)
+            )
+
+        self.closure = {}
+        for node in graph:
+            self._close(node, graph, ())
+
+    def __contains__(self, name):
+        return name in self.closure
+
+    def _close(self, node, graph, path):
+        closure = self.closure.get(node)
+        if closure is not None:
+            return closure
+        if node in path:
+            raise ValueError(f"Ingredient taxonomy has a cycle through {node!r}")
+
+        closure = {node}
+        for child in graph.get(node, ()):
+            closure |= self._close(child, graph, (*path, node))
+
+        closure = self.closure[node] = frozenset(closure)
+        return closure
+
+    def expand(self, names):
+        """Canonical `names` plus the descendants of any taxonomy nodes"""
+        expanded = set()
+        for name in map(canonical_ingredient, names):
+            expanded |= self.closure.get(name, {name})
+        return expanded
+
+
+DEFAULT_TAXONOMY = Taxonomy(INGREDIENT_TAXONOMY)
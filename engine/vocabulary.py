@@ -0,0 +1,191 @@
+import unicodedata
+from bisect import bisect_right
+
+from engine.cache import ResultCache
+from engine.matcher import AhoCorasick
+
+
+# Words whose trailing "s" is not a plural
+INVARIANT_WORDS = {
+    "asparagus",
+    "couscous",
+    "citrus",
+    "gras",
+    "hummus",
+    "molasses",
+    "swiss",
+}
+
+IRREGULAR_PLURALS = {
+    "leaves": "leaf",
+    "loaves": "loaf",
+    "halves": "half",
+}
+
+# Singulars ending in "ie" whose plural would otherwise become "-y"
+IE_WORDS = {
+    "brownie",
+    "calorie",
+    "cookie",
+    "hoagie",
+    "smoothie",
+    "veggie",
+}
+
+VOWELS = set("aeiou")
+
+# Entries that name an ingredient without being it: "lobster meat" is
+# lobster, not meat
+FALSE_MATCHES = {
+    "meat": {"coconut meat", "crab meat", "lobster meat"},
+}
+
+# Last words that make an entry that thing, whatever else it names: a "hot
+# dog bun" is a bun, not a hot dog
+HEAD_WORDS = {"bun"}
+
+# Distinct names whose matches a Vocabulary keeps resolved
+MATCH_CACHE_SIZE = 1024
+
+
+def _singular(word):
+    if word in INVARIANT_WORDS or len(word) <= 3:
+        return word
+    if word in IRREGULAR_PLURALS:
+        return IRREGULAR_PLURALS[word]
+    if word.endswith("ies") and word[:-1] not in IE_WORDS:
+        stem = word[:-3]
+        # "berries" -> "berry", but "pies" and "ties" only lose the "s"
+        if len(stem) > 2 and stem[-1] not in VOWELS:
+            return stem + "y"
+    if word.endswith(("oes", "ches", "shes", "sses", "xes")):
+        return word[:-2]
+    if word.endswith("s") and not word.endswith(("ss", "us", "is")):
+        return word[:-1]
+    return word
+
+
+def canonical_ingredient(name):
+    """Canonical form of an ingredient name.
+
+    Case, accents and runs of whitespace are folded and the last word is made
+    singular, so "Tomatoes", "tomato" and " tomato " are the same ingredient,
+    as are "Gruyère cheese" and "gruyere cheese".
+
+    >>> [canonical_ingredient(name) for name in ("Berries", "anchovies", "pies")]
+    ['berry', 'anchovy', 'pie']
+    >>> [canonical_ingredient(name) for name in ("Cookies", "brownies", "Tomatoes")]
+    ['cookie', 'brownie', 'tomato']
+    >>> canonical_ingredient("  Crème  Fraîche ")
+    'creme fraiche'
+    """
+    name = unicodedata.normalize("NFKD", name.lower())
+    words = "".join(c for c in name if not unicodedata.combining(c)).split()
+    if words:
+        words[-1] = _singular(words[-1])
+    return " ".join(words)
+
+
+def parse_ingredients(text):
+    """Canonical ingredients from comma separated user input, without blanks
+    or repeats."""
+    ingredients = map(canonical_ingredient, text.split(","))
+    return list(dict.fromkeys(name for name in ingredients if name))
+
+
+def _is_word_char(char):
+    return char.isalnum()
+
+
+def _false_match(name, term):
+    """Whether `term` holds `name` as whole words without being that ingredient"""
+    if term in FALSE_MATCHES.get(name, ()):
+        return True
+    head = term.rsplit(" ", 1)[-1]
+    return head in HEAD_WORDS and not name.endswith(head)
+
+
+class Vocabulary:
+    """Assigns each canonical ingredient a small integer id, in first-seen order."""
+
+    def __init__(self, cache_size=MATCH_CACHE_SIZE):
+        self.ids = {}
+        self.terms = []
+        self._corpus = None
+        self._starts = []
+        self._matches = ResultCache(cache_size)
+
+    def __len__(self):
+        return len(self.terms)
+
+    def __iter__(self):
+        return iter(self.terms)
+
+    def add(self, name):
+        term = canonical_ingredient(name)
+        term_id = self.ids.get(term)
+        if term_id is None:
+            term_id = self.ids[term] = len(self.terms)
+            self.terms.append(term)
+            self._corpus = None
+        return term_id
+
+    def match(self, names):
+        """Ids of every entry containing one of `names` as whole words.
+
+        "chicken" resolves to "chicken", "chicken breast" and "grilled chicken
+        breast" but not "chickpea", and "meat" does not resolve to "lobster
+        meat" (see FALSE_MATCHES and HEAD_WORDS). Names not yet seen are
+        resolved together by one automaton pass over the vocabulary, and the
+        most recently used resolutions are kept until the vocabulary grows.
+        """
+        names = {canonical_ingredient(name) for name in names}
+        names.discard("")
+
+        ids = set()
+        pending = []
+        for name in names:
+            matches = self._matches.get(name, len(self.terms))
+            if matches is None:
+                pending.append(name)
+            else:
+                ids |= matches
+        if pending:
+            for matches in self._resolve(pending).values():
+                ids |= matches
+        return frozenset(ids)
+
+    def corpus(self):
+        """All terms as one newline-separated text, and each term's offset.
+
+        The separator keeps a match from spanning two entries.
+        """
+        if self._corpus is None:
+            self._corpus = "\n".join(self.terms)
+            self._starts = []
+            start = 0
+            for term in self.terms:
+                self._starts.append(start)
+                start += len(term) + 1
+        return self._corpus, self._starts
+
+    def _resolve(self, names):
+        corpus, starts = self.corpus()
+        matches = {name: set() for name in names}
+        matcher = AhoCorasick(names)
+
+        for start, pattern_id in matcher.finditer(corpus):
+            name = names[pattern_id]
+            end = start + len(name)
+            if start > 0 and _is_word_char(corpus[start - 1]):
+                continue
+            if end < len(corpus) and _is_word_char(corpus[end]):
+                continue
+            term_id = bisect_right(starts, start) - 1
+            if not _false_match(name, self.terms[term_id]):
+                matches[name].add(term_id)
+
+        for name, ids in matches.items():
+            matches[name] = frozenset(ids)
+            self._matches.put(name, matches[name], len(self.terms))
+        return matches
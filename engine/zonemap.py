@@ -0,0 +1,148 @@
+from collections import Counter
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+from engine.index import bitmap_from_ids, iter_bits
+from engine.scoring import ScoreTable
+
+
+# Recipes per block; a multiple of 8 so every block is whole bytes of a bitmap
+BLOCK_SIZE = 1024
+
+
+class _BlockSummary:
+    """For each key of an inverted index, the blocks where some recipe has
+    it and the blocks where every recipe has it, as bitmaps over blocks."""
+
+    def __init__(self, index, block_lengths, block_size):
+        self.any = {}
+        self.every = {}
+
+        for key, ids in index.items():
+            if np is not None:
+                blocks, sizes = np.unique(
+                    np.asarray(ids, dtype=np.int64) // block_size, return_counts=True
+                )
+                counts = dict(zip(blocks.tolist(), sizes.tolist()))
+            else:
+                counts = Counter(recipe_id // block_size for recipe_id in ids)
+            self.any[key] = bitmap_from_ids(counts)
+            every = [block for block, n in counts.items() if n == block_lengths[block]]
+            if every:
+                self.every[key] = bitmap_from_ids(every)
+
+    def blocks_with_any(self, keys):
+        blocks = 0
+        for key in keys:
+            blocks |= self.any.get(key, 0)
+        return blocks
+
+    def blocks_with_every(self, keys):
+        blocks = 0
+        for key in keys:
+            blocks |= self.every.get(key, 0)
+        return blocks
+
+
+class ZoneMap:
+    """Block-level summaries of a catalog, for skipping blocks a query can't use.
+
+    Recipes are grouped into fixed-size blocks by id. Each block records its
+    shortest cook_time and the max of every ScoreTable column, and the diet
+    tags, ingredients and equipment are summarized per block. On a catalog
+    clustered by cook_time a time limit rules out most blocks by their minimum
+    alone.
+    """
+
+    def __init__(self, catalog, block_size=BLOCK_SIZE):
+        if block_size % 8:
+            raise ValueError("block_size must be a multiple of 8")
+
+        self.catalog = catalog
+        self.version = catalog.version
+        self.block_size = block_size
+        self.count = len(catalog)
+        self.blocks = -(-self.count // block_size)
+
+        self.cook_time_minimum = self._reduce(catalog.cook_time, "minimum", min)
+
+        # The healthy columns already fold in each health_focus range, so
+        # their block maxima tell which blocks can earn the focus bonus
+        self.score_maximum = {
+            key: self._reduce(catalog.score_table.column_for(key), "maximum", max)
+            for key in ScoreTable.KEYS
+        }
+
+        lengths = [
+            min(block_size, self.count - block * block_size)
+            for block in range(self.blocks)
+        ]
+        self.tags = _BlockSummary(catalog.diet_tag_index, lengths, block_size)
+        self.ingredients = _BlockSummary(catalog.ingredient_index, lengths, block_size)
+        self.equipment = _BlockSummary(catalog.equipment_index, lengths, block_size)
+
+    def _reduce(self, column, ufunc, function):
+        """`function` of every block of `column`, or the numpy `ufunc` of that
+        name when numpy is available"""
+        size = self.block_size
+        if np is not None and self.count:
+            values = np.asarray(column)[: self.count]
+            starts = np.arange(0, self.count, size)
+            return getattr(np, ufunc).reduceat(values, starts).tolist()
+
+        return [
+            function(column[start : start + size])
+            for start in range(0, self.count, size)
+        ]
+
+    def block_bitmap(self, plan):
+        """Bitmap of the blocks that may hold a positive-scoring match for `plan`"""
+        catalog = self.catalog
+        blocks = (1 << self.blocks) - 1
+
+        for kind, value in plan.constraints:
+            match kind:
+                case "max_cook_time":
+                    blocks &= bitmap_from_ids(
+                        block
+                        for block, low in enumerate(self.cook_time_minimum)
+                        if low <= value
+                    )
+
+                case "dietary_restrictions":
+                    blocks &= ~self.tags.blocks_with_every(value)
+
+                case "ingredient_avoidances":
+                    ids = catalog.resolve_ingredients(value)
+                    blocks &= ~self.ingredients.blocks_with_every(ids)
+
+                case "ingredient_preferences":
+                    ids = catalog.resolve_ingredients(value)
+                    blocks &= self.ingredients.blocks_with_any(ids)
+
+                case "available_equipment":
+                    blocks &= ~self.equipment.blocks_with_every(
+                        item for item in self.equipment.any if item not in value
+                    )
+
+        bonus = 1 if plan.cuisines else 0
+        maximum = self.score_maximum.get(plan.score_key)
+        if maximum is None:
+            return blocks if bonus else 0
+        return blocks & bitmap_from_ids(
+            block for block, high in enumerate(maximum) if high + bonus > 0
+        )
+
+    def recipe_bitmap(self, blocks):
+        """Bitmap of the recipes in the blocks set in `blocks`"""
+        if blocks == (1 << self.blocks) - 1:
+            return self.catalog.all_bitmap
+
+        width = self.block_size // 8
+        buf = bytearray(self.blocks * width)
+        for block in iter_bits(blocks):
+            buf[block * width : (block + 1) * width] = b"\xff" * width
+        return int.from_bytes(buf, "little") & self.catalog.all_bitmap
@@ -1,6 +1,6 @@
 import tkinter as tk
 
-from data.constants import RECIPES
+from data.loader import iter_recipes
 from engine.inferance import EnhancedRecipeRecommender
 
 
@@ -23,7 +23,7 @@ class RecipeRecommenderApp:
         self.root.title("Recipe Recommendation System")
         self.root.geometry("800x600")
 
-        self.recommender = EnhancedRecipeRecommender(RECIPES)
+        self.recommender = EnhancedRecipeRecommender(iter_recipes())
         self.user_prefs = {}
 
         self.container = tk.Frame(root)
@@ -54,6 +54,9 @@ class RecipeRecommenderApp:
     def show_frame(self, cont):
         frame = self.frames[cont]
 
+        if not isinstance(frame, ResultsPage):
+            self.frames[ResultsPage].cancel_results()
+
         if isinstance(frame, EquipmentPage):
             is_next = self.user_prefs["category"] in ["healthy"]
             frame.update_btn_txt(is_next)
@@ -1,6 +1,8 @@
 import tkinter as tk
 from tkinter import ttk
 
+from engine.vocabulary import parse_ingredients
+
 
 class AvoidIngredientsPage(tk.Frame):
     def __init__(self, parent, controller):
@@ -39,9 +41,8 @@ class AvoidIngredientsPage(tk.Frame):
         next_btn.pack(side="right", padx=10, ipady=6)
 
     def next_page(self):
-        avoid_text = self.avoid_entry.get().strip()
-        if avoid_text:
-            avoid_list = [ing.strip() for ing in avoid_text.split(",")]
+        avoid_list = parse_ingredients(self.avoid_entry.get())
+        if avoid_list:
             self.controller.update_prefs("ingredient_avoidances", avoid_list)
 
         next_frame = self.controller.get_next_frame(AvoidIngredientsPage)
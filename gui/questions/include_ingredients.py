@@ -1,6 +1,8 @@
 import tkinter as tk
 from tkinter import ttk
 
+from engine.vocabulary import parse_ingredients
+
 
 class IncludeIngredientsPage(tk.Frame):
     def __init__(self, parent, controller):
@@ -39,9 +41,8 @@ class IncludeIngredientsPage(tk.Frame):
         next_btn.pack(side="right", padx=10, ipady=6)
 
     def next_page(self):
-        include_text = self.include_entry.get().strip()
-        if include_text:
-            include_list = [ing.strip() for ing in include_text.split(",")]
+        include_list = parse_ingredients(self.include_entry.get())
+        if include_list:
             self.controller.update_prefs("ingredient_preferences", include_list)
 
         next_frame = self.controller.get_next_frame(IncludeIngredientsPage)
@@ -1,7 +1,11 @@
 import tkinter as tk
-from tkinter import ttk
+from tkinter import ttk, messagebox
 
 from gui.welcome import WelcomePage
+from gui.worker import RecommendationWorker
+
+
+POLL_INTERVAL_MS = 16
 
 
 class ResultsPage(tk.Frame):
@@ -9,6 +13,8 @@ class ResultsPage(tk.Frame):
         tk.Frame.__init__(self, parent)
         self.controller = controller
         self.prefs = {}
+        self.worker = RecommendationWorker(controller.get_recommender())
+        self._poll_job = None
 
         style = ttk.Style()
         style.configure(
@@ -133,13 +139,50 @@ class ResultsPage(tk.Frame):
 
         self.__create_detail_row(card, "Ingredients:", ", ".join(recipe["ingredients"]))
 
+    def __clear_results(self):
+        for child in self.scrollable_frame.winfo_children():
+            child.destroy()
+
     def display_results(self):
-        category = self.prefs.get("category")
-        recommendations = self.get_recommendations()
+        self.cancel_results()
+        self.__clear_results()
 
-        if not category:
+        if not self.prefs.get("category"):
             return None
 
+        ttk.Label(
+            self.scrollable_frame,
+            text="Finding your recipes...",
+            style="Title.TLabel",
+        ).pack(pady=20)
+
+        self.worker.submit(self.prefs, k=5)
+        self._poll_job = self.after(POLL_INTERVAL_MS, self.__poll_results)
+
+    def __poll_results(self):
+        done, recommendations = self.worker.poll()
+        if not done:
+            self._poll_job = self.after(POLL_INTERVAL_MS, self.__poll_results)
+            return
+
+        self._poll_job = None
+        self.__clear_results()
+
+        if isinstance(recommendations, Exception):
+            messagebox.showerror("Recommendation Failed", str(recommendations))
+            return
+
+        self.__show_results(recommendations)
+
+    def cancel_results(self):
+        self.worker.cancel()
+        if self._poll_job is not None:
+            self.after_cancel(self._poll_job)
+            self._poll_job = None
+
+    def __show_results(self, recommendations):
+        category = self.prefs.get("category")
+
         if not recommendations:
             no_results = ttk.Label(
                 self.scrollable_frame,
@@ -174,11 +217,3 @@ class ResultsPage(tk.Frame):
 
     def update_prefs(self, prefs):
         self.prefs = prefs
-
-    def get_recommendations(self):
-        recommender = self.controller.get_recommender()
-        recommendations = [r for r in recommender.recommend(self.prefs) if r[1] > 0]
-
-        top_recipes = sorted(recommendations, key=lambda x: x[1], reverse=True)[:5]
-
-        return top_recipes
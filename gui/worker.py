@@ -0,0 +1,61 @@
+import queue
+import threading
+
+
+class RecommendationWorker:
+    """Runs recommend() on a background thread so the Tk mainloop never blocks.
+
+    Requests are handled one at a time by a single daemon thread, so the engine
+    is never used concurrently. Finished results are handed back through a
+    queue that the Tk side drains with `poll()` from a `root.after` callback.
+    """
+
+    def __init__(self, recommender):
+        self.recommender = recommender
+        self.requests = queue.Queue()
+        self.results = queue.Queue()
+        self._current = None
+
+        thread = threading.Thread(target=self._run, daemon=True)
+        thread.start()
+
+    def submit(self, preferences, k=None):
+        self.cancel()
+        self._current = (dict(preferences), k, threading.Event())
+        self.requests.put(self._current)
+
+    def cancel(self):
+        if self._current is not None:
+            self._current[2].set()
+            self._current = None
+
+    def poll(self):
+        """Return `(True, result)` once the current request is done.
+
+        Returns `(False, None)` while it is still running. `result` is the
+        raised exception if recommend() failed.
+        """
+        while True:
+            try:
+                request, result = self.results.get_nowait()
+            except queue.Empty:
+                return False, None
+
+            if request is self._current:
+                self._current = None
+                return True, result
+
+    def _run(self):
+        while True:
+            request = self.requests.get()
+            preferences, k, cancelled = request
+            if cancelled.is_set():
+                continue
+
+            try:
+                result = self.recommender.recommend(preferences, k=k)
+            except Exception as exc:
+                result = exc
+
+            if not cancelled.is_set():
+                self.results.put((request, result))
@@ -0,0 +1,301 @@
+import argparse
+import asyncio
+import json
+import logging
+import os
+from concurrent.futures import ProcessPoolExecutor
+from urllib.parse import parse_qs, urlsplit
+
+from data.loader import CATALOG_PATH, iter_recipes
+from engine.binary_catalog import BINARY_SUFFIX, MappedCatalog
+from engine.inferance import EnhancedRecipeRecommender
+from engine.sqlite_catalog import SQLITE_SUFFIXES, SQLiteRecommender
+
+
+# Keys the wizard pages store through RecipeRecommenderApp.update_prefs
+PREFERENCE_KEYS = {
+    "category": str,
+    "max_cook_time": int,
+    "cuisine_pref": list,
+    "dietary_restrictions": list,
+    "ingredient_avoidances": list,
+    "ingredient_preferences": list,
+    "available_equipment": list,
+    "health_focus": str,
+}
+
+DEFAULT_LIMIT = 5
+MAX_LIMIT = 100
+MAX_BODY_SIZE = 64 * 1024
+MAX_HEADER_SIZE = 16 * 1024
+
+REASONS = {
+    200: "OK",
+    400: "Bad Request",
+    404: "Not Found",
+    405: "Method Not Allowed",
+    413: "Payload Too Large",
+    500: "Internal Server Error",
+    501: "Not Implemented",
+}
+
+logger = logging.getLogger(__name__)
+
+
+class BadRequest(Exception):
+    def __init__(self, message, status=400):
+        super().__init__(message)
+        self.status = status
+
+
+# Per-process recommender when scoring runs in a worker pool
+_recommender = None
+
+
+def build_recommender(catalog_path):
+    # Binary catalogs are memory-mapped, so worker processes share its pages
+    if str(catalog_path).endswith(BINARY_SUFFIX):
+        return EnhancedRecipeRecommender(MappedCatalog(catalog_path))
+    # SQLite catalogs stay on disk; each process opens its own connection
+    if str(catalog_path).endswith(SQLITE_SUFFIXES):
+        return SQLiteRecommender(catalog_path)
+    return EnhancedRecipeRecommender(iter_recipes(catalog_path))
+
+
+def _init_worker(catalog_path):
+    global _recommender
+    _recommender = build_recommender(catalog_path)
+
+
+def _recommend(preferences, k):
+    return [
+        {"recipe": recipe.to_dict(), "score": score}
+        for recipe, score in _recommender.recommend(preferences, k=k)
+    ]
+
+
+def parse_preferences(body):
+    try:
+        payload = json.loads(body or b"{}")
+    except ValueError:
+        raise BadRequest("Request body must be JSON")
+
+    if not isinstance(payload, dict):
+        raise BadRequest("Request body must be a JSON object")
+
+    preferences = {}
+    for key, expected in PREFERENCE_KEYS.items():
+        if key not in payload:
+            continue
+
+        value = payload[key]
+        if expected is int and (isinstance(value, bool) or not isinstance(value, int)):
+            raise BadRequest(f"'{key}' must be an integer")
+        if expected is str and not isinstance(value, str):
+            raise BadRequest(f"'{key}' must be a string")
+        if expected is list and not (
+            isinstance(value, list) and all(isinstance(v, str) for v in value)
+        ):
+            raise BadRequest(f"'{key}' must be a list of strings")
+
+        preferences[key] = value
+
+    return preferences
+
+
+def parse_limit(query):
+    values = parse_qs(query).get("k")
+    if not values:
+        return DEFAULT_LIMIT
+
+    try:
+        limit = int(values[-1])
+    except ValueError:
+        raise BadRequest("'k' must be an integer")
+
+    if not 1 <= limit <= MAX_LIMIT:
+        raise BadRequest(f"'k' must be between 1 and {MAX_LIMIT}")
+    return limit
+
+
+class RecommendationServer:
+    """Serve EnhancedRecipeRecommender over HTTP/1.1 with keep-alive.
+
+    `POST /recommend?k=5` takes the wizard's preferences as a JSON object and
+    returns the top-k recipes; `GET /health` is a liveness check. With
+    `workers` > 0 scoring runs in a process pool, each worker holding its own
+    recommender; with 0 it runs inline on the event loop.
+    """
+
+    def __init__(self, catalog_path=CATALOG_PATH, workers=None):
+        self.workers = os.cpu_count() if workers is None else workers
+        self.executor = None
+        self.recommender = None
+
+        if self.workers > 0:
+            self.executor = ProcessPoolExecutor(
+                max_workers=self.workers,
+                initializer=_init_worker,
+                initargs=(catalog_path,),
+            )
+        else:
+            self.recommender = build_recommender(catalog_path)
+
+    async def start(self, host="127.0.0.1", port=8000):
+        return await asyncio.start_server(
+            self.handle_connection, host, port, limit=MAX_HEADER_SIZE
+        )
+
+    def close(self):
+        if self.executor is not None:
+            self.executor.shutdown()
+        if isinstance(self.recommender, SQLiteRecommender):
+            self.recommender.close()
+
+    async def recommend(self, preferences, k):
+        if self.executor is None:
+            return [
+                {"recipe": recipe.to_dict(), "score": score}
+                for recipe, score in self.recommender.recommend(preferences, k=k)
+            ]
+
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self.executor, _recommend, preferences, k)
+
+    async def handle_connection(self, reader, writer):
+        try:
+            while True:
+                request = await self.read_request(reader)
+                if request is None:
+                    break
+
+                method, target, version, headers, body = request
+                status, payload = await self.dispatch(method, target, body)
+
+                connection = headers.get("connection", "").lower()
+                keep_alive = (
+                    connection == "keep-alive"
+                    if version == "HTTP/1.0"
+                    else connection != "close"
+                )
+                self.write_response(writer, status, payload, keep_alive)
+                await writer.drain()
+
+                if not keep_alive:
+                    break
+        except BadRequest as exc:
+            self.write_response(writer, exc.status, {"error": str(exc)}, False)
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            writer.close()
+
+    async def read_request(self, reader):
+        try:
+            head = await reader.readuntil(b"\r\n\r\n")
+        except asyncio.IncompleteReadError as exc:
+            if exc.partial:
+                raise
+            return None
+        except asyncio.LimitOverrunError:
+            raise BadRequest("Request headers too large", 413)
+
+        lines = head.decode("latin-1").split("\r\n")
+        try:
+            method, target, version = lines[0].split(" ")
+        except ValueError:
+            raise BadRequest("Malformed request line")
+
+        headers = {}
+        for line in lines[1:]:
+            if not line:
+                continue
+            name, _, value = line.partition(":")
+            headers[name.strip().lower()] = value.strip()
+
+        # Only Content-Length bodies are read; a chunked body would otherwise be
+        # parsed as the next request
+        if "transfer-encoding" in headers:
+            raise BadRequest("Transfer-Encoding is not supported", 501)
+
+        try:
+            length = int(headers.get("content-length", 0))
+        except ValueError:
+            raise BadRequest("Invalid Content-Length")
+        if length < 0:
+            raise BadRequest("Invalid Content-Length")
+        if length > MAX_BODY_SIZE:
+            raise BadRequest("Request body too large", 413)
+
+        body = await reader.readexactly(length) if length else b""
+        return method, target, version, headers, body
+
+    async def dispatch(self, method, target, body):
+        url = urlsplit(target)
+
+        try:
+            if url.path == "/health":
+                if method != "GET":
+                    return 405, {"error": "Use GET"}
+                return 200, {"status": "ok"}
+
+            if url.path == "/recommend":
+                if method != "POST":
+                    return 405, {"error": "Use POST"}
+
+                preferences = parse_preferences(body)
+                k = parse_limit(url.query)
+                return 200, {"results": await self.recommend(preferences, k)}
+        except BadRequest as exc:
+            return exc.status, {"error": str(exc)}
+        except Exception:
+            logger.exception("Failed to handle %s %s", method, url.path)
+            return 500, {"error": "Internal server error"}
+
+        return 404, {"error": f"No route for {url.path}"}
+
+    def write_response(self, writer, status, payload, keep_alive):
+        body = json.dumps(payload).encode()
+        head = (
+            f"HTTP/1.1 {status} {REASONS[status]}\r\n"
+            "Content-Type: application/json\r\n"
+            f"Content-Length: {len(body)}\r\n"
+            f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n"
+            "\r\n"
+        )
+        writer.write(head.encode() + body)
+
+
+async def serve(host, port, workers, catalog_path):
+    server = RecommendationServer(catalog_path, workers=workers)
+    try:
+        async with await server.start(host, port) as listener:
+            print(f"Serving recommendations on http://{host}:{port}")
+            await listener.serve_forever()
+    finally:
+        server.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Recipe recommendation HTTP API")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument(
+        "--catalog",
+        default=CATALOG_PATH,
+        help=f"recipes JSONL file, a binary {BINARY_SUFFIX} catalog, or a SQLite"
+        f" catalog ({', '.join(SQLITE_SUFFIXES)})",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="scoring processes (default: CPU count, 0 scores on the event loop)",
+    )
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.INFO)
+
+    try:
+        asyncio.run(serve(args.host, args.port, args.workers, args.catalog))
+    except KeyboardInterrupt:
+        pass
@@ -0,0 +1,76 @@
+import random
+
+from data.constants import INGREDIENT_TAXONOMY
+from data.loader import load_recipes
+
+
+BUNDLED = [recipe.to_dict() for recipe in load_recipes()]
+
+CATEGORIES = ("high_protein", "quick_meal", "healthy", "budget", "meal_prep")
+HEALTH_FOCUSES = ("balanced", "low_carb", "low_fat", "unknown")
+CUISINES = sorted({recipe["cuisine"] for recipe in BUNDLED})
+DIET_TAGS = sorted({tag for recipe in BUNDLED for tag in recipe["diet_tags"]})
+INGREDIENTS = sorted({name for recipe in BUNDLED for name in recipe["ingredients"]})
+EQUIPMENT = sorted(
+    {item for recipe in BUNDLED for item in recipe.get("equipment_needed", ())}
+)
+
+
+def _number(rng, low, high):
+    """Mostly whole numbers, sometimes halves, like hand-entered catalogs"""
+    value = rng.randint(low, high)
+    return value + 0.5 if rng.random() < 0.2 else value
+
+
+def synthetic_recipes(count, seed=0):
+    """`count` recipes varied from the bundled catalog, with unique names"""
+    rng = random.Random(seed)
+    recipes = []
+    for i in range(count):
+        base = rng.choice(BUNDLED)
+        recipe = {
+            "name": f"{base['name']} {i}",
+            "ingredients": rng.sample(INGREDIENTS, rng.randint(1, 9)),
+            "cuisine": rng.choice(CUISINES),
+            "diet_tags": rng.sample(DIET_TAGS, rng.randint(0, 4)),
+            "cook_time": _number(rng, 1, 180),
+            "nutrition": {
+                "calories": _number(rng, 50, 1200),
+                "protein": _number(rng, 0, 70),
+                "carbs": _number(rng, 0, 120),
+                "fat": _number(rng, 0, 60),
+            },
+            "cost_rating": rng.randint(1, 5),
+            "meal_prep_friendly": rng.random() < 0.5,
+            "equipment_needed": rng.sample(EQUIPMENT, rng.randint(0, 3)),
+            "freezer_friendly": rng.random() < 0.3,
+            "servings": rng.randint(1, 8),
+        }
+        if rng.random() < 0.8:
+            recipe["health_score"] = _number(rng, 0, 10)
+        recipes.append(recipe)
+    return recipes
+
+
+def random_preferences(rng, filters=True):
+    """A preferences dict like the wizard builds, optionally with filters"""
+    preferences = {"category": rng.choice(CATEGORIES)}
+    if rng.random() < 0.5:
+        preferences["health_focus"] = rng.choice(HEALTH_FOCUSES)
+    if rng.random() < 0.5:
+        preferences["cuisine_pref"] = rng.sample(CUISINES, rng.randint(1, 2))
+    if not filters:
+        return preferences
+
+    if rng.random() < 0.4:
+        preferences["max_cook_time"] = rng.choice((10, 20, 30, 60, 120))
+    if rng.random() < 0.3:
+        preferences["dietary_restrictions"] = rng.sample(DIET_TAGS, 2)
+    if rng.random() < 0.3:
+        names = [*INGREDIENT_TAXONOMY, *INGREDIENTS]
+        preferences["ingredient_avoidances"] = rng.sample(names, 2)
+    if rng.random() < 0.2:
+        preferences["ingredient_preferences"] = rng.sample(INGREDIENTS, 5)
+    if rng.random() < 0.2:
+        preferences["available_equipment"] = rng.sample(EQUIPMENT, 40)
+    return preferences
@@ -0,0 +1,58 @@
+import random
+
+import pytest
+
+from engine.binary_catalog import MappedCatalog, write_binary_catalog
+from engine.inferance import EnhancedRecipeRecommender
+from engine.sharded import ShardedRecommender
+from engine.sqlite_catalog import SQLiteRecommender
+
+from conftest import random_preferences, synthetic_recipes
+
+
+RECIPES = synthetic_recipes(2000, seed=4)
+
+
+@pytest.fixture(scope="module")
+def expected():
+    return EnhancedRecipeRecommender(RECIPES)
+
+
+def _results(recommended):
+    return [(recipe["name"], score) for recipe, score in recommended]
+
+
+def _assert_same(expected, backend, profiles=150, seed=5):
+    rng = random.Random(seed)
+    for _ in range(profiles):
+        preferences = random_preferences(rng)
+        k = rng.choice((None, 1, 10))
+        assert _results(backend.recommend(preferences, k)) == _results(
+            expected.recommend(preferences, k)
+        ), preferences
+
+
+def test_mapped_catalog_matches_in_memory(expected, tmp_path):
+    path = tmp_path / "recipes.rcat"
+    write_binary_catalog(RECIPES, path)
+    _assert_same(expected, EnhancedRecipeRecommender(MappedCatalog(path)))
+
+
+def test_sqlite_matches_in_memory(expected, tmp_path):
+    with SQLiteRecommender(tmp_path / "recipes.db") as recommender:
+        recommender.catalog.extend(RECIPES)
+        _assert_same(expected, recommender)
+
+
+def test_sharded_matches_in_memory(expected):
+    with ShardedRecommender(RECIPES, shards=3) as recommender:
+        _assert_same(expected, recommender, profiles=50)
+
+
+def test_recommend_many_matches_recommend(expected):
+    rng = random.Random(6)
+    profiles = [random_preferences(rng) for _ in range(100)]
+    for k in (None, 10):
+        assert list(map(_results, expected.recommend_many(profiles, k))) == [
+            _results(expected.recommend(preferences, k)) for preferences in profiles
+        ]
@@ -0,0 +1,16 @@
+import json
+
+from engine.recipe import Recipe
+
+from conftest import BUNDLED
+
+
+def test_recipe_reads_like_its_dict():
+    for recipe in BUNDLED:
+        record = Recipe.from_dict(recipe)
+        assert list(record) == list(recipe)
+        assert len(record) == len(recipe)
+        assert record.to_dict() == recipe
+        assert json.loads(json.dumps(record, default=dict)) == recipe
+        assert ("health_score" in record) == ("health_score" in recipe)
+        assert record.get("health_score") == recipe.get("health_score")
@@ -0,0 +1,194 @@
+import random
+
+import pytest
+
+from engine import scoring
+from engine.catalog import RecipeCatalog
+from engine.inferance import EnhancedRecipeRecommender
+
+from conftest import BUNDLED, random_preferences, synthetic_recipes
+
+
+# The per-recipe ladders the recommender scored with before the catalog was
+# columnar, kept verbatim as the reference both scoring paths must match
+
+
+def _score_high_protein(recipe, preferences):
+    score = 0
+    protein = recipe["nutrition"]["protein"]
+    calories = recipe["nutrition"]["calories"]
+    protein_ratio = protein / calories
+
+    if protein >= 45:
+        score += 5
+    elif protein >= 35:
+        score += 4
+    elif protein >= 25:
+        score += 3
+
+    if protein_ratio >= 0.2:
+        score += 3
+    elif protein_ratio >= 0.1:
+        score += 2
+    elif protein_ratio >= 0.75:
+        score += 1
+
+    if protein >= 35 and protein_ratio >= 0.1:
+        score += 2
+
+    return score
+
+
+def _score_quick_meal(recipe, preferences):
+    score = 0
+
+    if recipe["cook_time"] <= 10:
+        score += 6
+    elif recipe["cook_time"] <= 15:
+        score += 5
+    elif recipe["cook_time"] <= 20:
+        score += 4
+
+    if len(recipe["ingredients"]) <= 3:
+        score += 3.5
+    elif len(recipe["ingredients"]) <= 5:
+        score += 2.5
+
+    return score
+
+
+def _score_healthy(recipe, preferences):
+    score = 0
+    health_focus = preferences.get("health_focus", "balanced")
+    nutrition = recipe["nutrition"]
+
+    if "health_score" in recipe:
+        score += min(3, recipe["health_score"])
+
+    if health_focus == "balanced":
+        if (
+            20 <= nutrition["protein"] <= 40
+            and 30 <= nutrition["carbs"] <= 50
+            and 10 <= nutrition["fat"] <= 20
+        ):
+            score += 4
+    elif health_focus == "low_carb" and nutrition["carbs"] <= 20:
+        score += 4
+    elif health_focus == "low_fat" and nutrition["fat"] <= 10:
+        score += 4
+
+    whole_foods = {"tomatoes", "carrots", "avocado", "broccoli", "bell peppers"}
+    matches = sum(
+        1
+        for ing in recipe["ingredients"]
+        if any(wf in ing.lower() for wf in whole_foods)
+    )
+    score += min(3, matches)
+
+    return score
+
+
+def _score_budget(recipe, preferences):
+    score = 0
+
+    if recipe.get("cost_rating", 3) == 1:
+        score += 5
+    elif recipe["cost_rating"] == 2:
+        score += 3
+
+    common_ingredients = {"rice", "beans", "eggs", "potatoes", "pasta"}
+    matches = sum(
+        1
+        for ing in recipe["ingredients"]
+        if any(ci in ing.lower() for ci in common_ingredients)
+    )
+    score += min(3, matches)
+
+    if len(recipe["ingredients"]) <= 5:
+        score += 2
+
+    return score
+
+
+def _score_meal_prep(recipe, preferences):
+    score = 0
+
+    if recipe.get("meal_prep_friendly", False):
+        score += 4
+
+    if recipe["cook_time"] >= 30:
+        score += 2
+
+    if recipe.get("freezer_friendly", False):
+        score += 2
+
+    if recipe.get("servings", 0) >= 4:
+        score += 2
+
+    return score
+
+
+LADDERS = {
+    "high_protein": _score_high_protein,
+    "quick_meal": _score_quick_meal,
+    "healthy": _score_healthy,
+    "budget": _score_budget,
+    "meal_prep": _score_meal_prep,
+}
+
+
+def reference_score(recipe, preferences):
+    category = preferences.get("category", "high_protein")
+    score = LADDERS[category](recipe, preferences)
+    if recipe["cuisine"] in preferences.get("cuisine_pref", ()):
+        score += 1
+    return score
+
+
+def reference_recommend(recipes, preferences):
+    recommended = []
+    for recipe in recipes:
+        score = reference_score(recipe, preferences)
+        if score > 0:
+            recommended.append((recipe["name"], score))
+    recommended.sort(key=lambda x: x[1], reverse=True)
+    return recommended
+
+
+@pytest.fixture(params=["numpy", "python"])
+def scoring_path(request, monkeypatch):
+    if request.param == "numpy":
+        if scoring.np is None:
+            pytest.skip("NumPy is not installed")
+    else:
+        monkeypatch.setattr(scoring, "np", None)
+    return request.param
+
+
+@pytest.mark.parametrize("recipes", [BUNDLED, synthetic_recipes(3000)], ids=len)
+def test_category_scores_match_reference(scoring_path, recipes):
+    catalog = RecipeCatalog(recipes)
+    ids = range(len(catalog))
+    rng = random.Random(1)
+
+    for _ in range(200):
+        preferences = random_preferences(rng, filters=False)
+        category = preferences["category"]
+        expected = [reference_score(recipe, preferences) for recipe in recipes]
+        assert scoring.score_recipes(catalog, category, preferences, ids) == expected
+
+        expected = [LADDERS[category](recipe, preferences) for recipe in recipes]
+        assert scoring.category_scores(catalog, category, preferences, ids) == expected
+
+
+def test_recommend_matches_reference(scoring_path):
+    recipes = synthetic_recipes(2000, seed=2)
+    recommender = EnhancedRecipeRecommender(recipes)
+    rng = random.Random(3)
+
+    for _ in range(100):
+        preferences = random_preferences(rng, filters=False)
+        recommended = recommender.recommend(preferences)
+        assert [(recipe["name"], score) for recipe, score in recommended] == (
+            reference_recommend(recipes, preferences)
+        )